@@ -45,4 +45,5 @@ setuptools.setup(
     package_dir = {"": "src"},
     packages = setuptools.find_packages(where="src", exclude=["tests*", "timings*"]),
     python_requires = ">=3.7",
+    extras_require = {"numpy": ["numpy"]},
 )
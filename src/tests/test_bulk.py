@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated.bulk module
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+from array import array
+import unittest
+
+import numpy as np
+
+import undated.fmts as udf
+import undated.utils as udu
+
+from undated import bulk as udb
+
+# -----------------------------------------------
+
+SDATES = ['31-01-2022', '15-05-2022', '31-06-2022', '31-01-2022', '29-02-2022', '15-05-2022'] * 7
+
+# -----------------------------------------------
+
+
+class TestBulk(unittest.TestCase):
+    """ Tests the bulk module """
+
+    def test_factorize(self):
+        """ Testing the uniques, codes and compression ratio """
+
+        column = udb.factorize(SDATES)
+        self.assertEqual(column.uniques, ['31-01-2022', '15-05-2022', '31-06-2022', '29-02-2022'])
+        self.assertEqual(column.codes[:6], array('i', [0, 1, 2, 0, 3, 1]))
+        self.assertEqual((len(column), column.compression), (42, 10.5))
+        self.assertEqual(column.broadcast(), SDATES)
+        self.assertEqual(udb.factorize(iter([])).compression, 1.0)
+
+    def test_pipeline(self):
+        """ Testing the parse, add months and quarter pipeline, against each row """
+
+        expected = []
+        for iymd in udf.as_iymd_many(SDATES, 'd-m-Y'):
+            expected.append(None if iymd is None else udu.quarter(udu.add_months(iymd, 1)))
+
+        column = udb.factorize(SDATES).parse('d-m-Y').apply(udu.add_months, 1)
+        self.assertEqual(column.apply(udu.quarter).broadcast(), expected)
+        self.assertEqual(
+            column.broadcast(0, 'i'),
+            array('i', [0 if i is None else udu.add_months(i, 1)
+                        for i in udf.as_iymd_many(SDATES, 'd-m-Y')])
+        )
+
+    def test_numpy(self):
+        """ Testing NumPy arrays, keeping the shape """
+
+        iymds = np.array([[2022_01_31, 2022_05_15], [2022_01_31, 2021_12_31]])
+        column = udb.factorize(iymds)
+        self.assertEqual(column.uniques, [2021_12_31, 2022_01_31, 2022_05_15])
+        self.assertEqual((len(column), column.compression), (4, 4 / 3))
+        result = column.apply(udu.add_months, 1).broadcast()
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(result.tolist(), [[2022_02_28, 2022_06_15], [2022_02_28, 2022_01_31]])
+
+        result = udb.factorize(np.array(SDATES)).parse('d-m-Y').broadcast(invalid=0)
+        self.assertEqual(result.dtype.kind, 'i')
+        self.assertEqual(result.tolist(), [i or 0 for i in udf.as_iymd_many(SDATES, 'd-m-Y')])
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End.
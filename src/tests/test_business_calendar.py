@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated module.
+Benchmarking the BusinessCalendar against stepping one day at a time.
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import unittest
+
+import undated as ud
+import undated._core as udc
+import undated.utils as udu
+
+# -----------------------------------------------
+
+HOLIDAYS = (
+    2021_12_27, 2021_12_28, 2022_01_03, 2022_04_15, 2022_04_18, 2022_05_02, 2022_06_02,
+    2022_06_03, 2022_08_29, 2022_09_19, 2022_12_25, 2022_12_26, 2022_12_27, 2023_01_02,
+)
+
+CALENDAR = ud.BusinessCalendar(HOLIDAYS)
+
+FIRST_EPOCH = udc.epoch_from_parts(2021, 12, 1)
+LAST_EPOCH = udc.epoch_from_parts(2023, 1, 31)
+
+# -----------------------------------------------
+
+
+def is_business_day(epoch):
+    """ Brute force business day check """
+    return (
+        0 < udc.day_of_week(epoch) < 6
+        and udc.glue_parts(*udc.epoch_to_parts(epoch)) not in HOLIDAYS
+    )
+
+
+# -----------------------------------------------
+
+
+class TestBusinessCalendar(unittest.TestCase):
+    """ Tests the BusinessCalendar class """
+
+    def test_add(self):
+        """ Tests adding business days, stepping one day at a time """
+
+        for epoch in range(FIRST_EPOCH, LAST_EPOCH):
+            if not is_business_day(epoch):
+                continue
+            expected = epoch
+            for days in range(1, 25):
+                expected += 1
+                while not is_business_day(expected):
+                    expected += 1
+                self.assertEqual(CALENDAR.add(epoch, days), expected, f'{epoch} + {days}')
+                self.assertEqual(CALENDAR.add(expected, -days), epoch, f'{expected} - {days}')
+
+    # ---
+
+    def test_count(self):
+        """ Tests counting business days, stepping one day at a time """
+
+        for from_epoch in range(FIRST_EPOCH, LAST_EPOCH, 3):
+            expected = 0
+            for to_epoch in range(from_epoch + 1, from_epoch + 40):
+                expected += 1 if is_business_day(to_epoch) else 0
+                self.assertEqual(CALENDAR.count(from_epoch, to_epoch), expected)
+                self.assertEqual(CALENDAR.count(to_epoch, from_epoch, True), -expected - 1)
+
+    # ---
+
+    def test_is_business_day(self):
+        """ Tests business days are weekdays other than holidays """
+
+        for epoch in range(FIRST_EPOCH, LAST_EPOCH):
+            self.assertEqual(CALENDAR.is_business_day(epoch), is_business_day(epoch))
+
+    # ---
+
+    def test_no_holidays(self):
+        """ Tests a calendar without holidays matches the weekday functions """
+
+        calendar = ud.BusinessCalendar()
+        iymd = 2022_01_01
+        for _ in range(400):
+            for weekdays in [-11, -5, -1, 0, 1, 4, 5, 6, 400]:
+                self.assertEqual(
+                    udu.add_weekdays(iymd, weekdays, calendar), udu.add_weekdays(iymd, weekdays)
+                )
+            for to_iymd in [2021_02_13, 2022_01_01, 2023_07_25]:
+                self.assertEqual(
+                    udu.weekdays_between(iymd, to_iymd, calendar=calendar),
+                    udu.weekdays_between(iymd, to_iymd)
+                )
+            iymd = udu.add_days(iymd, 1)
+
+        # From weekends, adding from the friday before and subtracting from the monday after
+        for iymd, weekdays, expected in ((2024_03_16, 1, 2024_03_18), (2024_03_17, -1, 2024_03_15),
+                                         (2024_03_16, 0, 2024_03_18), (2024_03_17, 5, 2024_03_22)):
+            ymd = ud.YMD(iymd)
+            self.assertEqual(udu.add_weekdays(iymd, weekdays), expected)
+            self.assertEqual(ymd.add_weekdays(weekdays), expected)
+            self.assertEqual(ymd.add_weekdays(weekdays, calendar), expected)
+            self.assertEqual(list(ud.YMDArray([iymd]).add_weekdays(weekdays)), [expected])
+            self.assertEqual(list(ud.YMDArray([iymd]).add_weekdays(weekdays, calendar)), [expected])
+
+    # ---
+
+    def test_roll(self):
+        """ Tests the roll conventions """
+
+        self.assertEqual(udu.roll_weekday(2022_12_24, calendar=CALENDAR), 2022_12_28)
+        self.assertEqual(udu.roll_weekday(2022_12_27, ud.PRECEDING, CALENDAR), 2022_12_23)
+        self.assertEqual(udu.roll_weekday(2022_04_30, ud.FOLLOWING), 2022_05_02)
+        self.assertEqual(udu.roll_weekday(2022_04_30, ud.FOLLOWING, CALENDAR), 2022_05_03)
+        self.assertEqual(udu.roll_weekday(2022_04_30, ud.MODIFIED_FOLLOWING), 2022_04_29)
+        self.assertEqual(udu.roll_weekday(2022_05_01, ud.MODIFIED_PRECEDING), 2022_05_02)
+        self.assertEqual(udu.roll_weekday(2022_05_04, ud.PRECEDING, CALENDAR), 2022_05_04)
+        self.assertEqual(ud.YMD(2023_01_01).roll_weekday(calendar=CALENDAR), 2023_01_03)
+
+    # ---
+
+    def test_ymd(self):
+        """ Tests the YMD functions accept the calendar """
+
+        ymd = ud.YMD(2022_12_23)
+        self.assertEqual(ymd.add_weekdays(1, CALENDAR), 2022_12_28)
+        self.assertEqual(ud.weekdays_between(ymd, ud.YMD(2023_01_03), calendar=CALENDAR), 4)
+        self.assertFalse(ud.YMD(2022_12_26).is_weekday(CALENDAR))
+        self.assertTrue(ud.YMD(2022_12_26).is_weekday())
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End
@@ -0,0 +1,120 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated.cache module
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import unittest
+
+import undated as ud
+import undated._core as udc
+import undated.cache as udch
+import undated.tables as udtb
+import undated.utils as udu
+
+# -----------------------------------------------
+
+uncached_add_days = udu.add_days
+uncached_epoch_to_parts = udc.epoch_to_parts
+
+# -----------------------------------------------
+
+
+class TestCache(unittest.TestCase):
+    """ Tests the cache """
+
+    def tearDown(self):
+        """ Reverts to the uncached functions """
+        udch.disable()
+        udtb.disable()
+
+    # ---
+
+    def test_enable_disable(self):
+        """ Tests the functions are swapped and restored """
+
+        self.assertFalse(udch.is_enabled())
+        udch.enable()
+        self.assertTrue(udch.is_enabled())
+        self.assertIsNot(udu.add_days, uncached_add_days)
+        udch.disable()
+        self.assertFalse(udch.is_enabled())
+        self.assertIs(udu.add_days, uncached_add_days)
+        self.assertIs(udc.epoch_to_parts, uncached_epoch_to_parts)
+        self.assertEqual(udch.cache_info(), {})
+
+    # ---
+
+    def test_statistics(self):
+        """ Tests the hits and misses are counted, and eviction """
+
+        udch.enable(maxsize=2)
+        for iymd in [2022_01_01, 2022_01_02, 2022_01_01, 2022_01_01, 2022_01_03]:
+            self.assertEqual(udu.add_days(iymd, 1), uncached_add_days(iymd, 1))
+
+        info = udch.cache_info()['add_days']
+        self.assertEqual((info.hits, info.misses, info.maxsize, info.currsize), (2, 3, 2, 2))
+
+        udch.cache_clear()
+        self.assertEqual(udch.cache_info()['add_days'].currsize, 0)
+
+    # ---
+
+    def test_interned(self):
+        """ Tests repeated dates return the same YMD object """
+
+        self.assertIsNot(udch.ymd(2022_01_01), udch.ymd(2022_01_01))
+        udch.enable()
+        self.assertIs(udch.ymd(2022_01_01), udch.ymd(2022_01_01))
+
+        ymd = ud.YMD(2022_01_01)
+        self.assertIs(ymd + 1, ud.add_days(ymd, 1))
+        self.assertIs(ymd + 1, udch.ymd(2022_01_02))
+        self.assertIs(ymd.add_days(0), udch.ymd(2022_01_01))
+        self.assertEqual(udch.cache_info()['ymd'].currsize, 2)
+
+        # The public epoch_to_ymd, interning trusted YMDs with their epoch
+        epoch = udc.epoch_from_parts(2022, 1, 3)
+        self.assertIs(ud.epoch_to_ymd(epoch), ud.epoch_to_ymd(epoch))
+        self.assertIs(ud.epoch_to_ymd(epoch), udch.ymd(2022_01_03))
+        self.assertEqual(ud.epoch_to_ymd(epoch).status, ud.TRUSTED)
+        self.assertEqual(udch.ymd(2022_01_04).epoch(), epoch + 1)
+        self.assertFalse(udch.ymd(2022_02_30))
+
+    # ---
+
+    def test_tables(self):
+        """ Tests the cache with the tables, enabling the tables before and after """
+
+        udtb.enable()
+        udch.enable()
+        self.assertEqual(udu.add_days(2021_01_01, 5), 2021_01_06)
+        self.assertEqual(udch.cache_info()['epoch_to_parts'].currsize, 1)
+        udch.disable()
+        self.assertIs(udc.epoch_to_parts, udtb.epoch_to_parts)
+
+        # Enabling the tables replaces the cached conversions, which are then skipped
+        udch.enable()
+        udtb.enable()
+        self.assertEqual(udu.add_days(2021_01_01, 5), 2021_01_06)
+        self.assertNotIn('epoch_to_parts', udch.cache_info())
+        udch.cache_clear()
+        udch.disable()
+        self.assertTrue(udtb.is_enabled())
+        self.assertIs(udc.epoch_to_parts, udtb.epoch_to_parts)
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End
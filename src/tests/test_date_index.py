@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated module
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import random
+import unittest
+
+import undated as ud
+import undated.utils as udu
+
+# -----------------------------------------------
+
+
+def scan(iymds, from_iymd, to_iymd):
+    """ The rows between the dates, in date order, by scanning the list """
+
+    return [row for _, row in sorted(
+        (iymd, row) for row, iymd in enumerate(iymds) if from_iymd <= iymd <= to_iymd
+    )]
+
+
+# -----------------------------------------------
+
+
+class TestDateIndex(unittest.TestCase):
+    """ Tests the DateIndex class, against scanning the dates """
+
+    def setUp(self):
+        """ Random dates, with duplicates """
+
+        rand = random.Random(2022)
+        self.iymds = [udu.add_days(2020_01_01, rand.randint(0, 800)) for _ in range(2000)]
+
+    def test_queries(self):
+        """ Testing the range, count and month queries """
+
+        index = ud.DateIndex(self.iymds)
+        self.assertEqual(len(index), len(self.iymds))
+        self.assertEqual(list(index.dates()), sorted(self.iymds))
+
+        for from_iymd, to_iymd in [
+            (2021_01_01, 2021_03_31),
+            (2019_01_01, 2020_01_01),
+            (2022_03_10, 2022_12_31),
+            (2021_06_15, 2021_06_15),
+            (2021_06_15, 2021_06_14),
+        ]:
+            expected = scan(self.iymds, from_iymd, to_iymd)
+            self.assertEqual(list(index.between(from_iymd, to_iymd)), expected)
+            self.assertEqual(index.count(ud.YMD(from_iymd), ud.YMD(to_iymd)), len(expected))
+
+        self.assertEqual(list(index.month(2020_02)), scan(self.iymds, 2020_02_01, 2020_02_29))
+        self.assertEqual(list(index.month(2021_02_14)), scan(self.iymds, 2021_02_01, 2021_02_28))
+
+    def test_floor_ceiling(self):
+        """ Testing the first date on or after and the last date on or before """
+
+        index = ud.DateIndex(self.iymds)
+        for iymd in (2019_12_31, 2020_01_01, 2020_07_19, 2021_05_05, 2022_03_11, 2023_01_01):
+            floors = [date for date in self.iymds if date <= iymd]
+            ceilings = [date for date in self.iymds if date >= iymd]
+            self.assertEqual(index.floor(iymd), max(floors) if floors else None)
+            self.assertEqual(index.ceiling(iymd), min(ceilings) if ceilings else None)
+
+    def test_append(self):
+        """ Testing appending dates, in and out of order """
+
+        iymds = self.iymds[:1000] + sorted(self.iymds[1000:1500]) + self.iymds[1500:]
+        index = ud.DateIndex(iymds[:1000])
+        index.extend(iymds[1000:1500])
+        for iymd in iymds[1500:]:
+            index.append(ud.YMD(iymd))
+
+        self.assertEqual(list(index.dates()), sorted(iymds))
+        self.assertEqual(
+            list(index.between(2020_01_01, 2022_12_31)), scan(iymds, 2020_01_01, 2022_12_31)
+        )
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End.
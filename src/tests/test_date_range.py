@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated module
+Benchmarking date_range against datetime and the add functions
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import datetime
+import unittest
+
+import undated as ud
+import undated.utils as udu
+
+# -----------------------------------------------
+
+
+def datetime_range(start, end, step):
+    """ Generates the expected dates using datetime """
+
+    start_dt = datetime.datetime.strptime(str(start), '%Y%m%d')
+    end_dt = datetime.datetime.strptime(str(end), '%Y%m%d')
+    results = []
+    while (start_dt <= end_dt) if step > 0 else (start_dt >= end_dt):
+        results.append(int(start_dt.strftime('%Y%m%d')))
+        start_dt += datetime.timedelta(days=step)
+    return results
+
+
+# -----------------------------------------------
+
+
+class TestDateRange(unittest.TestCase):
+    """ Tests the date_range function """
+
+    def test_days(self):
+        """ Tests daily and weekly steps, benchmarking against datetime """
+
+        for step in [1, 2, 7, 27, 28, 29, 31, 100]:
+            self.assertEqual(
+                list(udu.date_range(1999_12_15, 2004_03_10, step)),
+                datetime_range(1999_12_15, 2004_03_10, step),
+                f'Step: {step}'
+            )
+            self.assertEqual(
+                list(udu.date_range(2004_03_10, 1999_12_15, -step)),
+                datetime_range(2004_03_10, 1999_12_15, -step),
+                f'Step: {-step}'
+            )
+
+        self.assertEqual(
+            list(udu.date_range(2022_01_01, 2022_03_01, 2, 'W')),
+            datetime_range(2022_01_01, 2022_03_01, 14)
+        )
+
+    # ---
+
+    def test_months(self):
+        """ Tests monthly steps keep the start day """
+
+        self.assertEqual(
+            list(udu.date_range(2020_01_31, 2020_06_30, unit='M')),
+            [2020_01_31, 2020_02_29, 2020_03_31, 2020_04_30, 2020_05_31, 2020_06_30]
+        )
+        self.assertEqual(
+            list(udu.date_range(2021_12_31, 2021_01_01, -3, 'M')),
+            [2021_12_31, 2021_09_30, 2021_06_30, 2021_03_31]
+        )
+        for step in [1, 5, 12, -1, -7]:
+            end = 2023_02_28 if step > 0 else 2016_01_01
+            dates = list(udu.date_range(2019_08_31, end, step, 'M'))
+            self.assertTrue(dates, f'Step: {step}')
+            for i, iymd in enumerate(dates):
+                self.assertEqual(iymd, udu.add_months(2019_08_31, step * i), f'Step: {step}')
+
+    # ---
+
+    def test_business_days(self):
+        """ Tests business day steps, with and without holidays """
+
+        self.assertEqual(
+            list(udu.date_range(2022_12_22, 2023_01_04, unit='BD')),
+            [2022_12_22, 2022_12_23, 2022_12_26, 2022_12_27, 2022_12_28, 2022_12_29,
+             2022_12_30, 2023_01_02, 2023_01_03, 2023_01_04]
+        )
+
+        calendar = ud.BusinessCalendar([2022_12_26, 2022_12_27, 2023_01_02])
+        self.assertEqual(
+            list(udu.date_range(2022_12_24, 2023_01_04, 2, 'BD', calendar)),
+            [2022_12_28, 2022_12_30, 2023_01_04]
+        )
+        self.assertEqual(
+            list(udu.date_range(2023_01_02, 2022_12_22, -3, 'BD', calendar)),
+            [2022_12_30, 2022_12_23]
+        )
+
+    # ---
+
+    def test_invalid(self):
+        """ Tests invalid parameters are rejected """
+
+        with self.assertRaises(ValueError):
+            udu.date_range(2022_01_01, 2022_02_01, 0)
+        with self.assertRaises(ValueError):
+            udu.date_range(2022_01_01, 2022_02_01, unit='Q')
+        self.assertEqual(list(udu.date_range(2022_02_01, 2022_01_01)), [])
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End
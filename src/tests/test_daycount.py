@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated.daycount module
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import datetime
+import unittest
+
+import undated as ud
+import undated.daycount as uddc
+
+# -----------------------------------------------
+
+
+def act_act_isda(from_date, to_date):
+    """ The actual/actual ISDA year fraction, one day at a time with datetime """
+
+    sign = 1
+    if to_date < from_date:
+        from_date, to_date, sign = to_date, from_date, -1
+
+    fraction = 0
+    while from_date < to_date:
+        fraction += 1 / (366 if from_date.year % 4 == 0 else 365)
+        from_date += datetime.timedelta(days=1)
+    return fraction * sign
+
+
+# -----------------------------------------------
+
+
+class TestDayCount(unittest.TestCase):
+    """ Tests the day count conventions """
+
+    def test_thirty_360(self):
+        """ Testing the 30/360 conventions, adjusting the 31st days """
+
+        for from_iymd, to_iymd, days_360, days_e_360 in [
+            (2021_01_31, 2021_02_28, 28, 28),
+            (2021_01_31, 2021_03_31, 60, 60),
+            (2021_01_15, 2021_03_31, 76, 75),
+            (2020_02_29, 2021_08_30, 541, 541),
+            (2021_03_31, 2021_01_15, -75, -75),
+        ]:
+            self.assertEqual(uddc.day_count(from_iymd, to_iymd, uddc.THIRTY_360), days_360)
+            self.assertEqual(uddc.day_count(from_iymd, to_iymd, uddc.THIRTY_E_360), days_e_360)
+            self.assertEqual(
+                uddc.year_fraction(from_iymd, to_iymd, uddc.THIRTY_360), days_360 / 360
+            )
+            self.assertEqual(
+                uddc.year_fraction(from_iymd, to_iymd, uddc.THIRTY_E_360), days_e_360 / 360
+            )
+
+    def test_actual(self):
+        """ Testing the actual conventions, against counting the days with datetime """
+
+        for from_iymd, to_iymd in [
+            (2003_11_01, 2004_05_01),
+            (2020_01_01, 2020_12_31),
+            (2019_12_31, 2024_01_01),
+            (2024_01_01, 2019_12_31),
+            (2021_07_04, 2021_07_04),
+        ]:
+            from_ymd, to_ymd = ud.YMD(from_iymd), ud.YMD(to_iymd)
+            from_date = datetime.date(from_ymd.year, from_ymd.month, from_ymd.day)
+            to_date = datetime.date(to_ymd.year, to_ymd.month, to_ymd.day)
+            days = (to_date - from_date).days
+
+            for convention, expected in [
+                (uddc.ACT_360, days / 360),
+                (uddc.ACT_365F, days / 365),
+                (uddc.ACT_ACT_ISDA, act_act_isda(from_date, to_date)),
+            ]:
+                self.assertEqual(uddc.day_count(from_iymd, to_iymd, convention), days)
+                self.assertAlmostEqual(
+                    uddc.year_fraction(from_iymd, to_iymd, convention), expected, 12
+                )
+                self.assertAlmostEqual(
+                    uddc.epoch_year_fraction(from_ymd.epoch(), to_ymd.epoch(), convention),
+                    expected, 12
+                )
+
+        self.assertAlmostEqual(
+            uddc.year_fraction(2003_11_01, 2004_05_01, uddc.ACT_ACT_ISDA), 61 / 365 + 121 / 366
+        )
+
+    def test_invalid(self):
+        """ Testing an unknown convention """
+
+        for function in (uddc.day_count, uddc.year_fraction):
+            with self.assertRaises(ValueError):
+                function(2021_01_01, 2022_01_01, 'ACT/ACT ICMA')
+        with self.assertRaises(ValueError):
+            uddc.epoch_year_fraction(1, 2, 'ACT/365L')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End.
@@ -39,6 +39,29 @@ class TestEpoch(unittest.TestCase):
             expected_day = datetime.datetime(*day_parts)
             self.assertEqual(day, expected_day, f'Unexpected day: {day}')
 
+    # ---
+
+    def test_exhaustive(self):
+        """ Tests every day from 1583 to 9999, benchmarking against datetime ordinals """
+
+        first_epoch = udc.epoch_from_parts(1583, 1, 1)
+        last_epoch = udc.epoch_from_parts(9999, 12, 31)
+        ordinal_offset = first_epoch - datetime.date(1583, 1, 1).toordinal()
+
+        parts_errors = []
+        epoch_errors = []
+
+        for epoch in range(first_epoch, last_epoch + 1):
+            day = datetime.date.fromordinal(epoch - ordinal_offset)
+            day_parts = udc.epoch_to_parts(epoch)
+            if day_parts != (day.year, day.month, day.day):
+                parts_errors.append(epoch)
+            if udc.epoch_from_parts(*day_parts) != epoch:
+                epoch_errors.append(epoch)
+
+        self.assertEqual(parts_errors, [], 'Unexpected days')
+        self.assertEqual(epoch_errors, [], 'Unexpected epochs')
+
 
 # -----------------------------------------------
 
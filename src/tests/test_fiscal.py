@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated.fiscal module
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import unittest
+
+import undated as ud
+import undated.utils as udu
+
+from undated.fiscal import FiscalCalendar
+
+# -----------------------------------------------
+
+
+class TestFiscal(unittest.TestCase):
+    """ Tests the FiscalCalendar class """
+
+    def test_months(self):
+        """ Testing calendar month periods, against adding months to the calendar date """
+
+        for start_month in (1, 4, 7, 10):
+            calendar = FiscalCalendar(start_month, first_year=2000, last_year=2030)
+            iymds = list(udu.date_range(2005_01_01, 2008_12_31, 3))
+            for iymd in iymds:
+                year, month, day = iymd // 1_00_00, (iymd % 1_00_00) // 1_00, iymd % 1_00
+                months = (month - start_month) % 12
+                fiscal_year = year + (1 if 1 < start_month <= month else 0)
+                year_start = udu.add_months((year * 1_00_00) + (month * 1_00) + 1, -months)
+
+                self.assertEqual(calendar.fiscal_year(iymd), fiscal_year, iymd)
+                self.assertEqual(calendar.period(iymd), months + 1, iymd)
+                self.assertEqual(calendar.quarter(ud.YMD(iymd)), (months // 3) + 1, iymd)
+                self.assertEqual(calendar.week(iymd), udu.days_between(year_start, iymd) // 7 + 1)
+                self.assertEqual(calendar.period_start(fiscal_year, months + 1), iymd - day + 1)
+                self.assertEqual(
+                    calendar.period_end(fiscal_year, months + 1), udu.last_day(iymd // 1_00)
+                )
+
+            self.assertEqual(
+                list(calendar.fiscal_year_many(iymds)), [calendar.fiscal_year(i) for i in iymds]
+            )
+            self.assertEqual(list(calendar.period_many(iymds)), [calendar.period(i) for i in iymds])
+            self.assertEqual(
+                list(calendar.quarter_many(iymds)), [calendar.quarter(i) for i in iymds]
+            )
+            self.assertEqual(list(calendar.week_many(iymds)), [calendar.week(i) for i in iymds])
+
+    def test_weeks(self):
+        """ Testing 4-4-5 calendars, ending the last saturday or the saturday nearest January """
+
+        calendar = FiscalCalendar(2, (4, 4, 5), first_year=2000, last_year=2030)
+        self.assertEqual(calendar.year_start(2021), 2020_01_26)
+        self.assertEqual(calendar.year_end(2021), 2021_01_30)
+        self.assertEqual(calendar.weeks_in_year(2021), 53)
+        self.assertEqual(calendar.weeks_in_year(2022), 52)
+        self.assertEqual(
+            [calendar.period_start(2022, period) for period in (1, 2, 3, 4, 12)],
+            [2021_01_31, 2021_02_28, 2021_03_28, 2021_05_02, 2021_12_26]
+        )
+        self.assertEqual(calendar.period_end(2021, 12), 2021_01_30)
+        self.assertEqual(calendar.week(2021_01_30), 53)
+        self.assertEqual(calendar.period(2021_01_30), 12)
+        self.assertEqual(calendar.fiscal_year(2021_01_31), 2022)
+
+        calendar = FiscalCalendar(2, (4, 5, 4), nearest=True, first_year=2000, last_year=2030)
+        self.assertEqual(calendar.year_end(2023), 2023_01_28)
+        self.assertEqual(calendar.year_end(2024), 2024_02_03)
+        self.assertEqual(calendar.weeks_in_year(2024), 53)
+        self.assertEqual(calendar.period_start(2024, 2), 2023_02_26)
+        self.assertEqual(calendar.period_start(2024, 3), 2023_04_02)
+
+        for year in range(2000, 2031):
+            self.assertEqual(ud.YMD(calendar.year_start(year)).day_of_week(), 0)
+            self.assertIn(calendar.weeks_in_year(year), (52, 53))
+
+    def test_errors(self):
+        """ Testing invalid calendars and dates outside of the calendar """
+
+        for kwargs in ({'start_month': 13}, {'pattern': (4, 4, 4)}, {'end_day': 7},
+                       {'first_year': 2001, 'last_year': 2000}):
+            with self.assertRaises(ValueError):
+                FiscalCalendar(**kwargs)
+
+        calendar = FiscalCalendar(first_year=2000, last_year=2001)
+        for iymd in (1999_12_31, 2002_01_01):
+            with self.assertRaises(ValueError):
+                calendar.fiscal_year(iymd)
+        with self.assertRaises(ValueError):
+            calendar.period_start(2001, 13)
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End.
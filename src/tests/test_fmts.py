@@ -11,8 +11,12 @@ Unit tests for the undated.fmts module
 """
 # -----------------------------------------------
 
+import copy
+import pickle
 import unittest
 
+from array import array
+
 import undated.fmts as udf
 
 # -----------------------------------------------
@@ -55,6 +59,142 @@ class TestAddMonths(unittest.TestCase):
                 ymd_parts = udf.as_parts(sdate, fmt)
                 self.assertEqual(ymd_parts, answers[i], f'{sdate}, {ymd_parts}, {answers[i]}')
 
+    def test_compile(self):
+        """ Tests the compiled parsers give the same answers, and are compiled once """
+
+        for test_dates in TEST_DATA:
+            sdates = [i[0] for i in test_dates]
+            fmt = udf.Deriver().search(sdates)
+            parser = fmt.compile()
+            self.assertIs(fmt.compile(), parser)
+            for sdate, answer in test_dates:
+                self.assertEqual(parser(sdate), answer, sdate)
+
+        for sdate, fmt in ((2021_06_12, 'Ymd'), ('2021JUN12', 'YMd'), ('21JUN12', 'yMd'),
+                           ('12/JUN/2021', 'd-M-Y'), ('12-JUN-21', 'd-M-y'), ('12.06.21', 'd-m-y')):
+            self.assertEqual(udf.as_parts(sdate, fmt), (2021, 6, 12), fmt)
+            self.assertEqual(udf.convert_format(fmt).compile()(sdate), (2021, 6, 12), fmt)
+
+        self.assertIsNone(udf.as_parts('20210230', 'Ymd'))
+        self.assertIsNone(udf.as_parts('', 'Ymd'))
+        self.assertIsNone(udf.convert_format('Ym').compile()('20210612'))
+        self.assertEqual(udf.as_parts('20-01-35', 'd-m-y', 1930), (1935, 1, 20))
+
+        # Year and month formats, as the first of the month with the YM hint
+        deriver = udf.Deriver()
+        deriver.set_parameters({udf.HINTS: [udf.YM]})
+        self.assertEqual(udf.as_parts('202105', deriver.search(['202105', '202112'])), (2021, 5, 1))
+        fmt = udf.Deriver().search(['Jul 20, 2033', 'Aug 21, 2033', 'Dec 1, 2033'])
+        self.assertEqual(fmt.keys, ('month', 'year'))
+        self.assertIsNone(udf.as_parts('Jul 20, 2033', fmt))
+
+
+    def test_pickle(self):
+        """ Tests formats can be pickled and copied once used, each compiling its own parsers """
+
+        udfmt = udf.convert_format('d-M-y')
+        self.assertEqual(udf.as_parts('12-JUN-21', udfmt), (2021, 6, 12))
+
+        for other in (pickle.loads(pickle.dumps(udfmt)), copy.copy(udfmt), copy.deepcopy(udfmt)):
+            self.assertEqual(other, udfmt)
+            self.assertIsNot(other.compile(), udfmt.compile())
+            self.assertEqual(udf.as_parts('12-JUN-21', other), (2021, 6, 12))
+
+    def test_as_iymd(self):
+        """ Tests the dates in Ymd format, against the parts """
+
+        for test_dates in TEST_DATA:
+            sdates = [i[0] for i in test_dates]
+            expected = [(y * 1_00_00) + (m * 1_00) + d for _, (y, m, d) in test_dates]
+            fmt = udf.Deriver().search(sdates)
+            self.assertEqual([udf.as_iymd(sdate, fmt) for sdate in sdates], expected)
+            self.assertEqual(list(udf.as_iymd_many(iter(sdates), fmt)), expected)
+            self.assertEqual(list(udf.as_iymd_array(sdates, fmt)), expected)
+
+        sdates = ['12-JUN-21', '', '31-JUN-21', None, '01-JUL-21', 'N/A', '-', b'--']
+        self.assertEqual(
+            list(udf.as_iymd_many(sdates, 'd-M-y')),
+            [2021_06_12, None, None, None, 2021_07_01, None, None, None]
+        )
+        self.assertEqual(
+            list(udf.as_iymd_array(sdates, 'd-M-y', invalid=-1)),
+            [2021_06_12, -1, -1, -1, 2021_07_01, -1, -1, -1]
+        )
+        for fmt in ('Ymd', 'd-m-Y', 'd/m/y', 'dMY'):
+            self.assertEqual(list(udf.as_iymd_array(['N/A', '-', 'Invalid'], fmt)), [0, 0, 0])
+
+        # Derived formats with the month in its position, and too few parts
+        for sdates in (['Monday, 29 March 2021'] * 2,
+                       ['Jul 20, 2033', 'Aug 21, 2033', 'Dec 1, 2033']):
+            fmt = udf.Deriver().search(sdates)
+            self.assertIsInstance(fmt.steps[udf.TEXT_MONTH], tuple)
+            self.assertEqual(list(udf.as_iymd_array(['N/A', '2033', '29 2021'], fmt)), [0, 0, 0])
+            self.assertIsNone(udf.as_parts('N/A', fmt))
+
+        # Chunks extending the one array
+        column = array('i')
+        for chunk in (['20210101', '20210102'], [], [20210103]):
+            self.assertIs(udf.as_iymd_array(chunk, 'Ymd', out=column), column)
+        self.assertEqual(list(column), [2021_01_01, 2021_01_02, 2021_01_03])
+
+    def test_feed(self):
+        """ Tests feeding dates one at a time, from a generator """
+
+        deriver = udf.Deriver()
+        self.assertTrue(deriver.feed('05/03/2022'))
+        self.assertTrue(deriver.feed('Unknown'))
+        self.assertIsNone(deriver.result())
+        self.assertFalse(deriver.feed('13/03/2022'))
+        self.assertFalse(deriver.feed('03/14/2022'))
+        self.assertEqual(deriver.result().keys, ('day', 'month', 'year'))
+
+        # Only the dates needed are consumed
+        sdates = iter(['05/03/2022', '06/03/2022', '13/03/2022', '14/03/2022'])
+        self.assertEqual(deriver.search(sdates).keys, ('day', 'month', 'year'))
+        self.assertEqual(list(sdates), ['14/03/2022'])
+
+        deriver.reset()
+        self.assertIsNone(deriver.result())
+        for sdate in (i for i in ('2022-03-05', '2022-03-06')):
+            deriver.feed(sdate)
+        self.assertIsNone(deriver.result())
+
+    def test_cache(self):
+        """ Tests the cache of parsed dates, with bytes and invalid dates """
+
+        udfmt = udf.convert_format('d-M-y')
+        sdates = ['12-JUN-21', b'13-JUN-21', '31-JUN-21', None] * 5
+        expected = [2021_06_12, 2021_06_13, None, None] * 5
+        self.assertEqual(list(udf.as_iymd_many(sdates, udfmt)), expected)
+        self.assertEqual(udfmt.cache_info(), {})
+
+        udfmt.enable_cache(maxsize=2)
+        self.assertEqual(list(udf.as_iymd_many(sdates, udfmt)), expected)
+        self.assertEqual(udf.as_parts(b'12-JUN-21', udfmt), (2021, 6, 12))
+        info = udfmt.cache_info()
+        self.assertEqual(set(info), {'iymd', 'parts'})
+        self.assertEqual((info['iymd'].hits, info['iymd'].currsize, info['iymd'].maxsize),
+                         (0, 2, 2))
+
+        udfmt.enable_cache()
+        self.assertEqual(list(udf.as_iymd_many(sdates, udfmt)), expected)
+        self.assertEqual((udfmt.cache_info()['iymd'].hits, udfmt.cache_info()['iymd'].misses),
+                         (16, 4))
+
+        # Copies and pickles keep the cache size, each with its own cache
+        for other in (copy.copy(udfmt), pickle.loads(pickle.dumps(udfmt))):
+            self.assertEqual(other.cache_info(), {})
+            self.assertEqual(udf.as_iymd(b'13-JUN-21', other), 2021_06_13)
+            self.assertEqual(other.cache_info()['iymd'].misses, 1)
+            other.disable_cache()
+        self.assertEqual(udfmt.cache_info()['iymd'].hits, 16)
+
+        udfmt.cache_clear()
+        self.assertEqual(udfmt.cache_info()['iymd'].currsize, 0)
+        udfmt.disable_cache()
+        self.assertEqual(list(udf.as_iymd_many(sdates, udfmt)), expected)
+        self.assertEqual(udfmt.cache_info(), {})
+
 
 # -----------------------------------------------
 
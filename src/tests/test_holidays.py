@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated.holidays module
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import unittest
+
+import undated as ud
+import undated.utils as udu
+
+from undated import holidays as udh
+
+# -----------------------------------------------
+
+US_FEDERAL = udh.HolidayRules([
+    udh.fixed("New Year's Day", 1, 1, udh.NEAREST_WEEKDAY),
+    udh.nth_weekday('Martin Luther King Jr. Day', 1, 1, 3, first_year=1986),
+    udh.nth_weekday("Washington's Birthday", 2, 1, 3),
+    udh.nth_weekday('Memorial Day', 5, 1, -1),
+    udh.fixed('Juneteenth', 6, 19, udh.NEAREST_WEEKDAY, first_year=2021),
+    udh.fixed('Independence Day', 7, 4, udh.NEAREST_WEEKDAY),
+    udh.nth_weekday('Labor Day', 9, 1, 1),
+    udh.nth_weekday('Columbus Day', 10, 1, 2),
+    udh.fixed('Veterans Day', 11, 11, udh.NEAREST_WEEKDAY),
+    udh.nth_weekday('Thanksgiving Day', 11, 4, 4),
+    udh.fixed('Christmas Day', 12, 25, udh.NEAREST_WEEKDAY)
+])
+
+UK_ENGLAND = udh.HolidayRules([
+    udh.fixed("New Year's Day", 1, 1, udh.SUBSTITUTE),
+    udh.easter('Good Friday', -2),
+    udh.easter('Easter Monday', 1),
+    udh.nth_weekday('Early May', 5, 1, 1),
+    udh.nth_weekday('Spring', 5, 1, -1),
+    udh.nth_weekday('Summer', 8, 1, -1),
+    udh.fixed('Christmas Day', 12, 25, udh.SUBSTITUTE),
+    udh.fixed('Boxing Day', 12, 26, udh.SUBSTITUTE)
+])
+
+# -----------------------------------------------
+
+
+class TestHolidays(unittest.TestCase):
+    """ Tests the holidays module """
+
+    def test_easter(self):
+        """ Testing Easter Sunday, against known dates """
+
+        for iymd in (1818_03_22, 1943_04_25, 2000_04_23, 2019_04_21, 2021_04_04, 2024_03_31,
+                     2038_04_25, 2285_03_22):
+            self.assertEqual(udh.easter_epoch(iymd // 1_00_00), ud.YMD(iymd).epoch())
+
+        for year in range(1583, 2500):
+            ymd = ud.epoch_to_ymd(udh.easter_epoch(year))
+            self.assertEqual(ymd.day_of_week(), 0)
+            self.assertTrue(3_22 <= ymd.iymd % 1_00_00 <= 4_25, ymd)
+
+    def test_rules(self):
+        """ Testing the rules and observances, against published holidays """
+
+        self.assertEqual(list(US_FEDERAL.dates(2021, 2022)), [
+            2021_01_01, 2021_01_18, 2021_02_15, 2021_05_31, 2021_06_18, 2021_07_05, 2021_09_06,
+            2021_10_11, 2021_11_11, 2021_11_25, 2021_12_24, 2021_12_31, 2022_01_17, 2022_02_21,
+            2022_05_30, 2022_06_20, 2022_07_04, 2022_09_05, 2022_10_10, 2022_11_11, 2022_11_24,
+            2022_12_26
+        ])
+        self.assertEqual(list(UK_ENGLAND.dates(2021, 2022)), [
+            2021_01_01, 2021_04_02, 2021_04_05, 2021_05_03, 2021_05_31, 2021_08_30, 2021_12_27,
+            2021_12_28, 2022_01_03, 2022_04_15, 2022_04_18, 2022_05_02, 2022_05_30, 2022_08_29,
+            2022_12_26, 2022_12_27
+        ])
+        self.assertEqual(len(US_FEDERAL.year(1985)), 9)
+
+        leap_day = udh.HolidayRules([udh.fixed('Leap day', 2, 29)])
+        self.assertEqual(list(leap_day.dates(2019, 2024)), [2020_02_29, 2024_02_29])
+
+        for nth in (1, 2, 3, 4, -1, -2):
+            for iymd in udu.date_range(2020_01_01, 2021_12_01, 1, 'M'):
+                year, month = iymd // 1_00_00, (iymd % 1_00_00) // 1_00
+                rule = udh.nth_weekday('Wednesday', month, 3, nth)
+                days = [
+                    i for i in udu.date_range(iymd, udu.last_day(iymd // 1_00))
+                    if ud.YMD(i).day_of_week() == 3
+                ]
+                self.assertEqual(
+                    rule.epoch(year), ud.YMD(days[nth - 1 if nth > 0 else nth]).epoch()
+                )
+
+    def test_calendar(self):
+        """ Testing the business calendar of the holidays, and that the years are kept """
+
+        calendar = UK_ENGLAND.calendar(2021, 2022)
+        self.assertEqual(
+            calendar.holidays, tuple(ud.YMD(i).epoch() for i in UK_ENGLAND.dates(2021, 2022))
+        )
+        self.assertEqual(
+            int(ud.add_weekdays(ud.YMD(2021_12_24), 1, calendar=calendar)), 2021_12_29
+        )
+        self.assertEqual(
+            ud.BusinessCalendar(UK_ENGLAND.dates(2021, 2022)).holidays, calendar.holidays
+        )
+        self.assertIs(UK_ENGLAND.year(2021), UK_ENGLAND.year(2021))
+
+    def test_errors(self):
+        """ Testing invalid rules """
+
+        for function, args in (
+                (udh.fixed, ('X', 2, 30)), (udh.fixed, ('X', 1, 1, 9)),
+                (udh.nth_weekday, ('X', 13, 1, 1)), (udh.nth_weekday, ('X', 1, 7, 1)),
+                (udh.nth_weekday, ('X', 1, 1, 5)), (udh.nth_weekday, ('X', 1, 1, 0))):
+            with self.assertRaises(ValueError):
+                function(*args)
+        with self.assertRaises(ValueError):
+            udh.HolidayRules([], 0)
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End.
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated module
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import datetime
+import unittest
+
+import undated as ud
+import undated.utils as udu
+
+# -----------------------------------------------
+
+
+class TestIsoWeek(unittest.TestCase):
+    """ Tests the ISO week and day of the year functions, against datetime """
+
+    def test_iso_calendar(self):
+        """ Testing each day around the year ends, over four centuries """
+
+        for year in range(1600, 2001):
+            for day in range(-7, 8):
+                date = datetime.date(year, 1, 1) + datetime.timedelta(days=day)
+                iymd = int(date.strftime('%Y%m%d'))
+                ymd = ud.YMD(iymd)
+                expected = tuple(date.isocalendar())
+
+                self.assertEqual(udu.iso_calendar(iymd), expected, iymd)
+                self.assertEqual(ymd.iso_calendar(), expected, iymd)
+                self.assertEqual((udu.iso_year(iymd), ymd.iso_year()), (expected[0],) * 2)
+                self.assertEqual((udu.iso_week(iymd), ymd.iso_week()), (expected[1],) * 2)
+                self.assertEqual((udu.iso_weekday(iymd), ymd.iso_weekday()), (expected[2],) * 2)
+                self.assertEqual(udu.from_iso_calendar(*expected), iymd)
+
+        self.assertEqual(udu.from_iso_calendar(2021, 1), 2021_01_04)
+        self.assertIsNone(ud.YMD(2021_02_29).iso_calendar())
+
+    def test_day_of_year(self):
+        """ Testing each day of a leap and non leap year """
+
+        for year in (2020, 2021):
+            date = datetime.date(year, 1, 1)
+            while date.year == year:
+                iymd = int(date.strftime('%Y%m%d'))
+                day = date.timetuple().tm_yday
+                self.assertEqual(udu.day_of_year(iymd), day, iymd)
+                self.assertEqual(ud.YMD(iymd).day_of_year(), day, iymd)
+                self.assertEqual(udu.from_day_of_year(year, day), iymd)
+                date += datetime.timedelta(days=1)
+
+        self.assertIsNone(ud.YMD(2021_02_29).day_of_year())
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End.
@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the nth_weekday, last_weekday and nth_weekday_range functions
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import unittest
+
+import undated.utils as udu
+
+# -----------------------------------------------
+
+
+def stepped_weekdays(iym, weekday):
+    """ The dates of the weekday in the month, stepping through the days """
+
+    return [
+        iymd for iymd in udu.date_range(udu.first_day(iym), udu.last_day(iym))
+        if udu.day_of_week(iymd) == weekday
+    ]
+
+
+# -----------------------------------------------
+
+
+class TestNthWeekday(unittest.TestCase):
+    """ Tests the nth weekday functions """
+
+    def test_nth_weekday(self):
+        """ Testing against stepping through the days of each month """
+
+        for iymd in udu.date_range(1999_01_01, 2001_12_01, 1, 'M'):
+            iym = iymd // 1_00
+            for weekday in range(7):
+                expected = stepped_weekdays(iym, weekday)
+                self.assertEqual(udu.last_weekday(iym, weekday), expected[-1])
+                for nth in (1, 2, 3, 4):
+                    self.assertEqual(udu.nth_weekday(iym, weekday, nth), expected[nth - 1])
+                    self.assertEqual(udu.nth_weekday(iym, weekday, -nth), expected[-nth])
+
+        self.assertEqual(udu.nth_weekday(2021_10, 5, 3), 2021_10_15)
+        self.assertEqual(udu.last_weekday(2024_02, 4), 2024_02_29)
+
+    def test_nth_weekday_range(self):
+        """ Testing the range against the nth weekday of each month """
+
+        for nth in (1, 3, -1, -4):
+            for weekday in range(7):
+                self.assertEqual(
+                    list(udu.nth_weekday_range(1999_11, 2001_02, weekday, nth)),
+                    [
+                        udu.nth_weekday(iymd // 1_00, weekday, nth)
+                        for iymd in udu.date_range(1999_11_01, 2001_02_01, 1, 'M')
+                    ]
+                )
+        self.assertEqual(list(udu.nth_weekday_range(2021_02, 2021_01, 5)), [])
+
+    def test_errors(self):
+        """ Testing invalid weekdays and nth """
+
+        for weekday, nth in ((7, 1), (-1, 1), (1, 0), (1, 5), (1, -5)):
+            with self.assertRaises(ValueError):
+                udu.nth_weekday(2021_01, weekday, nth)
+            with self.assertRaises(ValueError):
+                udu.nth_weekday_range(2021_01, 2021_12, weekday, nth)
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End.
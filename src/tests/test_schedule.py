@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated.schedule module
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import unittest
+
+import undated as ud
+import undated.utils as udu
+
+from undated import schedule as uds
+
+# -----------------------------------------------
+
+
+class TestSchedule(unittest.TestCase):
+    """ Tests the schedule module """
+
+    def test_stubs(self):
+        """ Testing the short and long, front and back stubs """
+
+        for stub, expected in (
+                (uds.SHORT_FRONT, [2021_01_15, 2021_04_30, 2021_10_30, 2022_04_30, 2022_10_30,
+                                   2023_04_30]),
+                (uds.LONG_FRONT, [2021_01_15, 2021_10_30, 2022_04_30, 2022_10_30, 2023_04_30]),
+                (uds.SHORT_BACK, [2021_01_15, 2021_07_15, 2022_01_15, 2022_07_15, 2023_01_15,
+                                  2023_04_30]),
+                (uds.LONG_BACK, [2021_01_15, 2021_07_15, 2022_01_15, 2022_07_15, 2023_04_30])):
+            self.assertEqual(list(uds.generate(2021_01_15, 2023_04_30, 6, stub)), expected)
+
+        # No stub, and a single period
+        for stub in (uds.SHORT_FRONT, uds.LONG_FRONT, uds.SHORT_BACK, uds.LONG_BACK):
+            self.assertEqual(
+                list(uds.generate(2021_01_31, 2022_01_31, 3, stub)),
+                [2021_01_31, 2021_04_30, 2021_07_31, 2021_10_31, 2022_01_31]
+            )
+            self.assertEqual(
+                list(uds.generate(ud.YMD(2021_01_15), 2021_03_01, 12, stub)),
+                [2021_01_15, 2021_03_01]
+            )
+
+    def test_end_of_month(self):
+        """ Testing the end of month rule, against stepping with add_months """
+
+        self.assertEqual(
+            list(uds.generate(2021_02_28, 2022_02_28, 3, uds.SHORT_BACK, True)),
+            [2021_02_28, 2021_05_31, 2021_08_31, 2021_11_30, 2022_02_28]
+        )
+        self.assertEqual(
+            list(uds.generate(2021_02_28, 2022_02_28, 3, uds.SHORT_BACK)),
+            [2021_02_28, 2021_05_28, 2021_08_28, 2021_11_28, 2022_02_28]
+        )
+
+        end = 2030_08_31
+        for months in (1, 3, 6, 12):
+            expected = [end]
+            while udu.add_months(end, -months * len(expected)) > 2025_01_01:
+                expected.append(udu.add_months(end, -months * len(expected)))
+            expected.append(2025_01_01)
+            self.assertEqual(list(uds.generate(2025_01_01, end, months)), expected[::-1])
+
+    def test_conventions(self):
+        """ Testing the roll conventions, against the BusinessCalendar roll """
+
+        calendar = ud.BusinessCalendar([2021_12_31, 2022_01_03, 2022_04_29, 2022_05_31])
+        for calendars in ((None, ud.BusinessCalendar()), (calendar, calendar)):
+            for start in udu.date_range(2021_01_01, 2021_02_28):
+                dates = uds.generate(start, 2023_05_31, 1, uds.SHORT_BACK, True)
+                for convention in (ud.FOLLOWING, ud.MODIFIED_FOLLOWING, ud.PRECEDING,
+                                   ud.MODIFIED_PRECEDING):
+                    self.assertEqual(
+                        list(uds.generate(start, 2023_05_31, 1, uds.SHORT_BACK, True, convention,
+                                          calendars[0])),
+                        [int(ud.YMD(i).roll_weekday(convention, calendars[1])) for i in dates]
+                    )
+
+        # Sunday and Monday working days
+        self.assertEqual(
+            list(uds.generate(2022_01_01, 2022_03_01, 1, convention=ud.FOLLOWING, weekmask=0b11)),
+            [2022_01_02, 2022_02_06, 2022_03_06]
+        )
+
+    def test_errors(self):
+        """ Testing invalid schedules """
+
+        for args in ((2021_01_01, 2021_01_01, 3), (2021_01_01, 2022_01_01, 0),
+                     (2021_01_01, 2022_01_01, 3, 5), (2021_01_01, 2022_01_01, 3, 1, False, 9)):
+            with self.assertRaises(ValueError):
+                uds.generate(*args)
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End.
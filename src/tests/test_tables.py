@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated.tables module
+Benchmarking against the calculated epochs
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import os
+import tempfile
+import unittest
+
+import undated._core as udc
+import undated.tables as udtb
+import undated.utils as udu
+
+# -----------------------------------------------
+
+EPOCH_TO_PARTS = udc.epoch_to_parts
+EPOCH_FROM_PARTS = udc.epoch_from_parts
+
+# -----------------------------------------------
+
+
+class TestTables(unittest.TestCase):
+    """ Tests the table lookups """
+
+    def tearDown(self):
+        """ Reverts to the calculations """
+        udtb.disable()
+
+    # ---
+
+    def check_epochs(self):
+        """ Checks the lookups match the calculations, including either side of the tables """
+
+        for epoch in range(udtb.FIRST_EPOCH - 400, udtb.LAST_EPOCH + 400, 7):
+            parts = EPOCH_TO_PARTS(epoch)
+            self.assertEqual(udc.epoch_to_parts(epoch), parts, f'Unexpected parts: {epoch}')
+            self.assertEqual(udc.epoch_from_parts(*parts), epoch, f'Unexpected epoch: {parts}')
+
+    # ---
+
+    def test_enable_disable(self):
+        """ Tests the functions are swapped and restored """
+
+        self.assertFalse(udtb.is_enabled())
+        udtb.enable()
+        self.assertTrue(udtb.is_enabled())
+        self.assertEqual(udu.add_days(2020_02_28, 2), 2020_03_01)
+        self.assertEqual(udu.days_between(2019_12_31, 2021_01_01), 367)
+        udtb.disable()
+        self.assertFalse(udtb.is_enabled())
+        self.assertIs(udc.epoch_to_parts, EPOCH_TO_PARTS)
+        self.assertIs(udc.epoch_from_parts, EPOCH_FROM_PARTS)
+
+    # ---
+
+    def test_lookups(self):
+        """ Tests the built tables """
+
+        udtb.enable()
+        self.check_epochs()
+        self.assertEqual(udc.epoch_from_parts(2020, 13, 1), EPOCH_FROM_PARTS(2020, 13, 1))
+
+    # ---
+
+    def test_mapped(self):
+        """ Tests the tables are saved, then mapped without rebuilding """
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'undated.tables')
+            udtb.enable(path)
+            self.assertEqual(udu.add_days(2020_12_31, 1), 2021_01_01)
+            self.assertTrue(os.path.isfile(path))
+            modified = os.path.getmtime(path)
+
+            udtb.enable(path)
+            self.check_epochs()
+            self.assertEqual(os.path.getmtime(path), modified)
+            udtb.disable()
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End
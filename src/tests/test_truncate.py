@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the truncate and ceil functions
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import datetime
+import unittest
+
+import undated.utils as udu
+
+# -----------------------------------------------
+
+
+def datetime_period(iymd, unit):
+    """ The first and last days of the period of the date, with datetime """
+
+    date = datetime.date(iymd // 1_00_00, (iymd % 1_00_00) // 1_00, iymd % 1_00)
+    if unit == 'W':
+        start = date - datetime.timedelta(days=date.weekday())
+        end = start + datetime.timedelta(days=6)
+    else:
+        months = {'M': 1, 'Q': 3, 'H': 6, 'Y': 12}[unit]
+        month = date.month - ((date.month - 1) % months)
+        start = datetime.date(date.year, month, 1)
+        month += months
+        end = datetime.date(date.year + (month > 12), ((month - 1) % 12) + 1, 1)
+        end -= datetime.timedelta(days=1)
+
+    return (
+        int(start.strftime('%Y%m%d')),
+        int(end.strftime('%Y%m%d'))
+    )
+
+
+# -----------------------------------------------
+
+
+class TestTruncate(unittest.TestCase):
+    """ Tests the truncate and ceil functions """
+
+    def test_periods(self):
+        """ Testing each period unit against datetime """
+
+        for unit in ('W', 'M', 'Q', 'H', 'Y'):
+            for iymd in udu.date_range(1999_12_01, 2004_03_01, 3):
+                self.assertEqual(
+                    (udu.truncate(iymd, unit), udu.ceil(iymd, unit)),
+                    datetime_period(iymd, unit),
+                    f'{iymd} {unit}'
+                )
+
+        self.assertEqual(udu.truncate(2021_08_19), 2021_08_01)
+        self.assertEqual(udu.ceil(2024_02_10), 2024_02_29)
+        self.assertEqual(udu.ceil(2021_08_19, 'H'), 2021_12_31)
+
+    def test_last_day(self):
+        """ Testing last_day, from the days in the month, against ceil """
+
+        for iymd in udu.date_range(1600_01_01, 2400_12_01, 1, 'M'):
+            self.assertEqual(udu.last_day(iymd // 1_00), udu.ceil(iymd, 'M'))
+        self.assertEqual(udu.last_day(1900_02), 1900_02_28)
+        self.assertEqual(udu.last_day(2000_02), 2000_02_29)
+
+    def test_errors(self):
+        """ Testing invalid units """
+
+        for function in (udu.truncate, udu.ceil):
+            with self.assertRaises(ValueError):
+                function(2021_01_01, 'D')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End.
@@ -0,0 +1,290 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated.vec module
+Benchmarking against the utils and YMD functions
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import datetime
+import unittest
+
+import numpy as np
+
+import undated as ud
+import undated.daycount as uddc
+import undated.utils as udu
+import undated.vec as udv
+
+# -----------------------------------------------
+
+TEST_IYMDS = np.array([
+    udu.add_days(1583_01_01, i) for i in range(0, udu.days_between(1583_01_01, 9999_12_01), 997)
+] + [
+    2020_01_31, 2020_02_29, 2020_12_31, 2021_02_28, 2021_03_31, 2022_01_01, 2022_01_08, 2022_01_09
+])
+
+SHIFTED_IYMDS = np.roll(TEST_IYMDS, 5)
+
+# -----------------------------------------------
+
+
+class TestVec(unittest.TestCase):
+    """ Tests the vec functions """
+
+    def test_add_days(self):
+        """ Tests add days against the utils function """
+
+        for days in [-400, -31, -1, 0, 1, 29, 365, 100_000]:
+            self.assertEqual(
+                udv.add_days(TEST_IYMDS, days).tolist(),
+                [udu.add_days(int(i), days) for i in TEST_IYMDS],
+                f'Add days: {days}'
+            )
+
+    # ---
+
+    def test_add_months(self):
+        """ Tests add months, with and without periods, against the YMD function """
+
+        for months in [-25, -13, -12, -1, 0, 1, 11, 12, 13, 24]:
+            self.assertEqual(
+                udv.add_months(TEST_IYMDS, months).tolist(),
+                [udu.add_months(int(i), months) for i in TEST_IYMDS],
+                f'Add months: {months}'
+            )
+            self.assertEqual(
+                udv.add_months(TEST_IYMDS, months, period=True).tolist(),
+                [ud.YMD(int(i)).add_months(months, period=True).iymd for i in TEST_IYMDS],
+                f'Add months period: {months}'
+            )
+
+    # ---
+
+    def test_add_weekdays(self):
+        """ Tests add weekdays against the utils function """
+
+        for weekdays in [-11, -5, -1, 0, 1, 4, 5, 6, 400]:
+            self.assertEqual(
+                udv.add_weekdays(TEST_IYMDS, weekdays).tolist(),
+                [udu.add_weekdays(int(i), weekdays) for i in TEST_IYMDS],
+                f'Add weekdays: {weekdays}'
+            )
+
+    # ---
+
+    def test_array_parameters(self):
+        """ Tests the parameters can be arrays, broadcasting with the dates """
+
+        self.assertEqual(udv.add_days(2020_02_28, [1, 2]).tolist(), [2020_02_29, 2020_03_01])
+        self.assertEqual(
+            udv.add_months([2021_01_31, 2021_03_31], [1, -1]).tolist(), [2021_02_28, 2021_02_28]
+        )
+
+    # ---
+
+    def test_components(self):
+        """ Tests the component extraction against the utils functions """
+
+        years, months, days = udv.explode_iymd(TEST_IYMDS)
+        self.assertEqual(years.tolist(), [i // 1_00_00 for i in TEST_IYMDS.tolist()])
+        self.assertEqual(months.tolist(), [(i // 1_00) % 1_00 for i in TEST_IYMDS.tolist()])
+        self.assertEqual(days.tolist(), [i % 1_00 for i in TEST_IYMDS.tolist()])
+
+        self.assertEqual(
+            udv.day_of_year(TEST_IYMDS).tolist(),
+            [udu.days_between((i // 1_00_00 * 1_00_00) + 1_01, i) + 1 for i in TEST_IYMDS.tolist()]
+        )
+        self.assertEqual(
+            udv.days_in_month(TEST_IYMDS).tolist(),
+            [udu.last_day(i // 1_00) % 1_00 for i in TEST_IYMDS.tolist()]
+        )
+        self.assertEqual(udv.days_in_month([2020_02, 2021_02]).tolist(), [29, 28])
+
+    # ---
+
+    def test_predicates(self):
+        """ Tests the predicates against the utils functions """
+
+        self.assertEqual(
+            udv.day_of_week(TEST_IYMDS).tolist(), [udu.day_of_week(i) for i in TEST_IYMDS.tolist()]
+        )
+        self.assertEqual(
+            udv.is_weekday(TEST_IYMDS).tolist(), [udu.is_weekday(i) for i in TEST_IYMDS.tolist()]
+        )
+        self.assertEqual(
+            udv.is_leap_year(range(1583, 2500)).tolist(),
+            [bool(udu.is_leap_year(i)) for i in range(1583, 2500)]
+        )
+        for to_str in [True, False]:
+            self.assertEqual(
+                udv.quarter(TEST_IYMDS, to_str).tolist(),
+                [udu.quarter(i, to_str) for i in TEST_IYMDS.tolist()]
+            )
+
+        invalid = [0, 1582_12_31, 2021_02_29, 2021_13_01, 2021_00_10, 2021_04_31, 2021_04_00]
+        valid = [1583_01_01, 2020_02_29, 9999_12_31, 2021_12]
+        self.assertEqual(
+            udv.is_valid(invalid + valid).tolist(), [udu.is_valid(i) for i in invalid + valid]
+        )
+        self.assertTrue(udv.is_valid(TEST_IYMDS).all())
+
+    # ---
+
+    def test_buckets(self):
+        """ Tests the period keys and labels, against the utils and datetime functions """
+
+        dates = [datetime.date(i // 1_00_00, (i % 1_00_00) // 1_00, i % 1_00) for i in TEST_IYMDS]
+        epochs = udv.epoch_from_iymd(TEST_IYMDS)
+
+        for unit, expected in [
+            ('W', [(d.isocalendar()[0] * 100) + d.isocalendar()[1] for d in dates]),
+            ('M', [int(i) // 1_00 for i in TEST_IYMDS]),
+            ('Q', [(q // 100 * 10) + (q % 100 // 3) for q in (
+                udu.quarter(int(i), False) for i in TEST_IYMDS
+            )]),
+            ('Y', [int(i) // 1_00_00 for i in TEST_IYMDS]),
+        ]:
+            self.assertEqual(udv.bucket(TEST_IYMDS, unit).tolist(), expected, unit)
+            self.assertEqual(udv.epoch_bucket(epochs, unit).tolist(), expected, unit)
+
+        self.assertEqual(
+            udv.bucket_labels(udv.bucket(TEST_IYMDS, 'Q'), 'Q').tolist(),
+            [udu.quarter(int(i)) for i in TEST_IYMDS]
+        )
+        self.assertEqual(
+            udv.bucket_labels([202101, 202153], 'W').tolist(), ['2021-W01', '2021-W53']
+        )
+        self.assertEqual(udv.bucket_labels([[202107]]).tolist(), [['2021-07']])
+        self.assertEqual(udv.bucket_labels(2021, 'Y').tolist(), '2021')
+        with self.assertRaises(ValueError):
+            udv.bucket(TEST_IYMDS, 'D')
+
+    # ---
+
+    def test_iso_calendar(self):
+        """ Tests the ISO week dates and day of the year inverse, against the utils functions """
+
+        year, week, weekday = udv.iso_calendar(TEST_IYMDS)
+        self.assertEqual(
+            list(zip(year.tolist(), week.tolist(), weekday.tolist())),
+            [udu.iso_calendar(int(i)) for i in TEST_IYMDS]
+        )
+        self.assertEqual(udv.from_iso_calendar(year, week, weekday).tolist(), TEST_IYMDS.tolist())
+        self.assertEqual(udv.from_iso_calendar(2021, 1).tolist(), 2021_01_04)
+        self.assertEqual(
+            udv.from_day_of_year(TEST_IYMDS // 1_00_00, udv.day_of_year(TEST_IYMDS)).tolist(),
+            TEST_IYMDS.tolist()
+        )
+
+    # ---
+
+    def test_nth_weekday(self):
+        """ Tests the nth weekday of the months against the utils functions """
+
+        iyms = np.unique(TEST_IYMDS // 1_00)
+        for weekday in (0, 5):
+            for nth in (1, 3, -1, -4):
+                self.assertEqual(
+                    udv.nth_weekday(iyms, weekday, nth).tolist(),
+                    [udu.nth_weekday(int(i), weekday, nth) for i in iyms]
+                )
+            self.assertEqual(
+                udv.last_weekday(iyms, weekday).tolist(),
+                [udu.last_weekday(int(i), weekday) for i in iyms]
+            )
+            self.assertEqual(
+                udv.nth_weekday_range(1999_11, 2001_02, weekday, 2).tolist(),
+                list(udu.nth_weekday_range(1999_11, 2001_02, weekday, 2))
+            )
+        self.assertEqual(udv.nth_weekday([2021_10, 2021_05], [5, 1], [3, -1]).tolist(),
+                         [2021_10_15, 2021_05_31])
+        with self.assertRaises(ValueError):
+            udv.nth_weekday(iyms, 7)
+
+    # ---
+
+    def test_truncate(self):
+        """ Tests the period starts and ends against the utils functions """
+
+        for unit in ('W', 'M', 'Q', 'H', 'Y'):
+            self.assertEqual(
+                udv.truncate(TEST_IYMDS, unit).tolist(),
+                [udu.truncate(int(i), unit) for i in TEST_IYMDS]
+            )
+            self.assertEqual(
+                udv.ceil(TEST_IYMDS, unit).tolist(), [udu.ceil(int(i), unit) for i in TEST_IYMDS]
+            )
+        with self.assertRaises(ValueError):
+            udv.ceil(TEST_IYMDS, 'D')
+
+    # ---
+
+    def test_daycount(self):
+        """ Tests the day counts and year fractions against the daycount functions """
+
+        pairs = list(zip(TEST_IYMDS.tolist(), SHIFTED_IYMDS.tolist()))
+        for convention in uddc.CONVENTIONS:
+            self.assertEqual(
+                udv.day_count(TEST_IYMDS, SHIFTED_IYMDS, convention).tolist(),
+                [uddc.day_count(f, t, convention) for f, t in pairs]
+            )
+            np.testing.assert_allclose(
+                udv.year_fraction(TEST_IYMDS, SHIFTED_IYMDS, convention),
+                [uddc.year_fraction(f, t, convention) for f, t in pairs]
+            )
+        with self.assertRaises(ValueError):
+            udv.year_fraction(TEST_IYMDS, SHIFTED_IYMDS, 'ACT/ACT ICMA')
+
+    # ---
+
+    def test_aggregation(self):
+        """ Tests the counts and sums against a dictionary """
+
+        keys = udv.bucket(TEST_IYMDS, 'Y') // 100
+        counts, sums = {}, {}
+        for key, value in zip(keys.tolist(), TEST_IYMDS.tolist()):
+            counts[key] = counts.get(key, 0) + 1
+            sums[key] = sums.get(key, 0) + value
+
+        unique_keys, key_counts = udv.count_by(keys)
+        self.assertEqual(dict(zip(unique_keys.tolist(), key_counts.tolist())), counts)
+        unique_keys, key_sums = udv.sum_by(keys, TEST_IYMDS)
+        self.assertEqual(dict(zip(unique_keys.tolist(), key_sums.tolist())), sums)
+        self.assertEqual(udv.sum_by([], [])[0].tolist(), [])
+
+    # ---
+
+    def test_betweens(self):
+        """ Tests the between functions against the utils functions """
+
+        pairs = list(zip(TEST_IYMDS.tolist(), SHIFTED_IYMDS.tolist()))
+
+        self.assertEqual(
+            udv.days_between(TEST_IYMDS, SHIFTED_IYMDS).tolist(),
+            [udu.days_between(f, t) for f, t in pairs]
+        )
+        self.assertEqual(
+            udv.months_between(TEST_IYMDS, SHIFTED_IYMDS).tolist(),
+            [udu.months_between(f, t) for f, t in pairs]
+        )
+        for inclusive in [False, True]:
+            self.assertEqual(
+                udv.weekdays_between(TEST_IYMDS, SHIFTED_IYMDS, inclusive).tolist(),
+                [udu.weekdays_between(f, t, inclusive) for f, t in pairs]
+            )
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End
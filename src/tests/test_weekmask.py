@@ -0,0 +1,138 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated module.
+Benchmarking the weekmask functions against stepping one day at a time.
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import unittest
+
+import undated as ud
+import undated._core as udc
+import undated.utils as udu
+
+# -----------------------------------------------
+
+WEEKMASKS = (ud.WEEKMASK_MON_SAT, ud.WEEKMASK_SAT_THU, ud.WEEKMASK_SUN_THU, 0b1000001, 1 << 3)
+
+FIRST_EPOCH = udc.epoch_from_parts(2022, 1, 1)
+
+# -----------------------------------------------
+
+
+def is_working_day(epoch, weekmask):
+    """ Brute force working day check """
+    return bool((weekmask >> udc.day_of_week(epoch)) & 1)
+
+
+# -----------------------------------------------
+
+
+class TestWeekmask(unittest.TestCase):
+    """ Tests the weekmask parameters """
+
+    def test_add_weekdays(self):
+        """ Tests adding weekmask days, stepping one day at a time """
+
+        for weekmask in WEEKMASKS:
+            for epoch in range(FIRST_EPOCH, FIRST_EPOCH + 14):
+                if not is_working_day(epoch, weekmask):
+                    continue
+                expected = epoch
+                for days in range(1, 20):
+                    expected += 1
+                    while not is_working_day(expected, weekmask):
+                        expected += 1
+                    answer = udc.epoch_from_parts(*udc.add_weekdays(epoch, days, weekmask))
+                    self.assertEqual(answer, expected, f'{weekmask}: {epoch} + {days}')
+                    answer = udc.epoch_from_parts(*udc.add_weekdays(expected, -days, weekmask))
+                    self.assertEqual(answer, epoch, f'{weekmask}: {expected} - {days}')
+
+    # ---
+
+    def test_weekdays_between(self):
+        """ Tests counting weekmask days, stepping one day at a time """
+
+        for weekmask in WEEKMASKS + (ud.WEEKMASK_MON_FRI,):
+            for from_epoch in range(FIRST_EPOCH, FIRST_EPOCH + 14):
+                expected = 0
+                for to_epoch in range(from_epoch + 1, from_epoch + 30):
+                    expected += is_working_day(to_epoch, weekmask)
+                    self.assertEqual(
+                        udc.weekdays_between_epochs(from_epoch, to_epoch, False, weekmask),
+                        expected, f'{weekmask}: {from_epoch} to {to_epoch}'
+                    )
+                    self.assertEqual(
+                        udc.weekdays_between_epochs(to_epoch, from_epoch, False, weekmask),
+                        -expected, f'{weekmask}: {to_epoch} to {from_epoch}'
+                    )
+
+    # ---
+
+    def test_mon_fri_fast_path(self):
+        """ Tests the monday to friday fast path, against the calendar weekmask ordinals """
+
+        calendar = ud.BusinessCalendar()
+        for epoch in range(FIRST_EPOCH, FIRST_EPOCH + 28):
+            for days in range(-12, 13):
+                self.assertEqual(
+                    udc.add_weekdays_to_epoch(epoch, days), calendar.add(epoch, days),
+                    f'{epoch} + {days}'
+                )
+                self.assertEqual(
+                    udc.weekdays_between_epochs(epoch, epoch + days),
+                    calendar.count(epoch, epoch + days), f'{epoch} to {epoch + days}'
+                )
+
+    # ---
+
+    def test_entry_points(self):
+        """ Tests the utils and YMD functions """
+
+        mondays = 1 << 1
+        self.assertEqual(udu.weekdays_between(2022_01_01, 2022_12_31, weekmask=mondays), 52)
+        self.assertEqual(udu.weekdays_between(2022_01_03, 2022_01_31, True, weekmask=mondays), 5)
+        self.assertEqual(udu.add_weekdays(2022_01_06, 1, weekmask=ud.WEEKMASK_SUN_THU), 2022_01_09)
+        self.assertTrue(udu.is_weekday(2022_01_09, weekmask=ud.WEEKMASK_SUN_THU))
+        self.assertFalse(udu.is_weekday(2022_01_07, weekmask=ud.WEEKMASK_SUN_THU))
+        self.assertEqual(
+            udu.roll_weekday(2022_01_07, ud.PRECEDING, weekmask=ud.WEEKMASK_SUN_THU), 2022_01_06
+        )
+
+        ymd = ud.YMD(2022_01_08)
+        self.assertEqual(ymd.add_weekdays(1, weekmask=ud.WEEKMASK_MON_SAT), 2022_01_10)
+        self.assertTrue(ymd.is_weekday(weekmask=ud.WEEKMASK_MON_SAT))
+        self.assertEqual(ymd.roll_weekday(weekmask=ud.WEEKMASK_SAT_THU), 2022_01_08)
+        self.assertEqual(
+            ud.weekdays_between(ymd, ud.YMD(2022_01_15), weekmask=ud.WEEKMASK_SAT_THU), 6
+        )
+
+        calendar = ud.BusinessCalendar([2022_01_09], ud.WEEKMASK_SUN_THU)
+        self.assertEqual(udu.add_weekdays(2022_01_06, 1, calendar), 2022_01_10)
+
+    # ---
+
+    def test_invalid(self):
+        """ Tests invalid weekmasks are rejected """
+
+        for weekmask in [0, 128, -1]:
+            with self.assertRaises(ValueError):
+                udu.add_weekdays(2022_01_03, 1, weekmask=weekmask)
+            with self.assertRaises(ValueError):
+                ud.BusinessCalendar(weekmask=weekmask)
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End
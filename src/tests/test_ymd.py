@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated module
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import copy
+import pickle
+import unittest
+
+import undated as ud
+
+# -----------------------------------------------
+
+
+class TestYMD(unittest.TestCase):
+    """ Tests the YMD class """
+
+    def test_compare(self):
+        """ Testing comparisons between YMD class objects and ints """
+
+        ymd1, ymd2 = ud.YMD(2022_07_04), ud.YMD(2022_07_05)
+        for other in (ymd2, 2022_07_05):
+            self.assertTrue(ymd1 < other)
+            self.assertTrue(ymd1 <= other)
+            self.assertFalse(ymd1 == other)
+            self.assertTrue(ymd1 != other)
+            self.assertFalse(ymd1 >= other)
+            self.assertFalse(ymd1 > other)
+        self.assertEqual(ymd1, ud.YMD(2022, 7, 4))
+        self.assertEqual(repr([ymd1]), '[20220704]')
+        self.assertEqual(sorted([ymd2, ymd1, ud.YMD(2021_12_31)]), [2021_12_31, ymd1, ymd2])
+
+    def test_hash(self):
+        """ Testing YMD class objects as dictionary keys and set members """
+
+        ymds = [ud.YMD(2022_07_04), ud.YMD(2022_07_05), ud.YMD(2022_07_04, trusted=True)]
+        self.assertEqual(hash(ymds[0]), hash(2022_07_04))
+        self.assertEqual(len(set(ymds)), 2)
+        self.assertEqual({ymd: 1 for ymd in ymds}.keys(), {2022_07_04, 2022_07_05})
+        self.assertIn(2022_07_05, set(ymds))
+        self.assertIn(ud.YMD(2022_07_05), {2022_07_05})
+
+    def test_immutable(self):
+        """ Testing the attributes can not be modified, or added """
+
+        ymd = ud.YMD(2022_07_04)
+        for key in ('iymd', 'year', 'month', 'day', 'status', 'other'):
+            with self.assertRaises(AttributeError):
+                setattr(ymd, key, 1)
+            with self.assertRaises(AttributeError):
+                delattr(ymd, key)
+        self.assertFalse(hasattr(ymd, '__dict__'))
+        self.assertFalse(hasattr(ud.YMD(0), '__dict__'))
+
+    def test_epoch(self):
+        """ Testing the epoch, calculated or carried forward from the calculations """
+
+        ymd = ud.YMD(2022_07_04)
+        self.assertEqual(ymd.epoch(), ud.epoch_to_ymd(ymd.epoch()).epoch())
+        self.assertEqual(ymd.add_days(30).epoch(), ymd.epoch() + 30)
+        self.assertEqual(ymd.add_weekdays(5).epoch(), ymd.epoch() + 7)
+        self.assertEqual(ymd.add_weekdays(5, weekmask=ud.WEEKMASK_SUN_THU).epoch(), ymd.epoch() + 7)
+        self.assertEqual(ud.epoch_to_ymd(ymd.epoch()).status, ud.TRUSTED)
+        self.assertIsNone(ud.YMD(2022_02_30).epoch())
+
+    def test_pickle(self):
+        """ Testing pickling and copying """
+
+        for ymd in (ud.YMD(2022_07_04), ud.YMD(2022_07_04, trusted=True), ud.YMD(0)):
+            for other in (pickle.loads(pickle.dumps(ymd)), copy.copy(ymd), copy.deepcopy(ymd)):
+                self.assertEqual(
+                    (other.iymd, other.year, other.month, other.day, other.status),
+                    (ymd.iymd, ymd.year, ymd.month, ymd.day, ymd.status)
+                )
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End.
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Unit tests for the undated module
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import copy
+import pickle
+import unittest
+
+import undated as ud
+
+# -----------------------------------------------
+
+IYMDS = [2020_02_29, 2021_12_31, 2022_07_02, 2022_07_04, 2023_01_31]
+
+# -----------------------------------------------
+
+
+class TestYMDArray(unittest.TestCase):
+    """ Tests the YMDArray class, against the YMD class methods """
+
+    def test_access(self):
+        """ Testing element access, slicing, iteration and copying """
+
+        dates = ud.YMDArray(ud.YMD(iymd) for iymd in IYMDS)
+        self.assertIsInstance(dates[0], ud.YMD)
+        self.assertEqual(dates[-1], 2023_01_31)
+        self.assertIsInstance(dates[1:3], ud.YMDArray)
+        self.assertEqual(list(dates[1:3]), IYMDS[1:3])
+        self.assertEqual(list(dates), IYMDS)
+        self.assertEqual(memoryview(dates).tolist(), IYMDS)
+        self.assertEqual(repr(dates[:1]), 'YMDArray([20200229])')
+        for other in (pickle.loads(pickle.dumps(dates)), copy.copy(dates), copy.deepcopy(dates)):
+            self.assertIsInstance(other, ud.YMDArray)
+            self.assertEqual(list(other), IYMDS)
+
+    def test_epochs(self):
+        """ Testing the epoch conversions """
+
+        dates = ud.YMDArray(IYMDS)
+        epochs = [ud.YMD(iymd).epoch() for iymd in IYMDS]
+        self.assertEqual(list(dates.epochs()), epochs)
+        self.assertEqual(list(ud.YMDArray.from_epochs(epochs)), IYMDS)
+
+    def test_methods(self):
+        """ Testing the bulk methods against the YMD class methods """
+
+        dates = ud.YMDArray(IYMDS)
+        calendar = ud.BusinessCalendar([ud.YMD(2022_07_04).epoch()])
+        ymds = [ud.YMD(iymd) for iymd in IYMDS]
+
+        for number in (-40, -1, 0, 1, 3, 40):
+            self.assertEqual(list(dates.add_days(number)), [y.add_days(number) for y in ymds])
+            for period in (False, True):
+                self.assertEqual(
+                    list(dates.add_months(number, period)),
+                    [y.add_months(number, period) for y in ymds]
+                )
+                self.assertEqual(
+                    list(dates.add_years(number, period)),
+                    [y.add_years(number, period) for y in ymds]
+                )
+            for kwargs in ({}, {'calendar': calendar}, {'weekmask': ud.WEEKMASK_SUN_THU}):
+                self.assertEqual(
+                    list(dates.add_weekdays(number, **kwargs)),
+                    [y.add_weekdays(number, **kwargs) for y in ymds]
+                )
+
+        for kwargs in ({}, {'calendar': calendar}, {'weekmask': ud.WEEKMASK_SUN_THU}):
+            self.assertEqual(dates.is_weekday(**kwargs), [y.is_weekday(**kwargs) for y in ymds])
+            for convention in (ud.FOLLOWING, ud.MODIFIED_PRECEDING):
+                self.assertEqual(
+                    list(dates.roll_weekday(convention, **kwargs)),
+                    [y.roll_weekday(convention, **kwargs) for y in ymds]
+                )
+
+        self.assertEqual(list(dates.day_of_week()), [y.day_of_week() for y in ymds])
+        self.assertEqual(dates.is_leap_year(), [y.is_leap_year() for y in ymds])
+        self.assertEqual(dates.quarter(), [ud.quarter(y) for y in ymds])
+        self.assertEqual(list(dates.quarter(False)), [ud.quarter(y, False) for y in ymds])
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+# -----------------------------------------------
+# End.
@@ -15,11 +15,42 @@ when using dates that are int type
 import datetime
 import timeit
 
+import undated._core as udc
 import undated.utils as udu
 
 # -----------------------------------------------
 
 
+def looped_epoch_to_parts(epoch):
+    """ The previous epoch_to_parts, with correction and month loops, for comparison """
+
+    year, day = epoch // 365, epoch % 365
+
+    if day == 0:
+        year -= 1
+        day = 365
+
+    prior_year = year - 1
+    day -= (prior_year // 4) - (prior_year // 100) + (prior_year // 400)
+
+    while day <= 0:
+        year -= 1
+        day += 366 if udc.is_leap_year(year) else 365
+
+    leap_year = udc.is_leap_year(year)
+
+    month = 1
+    while udc.DAYS_SO_FAR[leap_year][month + 1] < day:
+        month += 1
+
+    day -= udc.DAYS_SO_FAR[leap_year][month]
+
+    return year, month, day
+
+
+# -----------------------------------------------
+
+
 def run_timings(number=10_000, ymd=2020_01_15, days=None):
     """ Executes the timing routine """
 
@@ -36,10 +67,29 @@ def run_timings(number=10_000, ymd=2020_01_15, days=None):
         print(f'-DateTime..: {test_b}')
 
 
+# -----------------------------------------------
+
+
+def run_epoch_timings(number=10_000, iymds=None):
+    """ Executes the epoch_to_parts timing routine, closed form against the previous loops """
+
+    if not iymds:
+        iymds = [2020_01_15, 2020_06_15, 2020_12_31, 2021_01_01]
+
+    for iymd in iymds:
+        epoch = udc.epoch_from_parts(*udc.explode_iymd(iymd))
+        print(f'\nTiming epoch to parts: {iymd}')
+        test_a = timeit.timeit(lambda e=epoch: udc.epoch_to_parts(e), number=number)
+        print(f'-Closed form...: {test_a}')
+        test_b = timeit.timeit(lambda e=epoch: looped_epoch_to_parts(e), number=number)
+        print(f'-Looped........: {test_b}')
+
+
 # -----------------------------------------------
 
 if __name__ == '__main__':
     run_timings()
+    run_epoch_timings()
 
 # -----------------------------------------------
 # End.
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check converting a column of dates with as_iymd_many and as_iymd_array,
+against as_parts and glue_parts for each date
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import timeit
+
+import undated.fmts as udf
+import undated.utils as udu
+
+# -----------------------------------------------
+
+
+def glued_parts(sdates, fmt):
+    """ Converts the dates with as_parts, gluing the parts """
+
+    iymds = []
+    for sdate in sdates:
+        parts = udf.as_parts(sdate, fmt)
+        iymds.append((parts[0] * 1_00_00) + (parts[1] * 1_00) + parts[2] if parts else None)
+    return iymds
+
+
+# -----------------------------------------------
+
+
+def run_timings(number=10, years=100):
+    """ Executes the timing routine """
+
+    iymds = list(udu.date_range(2000_01_01, udu.add_months(2000_01_01, years * 12)))
+    for fmt, sdates in (
+            ('Ymd', [str(i) for i in iymds]),
+            ('d-m-Y', [f'{i % 1_00:02}-{(i // 1_00) % 1_00:02}-{i // 1_00_00}' for i in iymds])):
+        udfmt = udf.convert_format(fmt)
+
+        print(f'\nTiming column: {fmt}, {len(sdates)} dates')
+        test_a = timeit.timeit(lambda f=udfmt, s=sdates: glued_parts(s, f), number=number)
+        print(f'-As parts.....: {test_a}')
+        test_b = timeit.timeit(
+            lambda f=udfmt, s=sdates: list(udf.as_iymd_many(s, f)), number=number
+        )
+        print(f'-As iymd many.: {test_b}')
+        test_c = timeit.timeit(lambda f=udfmt, s=sdates: udf.as_iymd_array(s, f), number=number)
+        print(f'-As iymd array: {test_c}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check the vec bucketing against grouping by the utils quarter function
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import timeit
+
+import numpy as np
+
+import undated.utils as udu
+import undated.vec as udv
+
+# -----------------------------------------------
+
+
+def count_quarters(iymds):
+    """ Counts the dates in each quarter, with the utils function and a dictionary """
+
+    counts = {}
+    for iymd in iymds:
+        label = udu.quarter(iymd)
+        counts[label] = counts.get(label, 0) + 1
+    return counts
+
+
+# -----------------------------------------------
+
+
+def count_buckets(iymds):
+    """ Counts the dates in each quarter, with the vec bucketing """
+
+    keys, counts = udv.count_by(udv.bucket(iymds, 'Q'))
+    return dict(zip(udv.bucket_labels(keys, 'Q').tolist(), counts.tolist()))
+
+
+# -----------------------------------------------
+
+
+def run_timings(number=10, size=100_000):
+    """ Executes the timing routine """
+
+    iymds = udv.add_days(2018_01_01, np.random.default_rng(0).integers(0, 2000, size))
+    iymd_list = iymds.tolist()
+
+    print(f'\nTiming count per quarter: {size} dates')
+    test_a = timeit.timeit(lambda: count_buckets(iymds), number=number)
+    print(f'-Vec bucket...: {test_a}')
+    test_b = timeit.timeit(lambda: count_quarters(iymd_list), number=number)
+    print(f'-Utils quarter: {test_b}')
+
+    print(f'\nTiming quarter labels: {size} dates')
+    test_a = timeit.timeit(lambda: udv.quarter(iymds), number=number)
+    print(f'-Vec quarter..: {test_a}')
+    test_b = timeit.timeit(lambda: [udu.quarter(iymd) for iymd in iymd_list], number=number)
+    print(f'-Utils quarter: {test_b}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
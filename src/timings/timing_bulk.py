@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check the parse, add_months and quarter pipeline on a column with few distinct dates,
+factorized with the bulk module, against each row
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import timeit
+
+import numpy as np
+
+import undated.fmts as udf
+import undated.utils as udu
+
+from undated import bulk as udb
+
+# -----------------------------------------------
+
+
+def each_row(sdates):
+    """ Runs the pipeline on each row """
+
+    return [
+        None if iymd is None else udu.quarter(udu.add_months(iymd, 3))
+        for iymd in udf.as_iymd_many(sdates, 'd-m-Y')
+    ]
+
+
+# -----------------------------------------------
+
+
+def factorized(sdates):
+    """ Runs the pipeline on the unique values """
+
+    return udb.factorize(sdates).parse('d-m-Y').apply(udu.add_months, 3).apply(
+        udu.quarter).broadcast()
+
+
+# -----------------------------------------------
+
+
+def run_timings(number=10, rows=100_000):
+    """ Executes the timing routine """
+
+    distinct = [f'{i % 1_00:02}-{(i // 1_00) % 1_00:02}-{i // 1_00_00}'
+                for i in udu.date_range(2022_01_01, 2022_03_31)]
+    sdates = [distinct[i % len(distinct)] for i in range(rows)]
+
+    print(f'\nTiming column: {len(sdates)} dates, compression '
+          f'{udb.factorize(sdates).compression}')
+    test_a = timeit.timeit(lambda: each_row(sdates), number=number)
+    print(f'-Each row.....: {test_a}')
+    test_b = timeit.timeit(lambda: factorized(sdates), number=number)
+    print(f'-Factorized...: {test_b}')
+    test_c = timeit.timeit(lambda s=np.array(sdates): factorized(s), number=number)
+    print(f'-NumPy........: {test_c}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check date_range against repeatedly adding days and months
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import timeit
+
+import undated.utils as udu
+
+# -----------------------------------------------
+
+
+def add_days_range(start, end):
+    """ Generates the days using add_days """
+
+    iymd = start
+    while iymd <= end:
+        yield iymd
+        iymd = udu.add_days(iymd, 1)
+
+
+# -----------------------------------------------
+
+
+def add_months_range(start, end):
+    """ Generates the months using add_months, from the start date """
+
+    months = 0
+    iymd = start
+    while iymd <= end:
+        yield iymd
+        months += 1
+        iymd = udu.add_months(start, months)
+
+
+# -----------------------------------------------
+
+
+def run_timings(number=10, start=2018_01_31, end=2022_12_31):
+    """ Executes the timing routine """
+
+    print(f'\nTiming daily range: {start} to {end}')
+    test_a = timeit.timeit(lambda: list(udu.date_range(start, end)), number=number)
+    print(f'-Date range...: {test_a}')
+    test_b = timeit.timeit(lambda: list(add_days_range(start, end)), number=number)
+    print(f'-Add days.....: {test_b}')
+    test_c = timeit.timeit(lambda: list(range(start, start + udu.days_between(start, end) + 1)),
+                           number=number)
+    print(f'-Int range....: {test_c}')
+
+    print(f'\nTiming month end range: {start} to {end}')
+    test_a = timeit.timeit(lambda: list(udu.date_range(start, end, unit='M')), number=number)
+    print(f'-Date range...: {test_a}')
+    test_b = timeit.timeit(lambda: list(add_months_range(start, end)), number=number)
+    print(f'-Add months...: {test_b}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
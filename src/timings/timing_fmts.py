@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check the compiled format parsers against as_parts with each format
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import timeit
+
+import undated.fmts as udf
+
+# -----------------------------------------------
+
+
+def run_timings(number=10_000, formats=None):
+    """ Executes the timing routine """
+
+    if not formats:
+        formats = (('Ymd', '20210612'), ('Ymd', 20210612), ('d-m-Y', '12-06-2021'),
+                   ('d-M-y', '12-JUN-21'))
+
+    for fmt, sdate in formats:
+        udfmt = udf.convert_format(fmt)
+        parser = udfmt.compile()
+        print(f'\nTiming format: {fmt} {sdate!r}')
+        test_a = timeit.timeit(lambda f=fmt, s=sdate: udf.as_parts(s, f), number=number)
+        print(f'-String format.: {test_a}')
+        test_b = timeit.timeit(lambda f=udfmt, s=sdate: udf.as_parts(s, f), number=number)
+        print(f'-Undated format: {test_b}')
+        test_c = timeit.timeit(lambda p=parser, s=sdate: p(s), number=number)
+        print(f'-Compiled......: {test_c}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check the holiday rules, kept by year, against calculating them each time
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import timeit
+
+import undated as ud
+
+from undated import holidays as udh
+
+# -----------------------------------------------
+
+RULES = [
+    udh.fixed("New Year's Day", 1, 1, udh.NEAREST_WEEKDAY),
+    udh.nth_weekday('Martin Luther King Jr. Day', 1, 1, 3),
+    udh.nth_weekday("Washington's Birthday", 2, 1, 3),
+    udh.nth_weekday('Memorial Day', 5, 1, -1),
+    udh.fixed('Independence Day', 7, 4, udh.NEAREST_WEEKDAY),
+    udh.nth_weekday('Labor Day', 9, 1, 1),
+    udh.nth_weekday('Thanksgiving Day', 11, 4, 4),
+    udh.fixed('Christmas Day', 12, 25, udh.NEAREST_WEEKDAY)
+]
+
+# -----------------------------------------------
+
+
+def run_timings(number=1_000, first_year=2000, last_year=2050):
+    """ Executes the timing routine """
+
+    holidays = udh.HolidayRules(RULES)
+    iymds = list(holidays.dates(first_year, last_year))
+
+    print(f'\nTiming holiday epochs: {first_year} to {last_year}')
+    test_a = timeit.timeit(lambda: holidays.epochs(first_year, last_year), number=number)
+    print(f'-Kept......: {test_a}')
+    test_b = timeit.timeit(
+        lambda: udh.HolidayRules(RULES).epochs(first_year, last_year), number=number
+    )
+    print(f'-Calculated: {test_b}')
+
+    print(f'\nTiming business calendar: {first_year} to {last_year}')
+    test_a = timeit.timeit(lambda: holidays.calendar(first_year, last_year), number=number)
+    print(f'-Rules.....: {test_a}')
+    test_b = timeit.timeit(lambda: ud.BusinessCalendar(iymds), number=number)
+    print(f'-Dates.....: {test_b}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
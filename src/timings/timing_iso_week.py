@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check the ISO week and day of the year functions against datetime
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import datetime
+import timeit
+
+import undated as ud
+import undated.utils as udu
+
+# -----------------------------------------------
+
+
+def datetime_isocalendar(iymd):
+    """ The ISO week date, converting to datetime """
+
+    return datetime.date(iymd // 1_00_00, (iymd % 1_00_00) // 1_00, iymd % 1_00).isocalendar()
+
+
+# -----------------------------------------------
+
+
+def datetime_day_of_year(iymd):
+    """ The day of the year, converting to datetime """
+
+    date = datetime.date(iymd // 1_00_00, (iymd % 1_00_00) // 1_00, iymd % 1_00)
+    return date.toordinal() - datetime.date(date.year, 1, 1).toordinal() + 1
+
+
+# -----------------------------------------------
+
+
+def run_timings(number=10_000, iymds=None):
+    """ Executes the timing routine """
+
+    if not iymds:
+        iymds = [2021_01_01, 2022_07_04]
+
+    for iymd in iymds:
+        ymd = ud.YMD(iymd)
+        print(f'\nTiming ISO calendar: {iymd}')
+        test_a = timeit.timeit(lambda x=ymd: x.iso_calendar(), number=number)
+        print(f'-Tools......: {test_a}')
+        test_b = timeit.timeit(lambda x=iymd: udu.iso_calendar(x), number=number)
+        print(f'-Utils......: {test_b}')
+        test_c = timeit.timeit(lambda x=iymd: datetime_isocalendar(x), number=number)
+        print(f'-Datetime...: {test_c}')
+
+        iso = udu.iso_calendar(iymd)
+        print(f'\nTiming from ISO calendar: {iso}')
+        test_a = timeit.timeit(lambda x=iso: udu.from_iso_calendar(*x), number=number)
+        print(f'-Utils......: {test_a}')
+        test_b = timeit.timeit(lambda x=iso: datetime.date.fromisocalendar(*x), number=number)
+        print(f'-Datetime...: {test_b}')
+
+        print(f'\nTiming day of year: {iymd}')
+        test_a = timeit.timeit(lambda x=iymd: udu.day_of_year(x), number=number)
+        print(f'-Utils......: {test_a}')
+        test_b = timeit.timeit(lambda x=iymd: datetime_day_of_year(x), number=number)
+        print(f'-Datetime...: {test_b}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
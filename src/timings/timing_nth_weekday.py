@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check the nth weekday functions against stepping through the days of the month
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import timeit
+
+import undated.utils as udu
+import undated.vec as udv
+
+# -----------------------------------------------
+
+
+def stepped_third_friday(iym):
+    """ The third friday of the month, stepping with add_days and day_of_week """
+
+    iymd = udu.first_day(iym)
+    while udu.day_of_week(iymd) != 5:
+        iymd = udu.add_days(iymd, 1)
+    return udu.add_days(iymd, 14)
+
+
+# -----------------------------------------------
+
+
+def run_timings(number=100, from_iym=2000_01, to_iym=2049_12):
+    """ Executes the timing routine """
+
+    iyms = [iymd // 1_00 for iymd in udu.date_range(from_iym * 100 + 1, to_iym * 100 + 1, 1, 'M')]
+
+    print(f'\nTiming third fridays: {from_iym} to {to_iym}')
+    test_a = timeit.timeit(lambda: [stepped_third_friday(i) for i in iyms], number=number)
+    print(f'-Stepped.....: {test_a}')
+    test_b = timeit.timeit(lambda: [udu.nth_weekday(i, 5, 3) for i in iyms], number=number)
+    print(f'-Nth weekday.: {test_b}')
+    test_c = timeit.timeit(lambda: udu.nth_weekday_range(from_iym, to_iym, 5, 3), number=number)
+    print(f'-Utils range.: {test_c}')
+    test_d = timeit.timeit(lambda: udv.nth_weekday_range(from_iym, to_iym, 5, 3), number=number)
+    print(f'-Vec range...: {test_d}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
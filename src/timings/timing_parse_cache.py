@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check converting a column with few distinct dates, with and without the cache
+of the UndatedFormat
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import timeit
+
+import undated.fmts as udf
+import undated.utils as udu
+
+# -----------------------------------------------
+
+
+def run_timings(number=10, rows=100_000):
+    """ Executes the timing routine """
+
+    distinct = [f'{i % 1_00:02}-{(i // 1_00) % 1_00:02}-{i // 1_00_00}'
+                for i in udu.date_range(2022_01_01, 2022_03_31)]
+    sdates = [distinct[i % len(distinct)] for i in range(rows)]
+
+    print(f'\nTiming column: {len(sdates)} dates, {len(distinct)} distinct')
+    for cached in (False, True):
+        udfmt = udf.Deriver().search(distinct)
+        if cached:
+            udfmt.enable_cache()
+        test = timeit.timeit(lambda f=udfmt: udf.as_iymd_array(sdates, f), number=number)
+        print(f'-{"Cached" if cached else "Uncached":.<13}: {test}')
+        if cached:
+            info = udfmt.cache_info()['iymd']
+            print(f'-Hit rate.....: {info.hits / (info.hits + info.misses)}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check the schedule generator against stepping with YMD add_months and roll_weekday
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import timeit
+
+import undated as ud
+
+from undated import schedule as uds
+
+# -----------------------------------------------
+
+
+def ymd_schedule(start, end, months, convention):
+    """ A short front stub schedule, stepping back from the end date with the YMD class """
+
+    end_ymd = ud.YMD(end)
+    dates = [end]
+    while True:
+        ymd = end_ymd.add_months(-months * len(dates))
+        if int(ymd) <= start:
+            break
+        dates.append(int(ymd))
+    dates.append(start)
+    return [int(ud.YMD(iymd).roll_weekday(convention)) for iymd in reversed(dates)]
+
+
+# -----------------------------------------------
+
+
+def run_timings(number=1_000):
+    """ Executes the timing routine """
+
+    for start, end, months in ((2021_01_15, 2031_01_15, 3), (2021_01_15, 2051_01_15, 1)):
+        print(f'\nTiming schedule: {start} to {end}, every {months} months')
+        test_a = timeit.timeit(
+            lambda a=start, b=end, c=months: uds.generate(a, b, c, convention=ud.FOLLOWING),
+            number=number
+        )
+        print(f'-Schedule: {test_a}')
+        test_b = timeit.timeit(
+            lambda a=start, b=end, c=months: ymd_schedule(a, b, c, ud.FOLLOWING), number=number
+        )
+        print(f'-YMD.....: {test_b}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
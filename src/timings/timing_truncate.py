@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check the month ends of last_day and ceil against adding a month
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import timeit
+
+import numpy as np
+
+import undated.utils as udu
+import undated.vec as udv
+
+# -----------------------------------------------
+
+
+def added_month_end(iymd):
+    """ The month end, adding a month to the first of the month and taking a day """
+
+    return udu.add_days(udu.add_months(udu.first_day(iymd // 1_00), 1), -1)
+
+
+# -----------------------------------------------
+
+
+def run_timings(number=10, size=100_000):
+    """ Executes the timing routine """
+
+    iymds = udv.add_days(2000_01_01, np.random.default_rng(0).integers(0, 10_000, size))
+    iymd_list = iymds.tolist()
+
+    print(f'\nTiming month ends: {size} dates')
+    test_a = timeit.timeit(lambda: [added_month_end(i) for i in iymd_list], number=number)
+    print(f'-Add months: {test_a}')
+    test_b = timeit.timeit(lambda: [udu.last_day(i // 1_00) for i in iymd_list], number=number)
+    print(f'-Last day..: {test_b}')
+    test_c = timeit.timeit(lambda: [udu.ceil(i) for i in iymd_list], number=number)
+    print(f'-Utils ceil: {test_c}')
+    test_d = timeit.timeit(lambda: udv.ceil(iymds), number=number)
+    print(f'-Vec ceil..: {test_d}')
+
+    print(f'\nTiming week starts: {size} dates')
+    test_a = timeit.timeit(lambda: [udu.truncate(i, 'W') for i in iymd_list], number=number)
+    print(f'-Utils truncate: {test_a}')
+    test_b = timeit.timeit(lambda: udv.truncate(iymds, 'W'), number=number)
+    print(f'-Vec truncate..: {test_b}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
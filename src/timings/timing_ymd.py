@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check the slotted YMD class against the previous dictionary based class,
+for construction time and memory
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    The previous class is reduced to the initialisation and epoch property
+"""
+# -----------------------------------------------
+
+import timeit
+import tracemalloc
+
+import undated as ud
+import undated._core as udc
+
+# -----------------------------------------------
+
+_EPOCH = 1
+
+# -----------------------------------------------
+
+
+class DictYMD:
+    """ The previous YMD class, with a per instance dictionary and __setattr__ guard """
+
+    status: int = None
+
+    def __init__(self, year_or_iymd, trusted=False):
+        """ Initialises the class """
+
+        self._properties = {}
+        self.iymd = year_or_iymd
+        self.year = year_or_iymd // 1_00_00
+        self.month = (year_or_iymd % 1_00_00) // 1_00
+        self.day = year_or_iymd % 1_00
+
+        if trusted:
+            self.status = ud.TRUSTED
+        elif udc.is_valid(self.year, self.month, self.day):
+            self.status = ud.VALID
+        else:
+            self.iymd = self.year = self.month = self.day = None
+            self.status = ud.INVALID
+
+    def __setattr__(self, key, value):
+        """ Assurance that the date has not been manually modifed """
+
+        if self.status:
+            raise AttributeError('Unable to modify YMD')
+        self.__dict__[key] = value
+
+    def epoch(self):
+        """ The epoch, added when first needed """
+
+        if self.status == ud.INVALID:
+            return None
+        if _EPOCH not in self._properties:
+            self._properties[_EPOCH] = udc.epoch_from_parts(self.year, self.month, self.day)
+        return self._properties[_EPOCH]
+
+
+# -----------------------------------------------
+
+
+def measure_memory(ymd_class, iymds):
+    """ Measures the memory allocated by creating the class objects, with their epochs """
+
+    tracemalloc.start()
+    objects = [ymd_class(iymd) for iymd in iymds]
+    for obj in objects:
+        obj.epoch()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size // len(objects)
+
+
+# -----------------------------------------------
+
+
+def run_timings(number=10, start=2018_01_01, end=2022_12_31):
+    """ Executes the timing routine """
+
+    iymds = [ymd.iymd for ymd in map(ud.epoch_to_ymd, range(
+        ud.YMD(start).epoch(), ud.YMD(end).epoch() + 1
+    ))]
+
+    print(f'\nTiming construction: {start} to {end}')
+    test_a = timeit.timeit(lambda: [ud.YMD(iymd) for iymd in iymds], number=number)
+    print(f'-Slots YMD....: {test_a}')
+    test_b = timeit.timeit(lambda: [DictYMD(iymd) for iymd in iymds], number=number)
+    print(f'-Dict YMD.....: {test_b}')
+
+    print(f'\nTiming construction, trusted: {start} to {end}')
+    test_a = timeit.timeit(lambda: [ud.YMD(iymd, trusted=True) for iymd in iymds], number=number)
+    print(f'-Slots YMD....: {test_a}')
+    test_b = timeit.timeit(lambda: [DictYMD(iymd, True) for iymd in iymds], number=number)
+    print(f'-Dict YMD.....: {test_b}')
+
+    print(f'\nMemory per object, in bytes: {start} to {end}')
+    print(f'-Slots YMD....: {measure_memory(ud.YMD, iymds)}')
+    print(f'-Dict YMD.....: {measure_memory(DictYMD, iymds)}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+# -----------------------------------------------
+"""
+Timing to check YMDArray against a list of YMD class objects, for time and memory
+
+**ASSUMPTIONS**
+    No assumptions to note
+
+**LIMITATIONS**
+    No limitations to note
+"""
+# -----------------------------------------------
+
+import timeit
+import tracemalloc
+
+import undated as ud
+
+# -----------------------------------------------
+
+
+def measure_memory(create, iymds):
+    """ Measures the memory allocated by creating the column of dates """
+
+    tracemalloc.start()
+    column = create(iymds)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del column
+    return size // len(iymds)
+
+
+# -----------------------------------------------
+
+
+def run_timings(number=10, start=2018_01_01, end=2022_12_31):
+    """ Executes the timing routine """
+
+    epochs = range(ud.YMD(start).epoch(), ud.YMD(end).epoch() + 1)
+    ymds = [ud.epoch_to_ymd(epoch) for epoch in epochs]
+    dates = ud.YMDArray(ymds)
+
+    print(f'\nTiming add_days: {start} to {end}')
+    test_a = timeit.timeit(lambda: dates.add_days(10), number=number)
+    print(f'-YMDArray.....: {test_a}')
+    test_b = timeit.timeit(lambda: [ymd.add_days(10) for ymd in ymds], number=number)
+    print(f'-YMD list.....: {test_b}')
+
+    print(f'\nTiming add_weekdays: {start} to {end}')
+    test_a = timeit.timeit(lambda: dates.add_weekdays(10), number=number)
+    print(f'-YMDArray.....: {test_a}')
+    test_b = timeit.timeit(lambda: [ymd.add_weekdays(10) for ymd in ymds], number=number)
+    print(f'-YMD list.....: {test_b}')
+
+    print(f'\nMemory per date, in bytes: {start} to {end}')
+    print(f'-YMDArray.....: {measure_memory(ud.YMDArray, list(dates))}')
+    print(f'-YMD list.....: {measure_memory(lambda i: [ud.YMD(d) for d in i], list(dates))}')
+
+
+# -----------------------------------------------
+
+if __name__ == '__main__':
+    run_timings()
+
+# -----------------------------------------------
+# End.
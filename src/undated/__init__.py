@@ -6,7 +6,11 @@ All of these are hopefully self explanitory.
 """
 # -----------------------------------------------
 
+from ._core import BusinessCalendar, FOLLOWING, MODIFIED_FOLLOWING, PRECEDING, MODIFIED_PRECEDING
+from ._core import WEEKMASK_MON_FRI, WEEKMASK_MON_SAT, WEEKMASK_SAT_THU, WEEKMASK_SUN_THU
 from ._tools import *
+from ._arrays import YMDArray
+from ._index import DateIndex
 
 __version__ = '1.0.8'
 
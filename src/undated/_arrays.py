@@ -0,0 +1,283 @@
+"""
+YMDArray class, an array of dates. Imported by init.
+
+**ASSUMPTIONS**
+    The dates in the array are valid, as they are not checked for the bulk methods
+
+**LIMITATIONS**
+    See init, no further limitations to note
+"""
+# -----------------------------------------------
+
+from __future__ import annotations
+from array import array
+from typing import Iterable, List, Union
+
+from . import _core as udc
+from . import _tools as udt
+
+# -----------------------------------------------
+
+
+def _new_array(iymds: Iterable[int]) -> YMDArray:
+    """ Creates the YMDArray from integers, without converting them """
+
+    # Disabling too many function args, as pylint is unaware of the array arguments
+    return array.__new__(YMDArray, 'i', iymds)  # pylint: disable=too-many-function-args
+
+
+# -----------------------------------------------
+
+
+def _epochs(iymds: Iterable[int]) -> Iterable[int]:
+    """ Generates the epochs of the dates """
+
+    from_parts = udc.epoch_from_parts
+    return (from_parts(iymd // 1_00_00, (iymd % 1_00_00) // 1_00, iymd % 1_00) for iymd in iymds)
+
+
+# -----------------------------------------------
+
+
+def _from_epochs(epochs: Iterable[int]) -> YMDArray:
+    """ Creates the YMDArray from the epochs """
+
+    to_parts = udc.epoch_to_parts
+    return _new_array((
+        (year * 1_00_00) + (month * 1_00) + day
+        for year, month, day in map(to_parts, epochs)
+    ))
+
+
+# -----------------------------------------------
+
+
+class YMDArray(array):
+    """
+    Array of dates, stored compactly in Ymd format as 32 bit integers.
+    The ``YMD`` class methods are applied to the whole array, returning a new array.
+    Slicing returns a ``YMDArray``, while a single element is returned as a ``YMD`` class object.
+    Iterating gives the dates in Ymd format, rather than creating class objects.
+
+    Supports the buffer protocol, so can be shared with NumPy, ``np.frombuffer(dates, np.intc)``
+
+    :param iymds: the dates in Ymd format, or YMD class objects
+    """
+
+    def __new__(cls, iymds: Iterable[Union[int, udt.YMD]] = ()):
+        """ Creates the array, from the dates """
+
+        if not isinstance(iymds, array):
+            iymds = map(int, iymds)
+        return super().__new__(cls, 'i', iymds)
+
+    # ---
+
+    def __copy__(self) -> YMDArray:
+        """ Called by copy, to copy the array """
+        return _new_array(self)
+
+    def __deepcopy__(self, memo: dict) -> YMDArray:
+        """ Called by deepcopy, to copy the array """
+        return _new_array(self)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[udt.YMD, YMDArray]:
+        """ Called on element access, returning a YMD class object, or YMDArray for a slice """
+
+        if isinstance(index, slice):
+            return _new_array(super().__getitem__(index))
+        return udt.YMD(super().__getitem__(index))
+
+    def __reduce_ex__(self, protocol: int):
+        """ Called by pickle, to recreate the array """
+        return YMDArray, (array('i', self),)
+
+    def __repr__(self) -> str:
+        """ Called by built-int repr() method to return a readable representation of the type """
+        return f'YMDArray({self.tolist()})'
+
+    # ---
+    # Public modules
+
+    @classmethod
+    def from_epochs(cls, epochs: Iterable[int]) -> YMDArray:
+        """
+        Creates the array from epoch values
+
+        :param epochs: The epoch values
+        :return: YMDArray
+        """
+
+        return _from_epochs(epochs)
+
+    # ---
+
+    def add_days(self, days: int) -> YMDArray:
+        """
+        Adds a number of days to the dates
+
+        :param days: The number of days to add. Use negative days to subtract days.
+        :return: YMDArray
+        """
+
+        return _from_epochs(epoch + days for epoch in _epochs(self))
+
+    # ---
+
+    def add_months(self, months: int, period: bool = False) -> YMDArray:
+        """
+        Adds a number of months to the dates
+
+        :param months: The number of months to add, use negative months to subtract
+        :param period: Set to True when looking for a period end date.
+          For example, when True adding 1 month to 2022-07-05 will return 2022-08-04,
+          else 2022-08-05 when False.
+        :return: YMDArray
+        """
+
+        add_months = udc.add_months
+        parts = (
+            add_months(iymd // 1_00_00, (iymd % 1_00_00) // 1_00, iymd % 1_00, months)
+            for iymd in self
+        )
+
+        if period:
+            from_parts = udc.epoch_from_parts
+            adjust = 1 if months < 0 else -1
+            return _from_epochs(from_parts(*part) + adjust for part in parts)
+
+        return _new_array((
+            (year * 1_00_00) + (month * 1_00) + day for year, month, day in parts
+        ))
+
+    # ---
+
+    def add_weekdays(
+            self,
+            weekdays: int,
+            calendar: udc.BusinessCalendar = None,
+            weekmask: int = udc.WEEKMASK_MON_FRI) -> YMDArray:
+        """
+        Adds a number of weekdays to the dates, Monday to Friday, or the weekmask days.
+        From a non working day, adding starts from the previous working day
+        and subtracting from the next
+
+        :param weekdays: The number of weekdays to add. Use negative days to subtract.
+        :param calendar: Optional ``BusinessCalendar``, to also skip its holidays
+        :param weekmask: The working days of the week, when there is no calendar.
+          See ``WEEKMASK_MON_FRI``
+        :return: YMDArray
+        """
+
+        if calendar is not None:
+            return _from_epochs(calendar.add(epoch, weekdays) for epoch in _epochs(self))
+
+        add_weekdays = udc.add_weekdays_to_epoch
+        return _from_epochs(add_weekdays(epoch, weekdays, weekmask) for epoch in _epochs(self))
+
+    # ---
+
+    def add_years(self, years: int, period: bool = False) -> YMDArray:
+        """
+        Adds a number of years to the dates
+
+        :param years: The number of years to add. Use negative years to subtract
+        :param period: Set to True when looking for a period end date.
+          For example, when True adding 1 year to 2022-07-05 will return 2023-07-04,
+          else 2023-07-05 when False.
+        :return: YMDArray
+        """
+
+        return self.add_months(years * 12, period)
+
+    # ---
+
+    def day_of_week(self) -> array:
+        """
+        The day numbers of the week. Sunday = 0, Monday = 1...
+
+        :return: array of day numbers 0 to 6
+        """
+
+        return array('i', ((epoch - 1) % 7 for epoch in _epochs(self)))
+
+    # ---
+
+    def epochs(self) -> array:
+        """
+        The epoch values of the dates
+
+        :return: array of epoch values
+        """
+
+        return array('i', _epochs(self))
+
+    # ---
+
+    def is_leap_year(self) -> List[bool]:
+        """
+        Whether the dates fall in leap years
+
+        :return: list, True when the date falls in a leap year
+        """
+
+        is_leap_year = udc.is_leap_year
+        return [bool(is_leap_year(iymd // 1_00_00)) for iymd in self]
+
+    # ---
+
+    def is_weekday(
+            self,
+            calendar: udc.BusinessCalendar = None,
+            weekmask: int = udc.WEEKMASK_MON_FRI) -> List[bool]:
+        """
+        Whether the dates are weekdays, Monday to Friday, or the weekmask days
+
+        :param calendar: Optional ``BusinessCalendar``, holidays are then not weekdays
+        :param weekmask: The working days of the week, when there is no calendar.
+          See ``WEEKMASK_MON_FRI``
+        :return: list, True when it is a weekday
+        """
+
+        if calendar is not None:
+            return [calendar.is_business_day(epoch) for epoch in _epochs(self)]
+        return [bool((weekmask >> ((epoch - 1) % 7)) & 1) for epoch in _epochs(self)]
+
+    # ---
+
+    def quarter(self, to_str: bool = True) -> Union[List[str], array]:
+        """
+        The quarters of the dates, as the quarter number or the quarter end month
+
+        :param to_str: True returns 2021Q3, otherwise 202109 format
+        :return: list of str 2021Q1, 2021Q2...; or array of int 202103, 202106...
+        """
+
+        quarter = udc.quarter
+        quarters = (quarter(iymd // 1_00_00, (iymd % 1_00_00) // 1_00, to_str) for iymd in self)
+        return list(quarters) if to_str else array('i', quarters)
+
+    # ---
+
+    def roll_weekday(
+            self,
+            convention: int = udc.FOLLOWING,
+            calendar: udc.BusinessCalendar = None,
+            weekmask: int = udc.WEEKMASK_MON_FRI) -> YMDArray:
+        """
+        Rolls dates falling on a weekend, or holiday, to a weekday
+
+        :param convention: FOLLOWING, MODIFIED_FOLLOWING, PRECEDING or MODIFIED_PRECEDING.
+          The modified conventions stay within the month, rolling the other way when needed.
+        :param calendar: Optional ``BusinessCalendar``, to also roll its holidays
+        :param weekmask: The working days of the week, when there is no calendar.
+          See ``WEEKMASK_MON_FRI``
+        :return: YMDArray
+        """
+
+        calendar = calendar or udc.BusinessCalendar(weekmask=weekmask)
+        return _from_epochs(calendar.roll(epoch, convention) for epoch in _epochs(self))
+
+
+# -----------------------------------------------
+# End.
@@ -11,7 +11,9 @@ Core functions for the undated modules
 
 import datetime
 
-from typing import Tuple, Union
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Iterable, Tuple, Union
 
 # -----------------------------------------------
 
@@ -25,8 +27,254 @@ DAYS_SO_FAR = (
     (0, 0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 366)   # Leap year
 )
 
+# Month and day parts for each day of a year starting on the 1st March, leap day last
+MARCH_YEAR_PARTS = tuple(
+    (month, day)
+    for month in (3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 1, 2)
+    for day in range(1, DAYS_IN_MONTH[1][month] + 1)
+)
+MARCH_EPOCH_OFFSET = 60  # Epoch of the 1st March, year zero
+
 THIS_YEAR = int(datetime.date.today().strftime('%Y'))
 
+# ---
+# Period units, and the months in each, the weeks being ISO weeks from monday
+
+PERIOD_MONTHS = {'M': 1, 'Q': 3, 'H': 6, 'Y': 12}
+PERIOD_UNITS = ('W', 'M', 'Q', 'H', 'Y')
+
+# ---
+# Roll conventions, for dates falling on a non business day
+
+FOLLOWING = 1
+MODIFIED_FOLLOWING = 2
+PRECEDING = 3
+MODIFIED_PRECEDING = 4
+
+# ---
+# Weekmasks, the working days of the week. Bit 0 is Sunday, bit 1 Monday... as day_of_week
+
+WEEKMASK_MON_FRI = 0b0111110
+WEEKMASK_MON_SAT = 0b1111110
+WEEKMASK_SAT_THU = 0b1011111
+WEEKMASK_SUN_THU = 0b0011111
+
+# Per weekmask; working days per week, working days before each day of the week, working days
+WEEKMASK_OFFSETS = {
+    mask: (
+        bin(mask).count('1'),
+        tuple(bin(mask & ((1 << day) - 1)).count('1') for day in range(7)),
+        tuple(day for day in range(7) if (mask >> day) & 1)
+    )
+    for mask in range(1, 128)
+}
+
+# -----------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def _quarter_label(year: int, quarter_no: int) -> str:
+    """ The quarter label, such as 2021Q3. Cached, as the same few labels are repeated """
+
+    return f'{year}Q{quarter_no}'
+
+
+# -----------------------------------------------
+
+
+def _weekmask_offsets(weekmask: int) -> tuple:
+    """ Gets the weekmask offsets, validating the weekmask """
+
+    try:
+        return WEEKMASK_OFFSETS[weekmask]
+    except KeyError:
+        raise ValueError(f'Invalid weekmask: {weekmask}') from None
+
+
+# -----------------------------------------------
+
+
+def _weekday_from_ordinal(ordinal: int, weekmask: int) -> int:
+    """ Converts a weekday ordinal, see _weekday_ordinal, back to its epoch """
+
+    per_week, _, days = _weekmask_offsets(weekmask)
+    weeks, day = divmod(ordinal, per_week)
+    return 1 + (weeks * 7) + days[day]
+
+
+# -----------------------------------------------
+
+
+def _weekday_ordinal(epoch: int, weekmask: int) -> int:
+    """ The number of weekmask working days from the epoch of a sunday to the epoch """
+
+    per_week, days_before, _ = _weekmask_offsets(weekmask)
+    weeks, day = divmod(epoch - 1, 7)
+    return (weeks * per_week) + days_before[day]
+
+
+# -----------------------------------------------
+
+
+class BusinessCalendar:
+    """
+    Business days, monday to friday, or the weekmask days, excluding holidays.
+    The holidays are held as a sorted index, so adding and counting days is O(log n)
+
+    :param holidays: the holiday dates in Ymd format, or YMD class objects
+    :param weekmask: the working days of the week, see WEEKMASK_MON_FRI
+    """
+
+    def __init__(self, holidays: Iterable[int] = (), weekmask: int = WEEKMASK_MON_FRI):
+        """ Initialises the BusinessCalendar class """
+
+        _weekmask_offsets(weekmask)
+        self.weekmask = weekmask
+        """ The working days of the week """
+
+        epochs = {epoch_from_parts(*explode_iymd(int(i))) for i in holidays}
+
+        self.holidays = tuple(sorted(i for i in epochs if (weekmask >> day_of_week(i)) & 1))
+        """ The holiday epochs falling on working days, sorted """
+
+        # The business ordinal of the first business day after each holiday
+        self._holiday_ordinals = tuple(
+            _weekday_ordinal(epoch, weekmask) - i for i, epoch in enumerate(self.holidays)
+        )
+
+    # ---
+
+    @classmethod
+    def from_epochs(cls, epochs: Iterable[int], weekmask: int = WEEKMASK_MON_FRI):
+        """
+        Creates a BusinessCalendar from holiday epochs, rather than dates
+
+        :param epochs: the holiday epochs
+        :param weekmask: the working days of the week, see WEEKMASK_MON_FRI
+        :return: BusinessCalendar class object
+        """
+
+        calendar = cls((), weekmask)
+        calendar.holidays = tuple(sorted(
+            i for i in set(epochs) if (weekmask >> day_of_week(i)) & 1
+        ))
+        calendar._holiday_ordinals = tuple(
+            _weekday_ordinal(epoch, weekmask) - i for i, epoch in enumerate(calendar.holidays)
+        )
+        return calendar
+
+    # ---
+
+    def add(self, epoch: int, days: int) -> int:
+        """
+        Adds a number of business days to an epoch.
+        From a non business day, adding starts from the previous business day
+        and subtracting from the next. Adding zero rolls to the next business day.
+
+        :param epoch: the date in epoch form
+        :param days: the number of days to add, use negative days to subtract
+        :return: the new epoch
+        """
+
+        ordinal = self.ordinal(epoch)
+        if days > 0 and not self.is_business_day(epoch):
+            ordinal -= 1
+        return self.from_ordinal(ordinal + days)
+
+    # ---
+
+    def count(self, from_epoch: int, to_epoch: int, inclusive: bool = False) -> int:
+        """
+        Counts the business days between two epochs, as weekdays_between_epochs
+
+        :param from_epoch: the from date epoch
+        :param to_epoch: the to date epoch
+        :param inclusive: whether to include the to date as a completed day
+        :return: the number of business days, negative when to_epoch is before from_epoch
+        """
+
+        epoch1 = min(from_epoch, to_epoch)
+        epoch2 = max(from_epoch, to_epoch)
+
+        return (
+            (self.ordinal(epoch2 + 1) - self.ordinal(epoch1 + 1) + (1 if inclusive else 0))
+            * (-1 if to_epoch < from_epoch else 1)
+        )
+
+    # ---
+
+    def from_ordinal(self, ordinal: int) -> int:
+        """
+        Converts a business day ordinal back to its epoch, see ``ordinal``
+
+        :param ordinal: the business day ordinal
+        :return: the epoch
+        """
+
+        return _weekday_from_ordinal(
+            ordinal + bisect_right(self._holiday_ordinals, ordinal), self.weekmask
+        )
+
+    # ---
+
+    def is_business_day(self, epoch: int) -> bool:
+        """
+        Is the epoch a business day
+
+        :param epoch: the date in epoch form
+        :return: True when a business day
+        """
+
+        if not (self.weekmask >> day_of_week(epoch)) & 1:
+            return False
+        i = bisect_left(self.holidays, epoch)
+        return i == len(self.holidays) or self.holidays[i] != epoch
+
+    # ---
+
+    def ordinal(self, epoch: int) -> int:
+        """
+        The business day ordinal, the number of business days before the epoch.
+        Counted from a fixed monday, so is only meaningful when comparing ordinals.
+
+        :param epoch: the date in epoch form
+        :return: the business day ordinal
+        """
+
+        return _weekday_ordinal(epoch, self.weekmask) - bisect_left(self.holidays, epoch)
+
+    # ---
+
+    def roll(self, epoch: int, convention: int = FOLLOWING) -> int:
+        """
+        Rolls a non business day to a business day
+
+        :param epoch: the date in epoch form
+        :param convention: FOLLOWING, MODIFIED_FOLLOWING, PRECEDING or MODIFIED_PRECEDING.
+          The modified conventions roll the other way when the month would change.
+        :return: the business day epoch
+        """
+
+        ordinal = self.ordinal(epoch)
+        following = self.from_ordinal(ordinal)
+        if following == epoch:
+            return epoch
+
+        preceding = self.from_ordinal(ordinal - 1)
+
+        if convention == FOLLOWING:
+            return following
+        if convention == PRECEDING:
+            return preceding
+
+        month = epoch_to_parts(epoch)[1]
+        if convention == MODIFIED_FOLLOWING:
+            return following if epoch_to_parts(following)[1] == month else preceding
+        if convention == MODIFIED_PRECEDING:
+            return preceding if epoch_to_parts(preceding)[1] == month else following
+        raise ValueError(f'Invalid roll convention: {convention}')
+
+
 # -----------------------------------------------
 
 
@@ -57,19 +305,52 @@ def add_months(year: int, month: int, day: int, months: int) -> Tuple[int, int,
 # -----------------------------------------------
 
 
-def add_weekdays(epoch: int, weekdays: int) -> Tuple[int, int, int]:
+def add_weekdays(
+        epoch: int,
+        weekdays: int,
+        weekmask: int = WEEKMASK_MON_FRI) -> Tuple[int, int, int]:
     """
-    Adds a number of weekdays, monday to friday, to an epoch
+    Adds a number of weekdays, monday to friday, or the weekmask days, to an epoch.
+    From a non working day, adding starts from the previous working day
+    and subtracting from the next, as ``BusinessCalendar.add``.
     :param epoch: int, the date in epoch form
     :param weekdays: int, the number of days to add
+    :param weekmask: int, the working days of the week, see WEEKMASK_MON_FRI
     :return: tuple, the date parts
     """
 
-    weeks, days = weekdays // 5, weekdays % 5
+    return epoch_to_parts(add_weekdays_to_epoch(epoch, weekdays, weekmask))
+
+
+# -----------------------------------------------
+
+
+def add_weekdays_to_epoch(epoch: int, weekdays: int, weekmask: int = WEEKMASK_MON_FRI) -> int:
+    """
+    Adds a number of weekdays, as add_weekdays, returning the epoch
+    :param epoch: int, the date in epoch form
+    :param weekdays: int, the number of days to add
+    :param weekmask: int, the working days of the week, see WEEKMASK_MON_FRI
+    :return: int, the new epoch
+    """
+
+    if weekmask != WEEKMASK_MON_FRI:
+        ordinal = _weekday_ordinal(epoch, weekmask)
+        if weekdays > 0 and not (weekmask >> day_of_week(epoch)) & 1:
+            ordinal -= 1
+        return _weekday_from_ordinal(ordinal + weekdays, weekmask)
+
+    # Monday to friday fast path, giving the same results as the weekmask ordinals.
+    # From a weekend, starting from the friday before, or the monday after
     weekday = day_of_week(epoch)
-    weekend_adjust = 0 if 0 < weekday + days < 6 else 2
-    days_to_add = (weeks * 7) + days + weekend_adjust
-    return epoch_to_parts(epoch + days_to_add)
+    if weekday == 0:
+        epoch, weekday = (epoch - 2, 5) if weekdays > 0 else (epoch + 1, 1)
+    elif weekday == 6:
+        epoch, weekday = (epoch - 1, 5) if weekdays > 0 else (epoch + 2, 1)
+
+    weeks, days = weekdays // 5, weekdays % 5
+    weekend_adjust = 0 if weekday + days < 6 else 2
+    return epoch + (weeks * 7) + days + weekend_adjust
 
 
 # -----------------------------------------------
@@ -88,35 +369,34 @@ def day_of_week(epoch: int) -> int:
 # -----------------------------------------------
 
 
-def epoch_to_parts(epoch: int) -> Tuple[int, int, int]:
+def day_of_year(year: int, month: int, day: int) -> int:
     """
-    Converts the epoch day number to a YMD class
-    :param epoch: int, the epoch value
-    :return: tuple, the date parts
+    Calculates the day of the year, 1st January = 1
+    :param year: int, the year
+    :param month: int, the month
+    :param day: int, the day
+    :return: int, the day of the year 1 to 366
     """
 
-    year, day = epoch // 365, epoch % 365
+    return DAYS_SO_FAR[is_leap_year(year)][month] + day
 
-    if day == 0:
-        year -= 1
-        day = 365
-
-    prior_year = year - 1
-    day -= (prior_year // 4) - (prior_year // 100) + (prior_year // 400)
 
-    while day <= 0:  # Allowing for leap years may cause negative days, shouldn't loop many times
-        year -= 1
-        day += 366 if is_leap_year(year) else 365
+# -----------------------------------------------
 
-    leap_year = is_leap_year(year)
 
-    month = 1
-    while DAYS_SO_FAR[leap_year][month + 1] < day:
-        month += 1
+def epoch_to_parts(epoch: int) -> Tuple[int, int, int]:
+    """
+    Converts the epoch day number to a YMD class.
+    Constant time, the year is counted from the 1st March so the leap day falls at the year end
+    :param epoch: int, the epoch value
+    :return: tuple, the date parts
+    """
 
-    day -= DAYS_SO_FAR[leap_year][month]
+    era, day = divmod(epoch - MARCH_EPOCH_OFFSET, 146097)  # 400 year eras
+    year = (day - (day // 1460) + (day // 36524) - (day // 146096)) // 365
+    month, day = MARCH_YEAR_PARTS[day - (year * 365) - (year // 4) + (year // 100)]
 
-    return year, month, day
+    return (era * 400) + year + (1 if month < 3 else 0), month, day
 
 
 # -----------------------------------------------
@@ -213,16 +493,104 @@ def is_valid(year: int, month: int, day: int) -> bool:
 # -----------------------------------------------
 
 
-def is_weekday(year: int, month: int, day: int) -> bool:
+def is_weekday(year: int, month: int, day: int, weekmask: int = WEEKMASK_MON_FRI) -> bool:
     """
-    Calculates if the date is a weekday, Monday - Friday
+    Calculates if the date is a weekday, Monday - Friday, or a weekmask day
     :param year: int, the year
     :param month: int, the month, Jan = 1
     :param day: int, the day of the month
+    :param weekmask: int, the working days of the week, see WEEKMASK_MON_FRI
     :return: bool, true when it is a weekday
     """
 
-    return 0 < day_of_week(epoch_from_parts(year, month, day)) < 6
+    return bool((weekmask >> day_of_week(epoch_from_parts(year, month, day))) & 1)
+
+
+# -----------------------------------------------
+
+
+def iso_calendar(year: int, month: int, day: int) -> Tuple[int, int, int]:
+    """
+    Calculates the ISO 8601 week date, the week of the year containing the thursday of the week.
+    Weeks start on monday, so dates early in January or late in December can fall in
+    the previous or next ISO year.
+    :param year: int, the year
+    :param month: int, the month
+    :param day: int, the day
+    :return: tuple, the ISO year, the week 1 to 53 and the ISO weekday, Monday = 1... Sunday = 7
+    """
+
+    days_so_far = DAYS_SO_FAR[is_leap_year(year)]
+    weekday = ((epoch_from_parts(year, month, day) - 2) % 7) + 1
+    thursday = days_so_far[month] + day - weekday + 4  # The day of year
+
+    if thursday < 1:
+        year -= 1
+        thursday += DAYS_SO_FAR[is_leap_year(year)][13]
+    elif thursday > days_so_far[13]:
+        thursday -= days_so_far[13]
+        year += 1
+
+    return year, ((thursday - 1) // 7) + 1, weekday
+
+
+# -----------------------------------------------
+
+
+def iso_calendar_to_epoch(year: int, week: int, weekday: int = 1) -> int:
+    """
+    Converts an ISO 8601 week date to the epoch, the inverse of iso_calendar
+    :param year: int, the ISO year
+    :param week: int, the week 1 to 53
+    :param weekday: int, the ISO weekday, Monday = 1... Sunday = 7
+    :return: int, the epoch value
+    """
+
+    fourth_january = epoch_from_parts(year, 1, 4)  # Always in the first week
+    return fourth_january - ((fourth_january - 2) % 7) + ((week - 1) * 7) + weekday - 1
+
+
+# -----------------------------------------------
+
+
+def nth_weekday(year: int, month: int, weekday: int, nth: int) -> int:
+    """
+    The day of the month of the nth weekday, counting back from the end of the month when negative.
+    From the day of the week of the first of the month, without stepping through the days
+    :param year: int, the year
+    :param month: int, the month, Jan = 1
+    :param weekday: int, the day of the week, Sunday = 0... Saturday = 6
+    :param nth: int, the weekday of the month, 1 to 4, or -1 to -4 for the last to fourth last
+    :return: int, the day of the month
+    """
+
+    if not 0 <= weekday < 7:
+        raise ValueError(f'Invalid weekday: {weekday}')
+    if not 0 < abs(nth) < 5:
+        raise ValueError(f'Invalid nth weekday: {nth}')
+
+    first = day_of_week(epoch_from_parts(year, month, 1))
+    if nth > 0:
+        return 1 + ((weekday - first) % 7) + ((nth - 1) * 7)
+
+    days = DAYS_IN_MONTH[is_leap_year(year)][month]
+    return days - ((first + days - 1 - weekday) % 7) + ((nth + 1) * 7)
+
+
+# -----------------------------------------------
+
+
+def period_months(unit: str) -> int:
+    """
+    The months in the period unit, validating the unit
+    :param unit: str, M month, Q quarter, H half year or Y year
+    :return: int, the months
+    """
+
+    try:
+        return PERIOD_MONTHS[unit]
+    except KeyError:
+        raise ValueError(f'Unit "{unit}" is not valid. Use W, M, Q, H or Y') from None
 
 
 # -----------------------------------------------
@@ -237,27 +605,41 @@ def quarter(year: int, month: int, to_str: bool = True) -> Union[int, str]:
     :return: str 2021Q1, 2021Q2, 2021Q3, 2021Q4; or int 202103, 202106, 202109, 202112
     """
 
-    month -= 1
+    quarter_no = ((month - 1) // 3) + 1
     if to_str:
-        return f'{year}Q{month // 3 + 1}'
-    return (year * 100) + ((month // 3) + 1) * 3
+        return _quarter_label(year, quarter_no)
+    return (year * 100) + (quarter_no * 3)
 
 
 # -----------------------------------------------
 
 
-def weekdays_between_epochs(from_epoch: int, to_epoch: int, inclusive: bool = False) -> int:
+def weekdays_between_epochs(
+        from_epoch: int,
+        to_epoch: int,
+        inclusive: bool = False,
+        weekmask: int = WEEKMASK_MON_FRI) -> int:
     """
-    Calculates the number of weekdays (mon-fri) between two epochs
+    Calculates the number of weekdays (mon-fri), or weekmask days, between two epochs.
+    A weekmask of a single day, such as 1 << 1, counts that day, mondays.
     :param from_epoch: int, the from date epoch
     :param to_epoch: int, the to date epoch
     :param inclusive: bool, whether to include the to date as a completed day
+    :param weekmask: int, the working days of the week, see WEEKMASK_MON_FRI
     :return: int, the number of week
     """
 
     epoch1 = min(from_epoch, to_epoch)
     epoch2 = max(from_epoch, to_epoch)
 
+    # Monday to friday fast path, giving the same results as the weekmask ordinals
+    if weekmask != WEEKMASK_MON_FRI:
+        return (
+            (_weekday_ordinal(epoch2 + 1, weekmask) - _weekday_ordinal(epoch1 + 1, weekmask)
+             + (1 if inclusive else 0))
+            * (-1 if to_epoch < from_epoch else 1)
+        )
+
     ymd1w = day_of_week(epoch1)
     ymd2w = day_of_week(epoch2)
 
@@ -0,0 +1,192 @@
+"""
+DateIndex class, a sorted index of dates. Imported by init.
+
+**ASSUMPTIONS**
+    The dates indexed and queried are valid, as they are not checked
+
+**LIMITATIONS**
+    See init, no further limitations to note
+"""
+# -----------------------------------------------
+
+from __future__ import annotations
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Optional, Tuple, Union
+
+from . import _core as udc
+from . import _tools as udt
+from ._arrays import YMDArray
+
+# -----------------------------------------------
+
+
+def _epoch(iymd: Union[int, udt.YMD]) -> int:
+    """ Gets the epoch of the date, in Ymd format or YMD class object """
+
+    return udc.epoch_from_parts(*udc.explode_iymd(int(iymd)))
+
+
+# -----------------------------------------------
+
+
+class DateIndex:
+    """
+    Sorted index of dates, for finding the rows of a list of dates without scanning it.
+    Built once from the dates, the rows being their positions in the list.
+    Queries accept dates in Ymd format or YMD class objects, and return rows in date order.
+    Rows with the same date are kept in row order.
+
+    :param iymds: the dates in Ymd format, or YMD class objects
+    """
+
+    def __init__(self, iymds: Iterable[Union[int, udt.YMD]] = ()):
+        """ Initialises the DateIndex class """
+
+        epochs = [_epoch(iymd) for iymd in iymds]
+        rows = sorted(range(len(epochs)), key=epochs.__getitem__)
+
+        self._epochs = array('i', (epochs[row] for row in rows))
+        self._rows = array('i', rows)
+
+    # ---
+
+    def __len__(self) -> int:
+        """ Called by built-in len() method, returning the number of dates indexed """
+        return len(self._epochs)
+
+    # ---
+    # Private modules
+
+    def _bounds(self, from_epoch: int, to_epoch: int) -> Tuple[int, int]:
+        """ The positions in the sorted epochs, of the dates between the epochs inclusive """
+
+        return bisect_left(self._epochs, from_epoch), bisect_right(self._epochs, to_epoch)
+
+    # ---
+    # Public modules
+
+    def append(self, iymd: Union[int, udt.YMD]):
+        """
+        Appends a date to the index, as the next row.
+        Fastest when dates arrive in order, as later dates are added to the end.
+
+        :param iymd: The date in Ymd format or YMD class object
+        """
+
+        epoch = _epoch(iymd)
+        row = len(self._rows)
+
+        if not self._epochs or self._epochs[-1] <= epoch:
+            self._epochs.append(epoch)
+            self._rows.append(row)
+        else:
+            position = bisect_right(self._epochs, epoch)
+            self._epochs.insert(position, epoch)
+            self._rows.insert(position, row)
+
+    # ---
+
+    def between(
+            self,
+            from_iymd: Union[int, udt.YMD],
+            to_iymd: Union[int, udt.YMD]) -> array:
+        """
+        Finds the rows with dates between two dates, inclusive.
+        For example, between(20210101, 20210331) gives the rows in the first quarter of 2021.
+
+        :param from_iymd: The from date in Ymd format or YMD class object
+        :param to_iymd: The to date in Ymd format or YMD class object
+        :return: array of rows
+        """
+
+        start, stop = self._bounds(_epoch(from_iymd), _epoch(to_iymd))
+        return self._rows[start:stop]
+
+    # ---
+
+    def ceiling(self, iymd: Union[int, udt.YMD]) -> Optional[udt.YMD]:
+        """
+        Finds the first date on or after a date
+
+        :param iymd: The date in Ymd format or YMD class object
+        :return: YMD class object, or None when there are no dates on or after
+        """
+
+        position = bisect_left(self._epochs, _epoch(iymd))
+        if position == len(self._epochs):
+            return None
+        return udt.epoch_to_ymd(self._epochs[position])
+
+    # ---
+
+    def count(self, from_iymd: Union[int, udt.YMD], to_iymd: Union[int, udt.YMD]) -> int:
+        """
+        Counts the rows with dates between two dates, inclusive
+
+        :param from_iymd: The from date in Ymd format or YMD class object
+        :param to_iymd: The to date in Ymd format or YMD class object
+        :return: The number of rows
+        """
+
+        start, stop = self._bounds(_epoch(from_iymd), _epoch(to_iymd))
+        return max(stop - start, 0)
+
+    # ---
+
+    def dates(self) -> YMDArray:
+        """
+        The indexed dates, in date order
+
+        :return: YMDArray
+        """
+
+        return YMDArray.from_epochs(self._epochs)
+
+    # ---
+
+    def extend(self, iymds: Iterable[Union[int, udt.YMD]]):
+        """
+        Appends dates to the index, as the next rows
+
+        :param iymds: The dates in Ymd format, or YMD class objects
+        """
+
+        for iymd in iymds:
+            self.append(iymd)
+
+    # ---
+
+    def floor(self, iymd: Union[int, udt.YMD]) -> Optional[udt.YMD]:
+        """
+        Finds the last date on or before a date
+
+        :param iymd: The date in Ymd format or YMD class object
+        :return: YMD class object, or None when there are no dates on or before
+        """
+
+        position = bisect_right(self._epochs, _epoch(iymd))
+        if position == 0:
+            return None
+        return udt.epoch_to_ymd(self._epochs[position - 1])
+
+    # ---
+
+    def month(self, iym: Union[int, udt.YMD]) -> array:
+        """
+        Finds the rows with dates in a month
+
+        :param iym: The month in Ym format, or a date in the month
+        :return: array of rows
+        """
+
+        year, month, _ = udc.explode_iymd(int(iym))
+        first_epoch = udc.epoch_from_parts(year, month, 1)
+        last_day = udc.DAYS_IN_MONTH[udc.is_leap_year(year)][month]
+
+        start, stop = self._bounds(first_epoch, first_epoch + last_day - 1)
+        return self._rows[start:stop]
+
+
+# -----------------------------------------------
+# End.
@@ -16,8 +16,6 @@ from . import _core as udc
 
 # -----------------------------------------------
 
-_EPOCH = 1
-
 INVALID = 0
 VALID = 1
 TRUSTED = 2
@@ -60,6 +58,8 @@ class YMD:
     :param trusted: True, if dates can be trusted to be correct, the validation stage is skipped
     """
 
+    __slots__ = ('iymd', 'year', 'month', 'day', 'status', '_epoch')
+
     iymd: Optional[int]
     """ The date as an 8 digit integer, in year, month, day format """
 
@@ -72,9 +72,11 @@ class YMD:
     day: Optional[int]
     """ The day element of the date, as a 1 or 2 digit integer """
 
-    status: int = None
+    status: int
     """ The status of the class. Refers to the package constants VALID, INVALID and TRUSTED """
 
+    _epoch: Optional[int]  # Calculated when first needed, or carried forward from a calculation
+
     # ---
 
     def __init__(
@@ -86,65 +88,81 @@ class YMD:
     ):
         """ Initialises the YMD class """
 
-        # ---
-
-        def invalidate():
-            """ Sets the properties to the invalid state """
-            self.iymd = self.year = self.month = self.day = None
-            self.status = INVALID
-
-        # ---
-
-        self._properties = {}
-
         if year_or_iymd is None:
-            invalidate()
-            return
-
-        if isinstance(year_or_iymd, tuple):
+            parts = None
+        elif isinstance(year_or_iymd, tuple):
+            parts = None
             if len(year_or_iymd) == 3:
-                self.year, self.month, self.day = year_or_iymd
-                self.iymd = udc.glue_parts(self.year, self.month, self.day)
-            else:
-                invalidate()
-                return
+                parts = (udc.glue_parts(*year_or_iymd), *year_or_iymd)
         else:
-            self.iymd, self.year, self.month, self.day = _get_parts(year_or_iymd, month, day)
-
-        if trusted:
-            self.status = TRUSTED
-        elif udc.is_valid(self.year, self.month, self.day):
-            self.status = VALID
+            parts = _get_parts(year_or_iymd, month, day)
+
+        if parts is None:
+            status = INVALID
+        elif trusted:
+            status = TRUSTED
+        elif udc.is_valid(parts[1], parts[2], parts[3]):
+            status = VALID
+        else:
+            status = INVALID
+
+        # Set through the slots, as __setattr__ prevents modification
+        if status == INVALID:
+            _set_iymd(self, None)
+            _set_year(self, None)
+            _set_month(self, None)
+            _set_day(self, None)
+            _set_epoch(self, None)
         else:
-            invalidate()
+            _set_iymd(self, parts[0])
+            _set_year(self, parts[1])
+            _set_month(self, parts[2])
+            _set_day(self, parts[3])
+        _set_status(self, status)
 
     # ---
-    # Comparison magic methods
+    # Comparison magic methods, comparing YMD class objects directly rather than by reflection
 
-    def __lt__(self, other: int) -> bool:
+    def __lt__(self, other: Union[int, YMD]) -> bool:
         """ Called on comparison using < operator """
+        if isinstance(other, YMD):
+            return self.iymd < other.iymd
         return self.iymd < other
 
-    def __le__(self, other: int) -> bool:
+    def __le__(self, other: Union[int, YMD]) -> bool:
         """ Called on comparison using <= operator """
+        if isinstance(other, YMD):
+            return self.iymd <= other.iymd
         return self.iymd <= other
 
-    def __eq__(self, other: int) -> bool:
+    def __eq__(self, other: Union[int, YMD]) -> bool:
         """ Called on comparison using == operator """
+        if isinstance(other, YMD):
+            return self.iymd == other.iymd
         return self.iymd == other
 
-    def __ne__(self, other: int) -> bool:
+    def __ne__(self, other: Union[int, YMD]) -> bool:
         """ Called on comparison using != operator """
+        if isinstance(other, YMD):
+            return self.iymd != other.iymd
         return self.iymd != other
 
-    def __ge__(self, other: int) -> bool:
+    def __ge__(self, other: Union[int, YMD]) -> bool:
         """ Called on comparison using >= operator """
+        if isinstance(other, YMD):
+            return self.iymd >= other.iymd
         return self.iymd >= other
 
-    def __gt__(self, other: int) -> bool:
+    def __gt__(self, other: Union[int, YMD]) -> bool:
         """ To get called on comparison using > operator """
+        if isinstance(other, YMD):
+            return self.iymd > other.iymd
         return self.iymd > other
 
+    def __hash__(self) -> int:
+        """ Called by built-in hash() method, matching the hash of the iymd, as equal to it """
+        return hash(self.iymd)
+
     # ---
     # Operator magic methods
 
@@ -171,7 +189,7 @@ class YMD:
 
     def __repr__(self):
         """ Called by built-int repr() method to return a readable representation of the type """
-        return self.iymd
+        return str(self.iymd)
 
     def __str__(self):
         """ Called by built-int str() method to convert a type to a str """
@@ -180,34 +198,20 @@ class YMD:
     # ---
     # Restrict attribute updates
 
-    def __setattr__(self, key: str, value: Any):
+    def __delattr__(self, key: str):
         """ Assurance that the date has not been manually modifed """
+        raise AttributeError('Unable to modify YMD')
 
-        if self.status:
-            raise Exception('Unable to modified YMD')
-        self.__dict__[key] = value
+    def __setattr__(self, key: str, value: Any):
+        """ Assurance that the date has not been manually modifed """
+        raise AttributeError('Unable to modify YMD')
 
     # ---
-    # Private modules
+    # Pickling, as the slots can not be set by the default
 
-    def _get_property(self, name: int) -> Any:
-        """
-        Gets the ymd date property. Added when first needed,
-         rather than at initialisation, for performance.
-         Only _EPOCH at the moment, but more may be added.
-
-        :param name: str, the property name; [_EPOCH]
-        :return: the property value
-        """
-
-        if self.status == INVALID:
-            return None
-
-        if name not in self._properties:
-            if name == _EPOCH:
-                self._properties[name] = udc.epoch_from_parts(self.year, self.month, self.day)
-
-        return self._properties[name]
+    def __reduce__(self):
+        """ Called by pickle and copy, to recreate the class object """
+        return YMD, (self.iymd, None, None, self.status == TRUSTED)
 
     # ---
     # Public modules
@@ -240,15 +244,24 @@ class YMD:
 
     # ---
 
-    def add_weekdays(self, weekdays: int) -> YMD:
+    def add_weekdays(
+            self,
+            weekdays: int,
+            calendar: udc.BusinessCalendar = None,
+            weekmask: int = udc.WEEKMASK_MON_FRI) -> YMD:
         """
-        Adds the specified number of weekdays, Monday to Friday, to the date
+        Adds the specified number of weekdays, Monday to Friday, to the date.
+        From a non working day, adding starts from the previous working day
+        and subtracting from the next
 
         :param weekdays: The number of weekdays to add. Use negative days to subtract.
+        :param calendar: Optional ``BusinessCalendar``, to also skip its holidays
+        :param weekmask: The working days of the week, when there is no calendar.
+          See ``WEEKMASK_MON_FRI``
         :return: YMD class object
         """
 
-        return add_weekdays(self, weekdays)
+        return add_weekdays(self, weekdays, calendar, weekmask)
 
     # ---
 
@@ -276,18 +289,37 @@ class YMD:
 
         if self.status == INVALID:
             return None
-        return udc.day_of_week(self._get_property(_EPOCH))
+        return udc.day_of_week(self.epoch())
+
+    # ---
+
+    def day_of_year(self) -> Union[int, None]:
+        """
+        The day of the year, 1st January == 1
+
+        :return: The day number 1 to 366
+        """
+
+        if self.status == INVALID:
+            return None
+        return udc.day_of_year(self.year, self.month, self.day)
 
     # ---
 
     def epoch(self) -> Union[int, None]:
         """
-        An epoch value for the date, # TODO try to exclude from sphinx
+        An epoch value for the date, # TODO try to exclude from sphinx.
+        Calculated when first needed, rather than at initialisation, for performance.
 
         :return: int, the epoch value
         """
 
-        return self._get_property(_EPOCH)
+        try:
+            return self._epoch
+        except AttributeError:
+            epoch = udc.epoch_from_parts(self.year, self.month, self.day)
+            _set_epoch(self, epoch)
+            return epoch
 
     # ---
 
@@ -304,25 +336,131 @@ class YMD:
 
     # ---
 
-    def is_weekday(self) -> bool:
+    def is_weekday(
+            self,
+            calendar: udc.BusinessCalendar = None,
+            weekmask: int = udc.WEEKMASK_MON_FRI) -> bool:
         """
         Is the date falling on a weekday, IE between Monday and Friday
 
+        :param calendar: Optional ``BusinessCalendar``, holidays are then not weekdays
+        :param weekmask: The working days of the week, when there is no calendar.
+          See ``WEEKMASK_MON_FRI``
         :return: True when it is a weekday
         """
 
         if self.status == INVALID:
             return False
-        return 0 < udc.day_of_week(self._get_property(_EPOCH)) < 6
+        if calendar is None:
+            return bool((weekmask >> udc.day_of_week(self.epoch())) & 1)
+        return calendar.is_business_day(self.epoch())
+
+    # ---
+
+    def iso_calendar(self) -> Union[Tuple[int, int, int], None]:
+        """
+        The ISO 8601 week date, as ``datetime.date.isocalendar``
+
+        :return: The ISO year, the week 1 to 53 and the ISO weekday, Monday == 1... Sunday == 7
+        """
+
+        if self.status == INVALID:
+            return None
+        return udc.iso_calendar(self.year, self.month, self.day)
+
+    # ---
+
+    def iso_week(self) -> Union[int, None]:
+        """
+        The ISO 8601 week number
+
+        :return: The week 1 to 53
+        """
+
+        if self.status == INVALID:
+            return None
+        return udc.iso_calendar(self.year, self.month, self.day)[1]
+
+    # ---
+
+    def iso_weekday(self) -> Union[int, None]:
+        """
+        The ISO 8601 number for the day of the week. Monday == 1... Sunday == 7
+
+        :return: The day number 1 to 7
+        """
+
+        if self.status == INVALID:
+            return None
+        return ((self.epoch() - 2) % 7) + 1
+
+    # ---
+
+    def iso_year(self) -> Union[int, None]:
+        """
+        The ISO 8601 week-numbering year, which can differ from the year
+        for dates early in January or late in December
+
+        :return: The ISO year
+        """
+
+        if self.status == INVALID:
+            return None
+        return udc.iso_calendar(self.year, self.month, self.day)[0]
+
+    # ---
+
+    def roll_weekday(
+            self,
+            convention: int = udc.FOLLOWING,
+            calendar: udc.BusinessCalendar = None,
+            weekmask: int = udc.WEEKMASK_MON_FRI) -> YMD:
+        """
+        Rolls the date, when falling on a weekend or holiday, to a weekday
+
+        :param convention: FOLLOWING, MODIFIED_FOLLOWING, PRECEDING or MODIFIED_PRECEDING.
+          The modified conventions roll the other way when the month would change.
+        :param calendar: Optional ``BusinessCalendar``, to also roll its holidays
+        :param weekmask: The working days of the week, when there is no calendar.
+          See ``WEEKMASK_MON_FRI``
+        :return: YMD class object
+        """
+
+        return roll_weekday(self, convention, calendar, weekmask)
 
 
 # ---
+# The slot setters, bypassing __setattr__
+
+_set_day = YMD.day.__set__
+_set_epoch = YMD._epoch.__set__  # pylint: disable=protected-access
+_set_iymd = YMD.iymd.__set__
+_set_month = YMD.month.__set__
+_set_status = YMD.status.__set__
+_set_year = YMD.year.__set__
+
+_new_ymd = object.__new__
 
 INVALID_YMD = YMD(0)
 
 # -----------------------------------------------
 
 
+def _trusted_ymd(year: int, month: int, day: int, epoch: int) -> YMD:
+    """ Creates a trusted YMD, with the already known epoch, skipping initialisation """
+
+    ymd = _new_ymd(YMD)
+    _set_iymd(ymd, (year * 1_00_00) + (month * 1_00) + day)
+    _set_year(ymd, year)
+    _set_month(ymd, month)
+    _set_day(ymd, day)
+    _set_status(ymd, TRUSTED)
+    _set_epoch(ymd, epoch)
+    return ymd
+
+# -----------------------------------------------
+
+
 def add_days(ymd: YMD, days: int) -> YMD:
     """
     Adds a number of days to a date in in Ymd format
@@ -362,22 +500,30 @@ def add_months(ymd: YMD, months: int, period: bool = False) -> YMD:
 # -----------------------------------------------
 
 
-def add_weekdays(ymd: YMD, weekdays: int) -> YMD:
+def add_weekdays(
+        ymd: YMD,
+        weekdays: int,
+        calendar: udc.BusinessCalendar = None,
+        weekmask: int = udc.WEEKMASK_MON_FRI) -> YMD:
     """
-    Adds a number of weekdays, monday to friday, to a date in in Ymd format
+    Adds a number of weekdays, monday to friday, to a date in in Ymd format.
+    From a non working day, adding starts from the previous working day
+    and subtracting from the next
 
     :param ymd: YMD class object
     :param weekdays: int, the number of days to add
+    :param calendar: BusinessCalendar, optional, to also skip its holidays
+    :param weekmask: int, the working days of the week, when there is no calendar
     :return: YMD class object
     """
 
     if ymd.status == INVALID:
         return INVALID_YMD
 
-    return YMD(
-        *udc.add_weekdays(ymd.epoch(), weekdays),
-        trusted=True
-    )
+    if calendar is not None:
+        return epoch_to_ymd(calendar.add(ymd.epoch(), weekdays))
+
+    return epoch_to_ymd(udc.add_weekdays_to_epoch(ymd.epoch(), weekdays, weekmask))
 
 
 # -----------------------------------------------
@@ -408,7 +554,7 @@ def epoch_to_ymd(epoch: int) -> YMD:
     :return: YMD class object
     """
 
-    return YMD(*udc.epoch_to_parts(epoch), trusted=True)
+    return _trusted_ymd(*udc.epoch_to_parts(epoch), epoch)
 
 
 # -----------------------------------------------
@@ -467,23 +613,60 @@ def quarter(ymd: YMD, to_str: bool = True) -> Union[int, str, None]:
 # -----------------------------------------------
 
 
-def weekdays_between(from_ymd: YMD, to_ymd: YMD, inclusive: bool = False) -> Union[int, None]:
+def roll_weekday(
+        ymd: YMD,
+        convention: int = udc.FOLLOWING,
+        calendar: udc.BusinessCalendar = None,
+        weekmask: int = udc.WEEKMASK_MON_FRI) -> YMD:
+    """
+    Rolls a date falling on a weekend, or holiday, to a weekday
+
+    :param ymd: YMD class object
+    :param convention: int, FOLLOWING, MODIFIED_FOLLOWING, PRECEDING or MODIFIED_PRECEDING
+    :param calendar: BusinessCalendar, optional, to also roll its holidays
+    :param weekmask: int, the working days of the week, when there is no calendar
+    :return: YMD class object
+    """
+
+    if ymd.status == INVALID:
+        return INVALID_YMD
+
+    calendar = calendar or udc.BusinessCalendar(weekmask=weekmask)
+    return epoch_to_ymd(calendar.roll(ymd.epoch(), convention))
+
+
+# -----------------------------------------------
+
+
+def weekdays_between(
+        from_ymd: YMD,
+        to_ymd: YMD,
+        inclusive: bool = False,
+        calendar: udc.BusinessCalendar = None,
+        weekmask: int = udc.WEEKMASK_MON_FRI) -> Union[int, None]:
     """
     Calculates the number of weekdays between two dates
 
     :param from_ymd: YMD class object
     :param to_ymd: YMD class object
     :param inclusive: bool, whether to include the to date as a completed day
+    :param calendar: BusinessCalendar, optional, to exclude its holidays
+    :param weekmask: int, the working days of the week, when there is no calendar.
+      A single day, such as 1 << 1, counts that day, mondays.
     :return: int, the number of days between the dates
     """
 
     if INVALID in [from_ymd.status, to_ymd.status]:
         return None
 
+    if calendar is not None:
+        return calendar.count(from_ymd.epoch(), to_ymd.epoch(), inclusive)
+
     return udc.weekdays_between_epochs(
         from_ymd.epoch(),
         to_ymd.epoch(),
-        inclusive
+        inclusive,
+        weekmask
     )
 
 
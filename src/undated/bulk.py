@@ -0,0 +1,145 @@
+"""
+The ``bulk`` module runs the ``fmts`` and ``utils`` functions on columns of dates
+with few distinct values, such as a business date repeated on every row.
+The column is factorized into its unique values and the integer code of each row,
+the functions run once on each unique value, and the results are broadcast back by the codes.
+
+Works with lists, or any iterable, using ``array`` for the codes, and with NumPy arrays,
+returning NumPy arrays. NumPy is only imported for NumPy arrays.
+"""
+# -----------------------------------------------
+
+from array import array
+from typing import Any, Callable, Iterable, List, Optional, Union
+
+from . import fmts as udf
+
+# -----------------------------------------------
+
+
+def _is_numpy(values: Any) -> bool:
+    """ Checks for a NumPy array, without importing NumPy """
+    return type(values).__module__ == 'numpy' and hasattr(values, 'shape')
+
+
+# -----------------------------------------------
+
+
+class Factorized:
+    """
+    A column of values factorized into the unique values and the code of each row,
+    the index of the row value in the uniques. Created by the ``factorize`` function.
+
+    :param uniques: the unique values
+    :param codes: the index of each row value in the uniques, as an array or NumPy array
+    """
+
+    def __init__(self, uniques: List[Any], codes: Any):
+        """ Initialises the Factorized class """
+
+        self.uniques = uniques
+        """ The unique values, the results of the functions applied """
+
+        self.codes = codes
+        """ The index of each row value in the uniques """
+
+    # ---
+
+    def __len__(self) -> int:
+        """ Called by built-in len() method, returning the number of rows """
+        return self.codes.size if _is_numpy(self.codes) else len(self.codes)
+
+    # ---
+
+    def __repr__(self) -> str:
+        """ Called by built-in repr() method, returning the rows and uniques """
+        return f'Factorized(rows={len(self)}, uniques={len(self.uniques)})'
+
+    # ---
+
+    @property
+    def compression(self) -> float:
+        """ The compression ratio, the number of rows for each unique value """
+        return len(self) / len(self.uniques) if self.uniques else 1.0
+
+    # ---
+
+    def apply(self, func: Callable, *args, **kwargs) -> 'Factorized':
+        """
+        Applies the function to each unique value, such as ``utils.add_months``.
+        None values, such as invalid dates, are kept as None
+
+        :param func: the function, taking the value as the first argument
+        :param args: further arguments of the function
+        :param kwargs: further keyword arguments of the function
+        :return: Factorized class object of the results, sharing the codes
+        """
+
+        return Factorized(
+            [None if i is None else func(i, *args, **kwargs) for i in self.uniques], self.codes
+        )
+
+    # ---
+
+    def broadcast(self, invalid: Any = None, typecode: Optional[str] = None) -> Any:
+        """
+        Broadcasts the unique values back to the rows, by the codes
+
+        :param invalid: the value replacing None values, such as invalid dates
+        :param typecode: the array typecode, such as 'i', returning an array rather than a list.
+          Ignored for NumPy arrays
+        :return: list, array or NumPy array of the row values
+        """
+
+        uniques = self.uniques
+        if invalid is not None:
+            uniques = [invalid if i is None else i for i in uniques]
+
+        if _is_numpy(self.codes):
+            # Disabling import outside toplevel, as NumPy is optional
+            import numpy as np  # pylint: disable=import-outside-toplevel
+            return np.asarray(uniques)[self.codes]
+
+        values = list(map(uniques.__getitem__, self.codes))
+        return values if typecode is None else array(typecode, values)
+
+    # ---
+
+    def parse(self, fmt: Union[str, 'udf.UndatedFormat'], yy_pivot: int = None) -> 'Factorized':
+        """
+        Converts each unique value to the Ymd format, as ``fmts.as_iymd``
+
+        :param fmt: The date format, as either a basic format as a string, or a derived format
+        :param yy_pivot: The pivot year for two digit years. Use with string based formats
+        :return: Factorized class object of the dates in Ymd format, or None when not valid
+        """
+
+        return Factorized(list(udf.as_iymd_many(self.uniques, fmt, yy_pivot)), self.codes)
+
+
+# -----------------------------------------------
+
+
+def factorize(values: Iterable) -> Factorized:
+    """
+    Factorizes the column into the unique values and the code of each row.
+    NumPy arrays use ``np.unique``, keeping the shape of the array,
+    other iterables keep the unique values in the order first seen
+
+    :param values: the column, such as a list of date strings or a NumPy array of dates
+    :return: Factorized class object
+    """
+
+    if _is_numpy(values):
+        # Disabling import outside toplevel, as NumPy is optional
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        uniques, codes = np.unique(values, return_inverse=True)
+        return Factorized(uniques.tolist(), codes.reshape(values.shape))
+
+    index = {}
+    codes = array('i', [index.setdefault(i, len(index)) for i in values])
+    return Factorized(list(index), codes)
+
+
+# -----------------------------------------------
+# End.
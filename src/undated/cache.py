@@ -0,0 +1,189 @@
+"""
+The ``cache`` module is an opt-in memoization layer, for date columns with few distinct values.
+Once enabled, the epoch conversions and the ``utils`` functions remember their most recent
+results, evicting the least recently used, and ``YMD`` class objects are interned by date.
+
+When also using the ``tables`` module, enable the tables first. The tables are loaded
+when the cache is enabled, so the cached conversions are the table lookups.
+"""
+# -----------------------------------------------
+
+import sys
+
+from functools import lru_cache
+from typing import Dict
+
+from . import _core as udc
+from . import _tools as udt
+from . import tables as udtb
+from . import utils as udu
+
+# -----------------------------------------------
+
+_CACHED_FUNCTIONS = (
+    (udc, ('epoch_from_parts', 'epoch_to_parts')),
+    (udu, (
+        'add_days', 'add_months', 'add_weekdays', 'day_of_week', 'days_between', 'is_valid',
+        'is_weekday', 'last_day', 'quarter', 'weekdays_between'
+    ))
+)
+
+_originals = {}  # The replaced functions, keyed by module and function name
+_wrappers = {}  # The cached functions, keyed by module and function name
+_uncached_epoch_to_ymd = udt.epoch_to_ymd
+
+# The package, as epoch_to_ymd is also imported into it
+_PACKAGE = sys.modules[__package__]
+
+# Disabling invalid name, as this is module state rather than a constant
+_interned = udt.YMD  # pylint: disable=invalid-name
+
+# -----------------------------------------------
+
+
+def _cached_functions() -> Dict[str, object]:
+    """ The cached functions still in place, by name """
+
+    return {
+        name: wrapper for (module, name), wrapper in _wrappers.items()
+        if getattr(module, name) is wrapper
+    }
+
+
+# -----------------------------------------------
+
+
+def _epoch_to_ymd(epoch: int) -> udt.YMD:
+    """ Replaces epoch_to_ymd, returning the interned YMD """
+
+    return _interned(udc.glue_parts(*udc.epoch_to_parts(epoch)))
+
+
+# -----------------------------------------------
+
+
+def _ymd_to_intern(iymd: int) -> udt.YMD:
+    """ Creates the YMD to intern, trusted and with its epoch when valid """
+
+    validated = udt.YMD(iymd)
+    if not validated:
+        return validated
+
+    parts = (validated.year, validated.month, validated.day)
+    return udt._trusted_ymd(*parts, udc.epoch_from_parts(*parts))  # pylint: disable=protected-access
+
+
+# -----------------------------------------------
+
+
+def cache_clear():
+    """
+    Clears the cached results and statistics, keeping the cache enabled
+    """
+
+    for wrapper in _cached_functions().values():
+        wrapper.cache_clear()
+    if _interned is not udt.YMD:
+        _interned.cache_clear()
+
+
+# -----------------------------------------------
+
+
+def cache_info() -> Dict[str, tuple]:
+    """
+    The cache statistics, hits, misses, maxsize and currsize, for each cached function.
+    Interned ``YMD`` class objects are under the name ``ymd``.
+
+    :return: dict of function name and statistics
+    """
+
+    info = {name: wrapper.cache_info() for name, wrapper in _cached_functions().items()}
+    if _interned is not udt.YMD:
+        info['ymd'] = _interned.cache_info()
+    return info
+
+
+# -----------------------------------------------
+
+
+def disable():
+    """
+    Reverts to the uncached functions and releases the cached results
+    """
+
+    # Disabling global statement, as the interned YMDs are module state
+    # pylint: disable=global-statement
+
+    global _interned
+
+    # Functions replaced since, such as by enabling the tables, are left in place
+    for (module, name), function in _originals.items():
+        if getattr(module, name) is _wrappers[(module, name)]:
+            setattr(module, name, function)
+    _originals.clear()
+    _wrappers.clear()
+
+    udt.epoch_to_ymd = _PACKAGE.epoch_to_ymd = _uncached_epoch_to_ymd
+    _interned = udt.YMD
+
+
+# -----------------------------------------------
+
+
+def enable(maxsize: int = 4096):
+    """
+    Enables the cache
+
+    :param maxsize: the maximum number of results remembered by each function
+    """
+
+    # Disabling global statement, as the interned YMDs are module state
+    # pylint: disable=global-statement
+
+    global _interned
+
+    disable()
+    udtb.load()
+
+    for module, names in _CACHED_FUNCTIONS:
+        for name in names:
+            function = getattr(module, name)
+            _originals[(module, name)] = function
+            _wrappers[(module, name)] = lru_cache(maxsize)(function)
+            setattr(module, name, _wrappers[(module, name)])
+
+    _interned = lru_cache(maxsize)(_ymd_to_intern)
+    udt.epoch_to_ymd = _PACKAGE.epoch_to_ymd = _epoch_to_ymd
+
+
+# -----------------------------------------------
+
+
+def is_enabled() -> bool:
+    """
+    Whether the cache is enabled
+
+    :return: True when enabled
+    """
+
+    return bool(_originals)
+
+
+# -----------------------------------------------
+
+
+def ymd(iymd: int) -> udt.YMD:
+    """
+    Gets the ``YMD`` class object for the date. When the cache is enabled,
+    repeated dates return the same object rather than creating another.
+
+    :param iymd: the date in Ymd format
+    :return: YMD class object
+    """
+
+    return _interned(iymd)
+
+
+# -----------------------------------------------
+# End.
@@ -0,0 +1,170 @@
+"""
+The ``daycount`` module calculates the day counts and year fractions of financial day count
+conventions, directly from dates in the ``Ymd`` format or epochs.
+For arrays of dates, see ``year_fraction`` and ``day_count`` in the ``vec`` module.
+
+Conventions: ``THIRTY_360``, the 30/360 bond basis; ``THIRTY_E_360``, the 30E/360 eurobond basis;
+``ACT_360``; ``ACT_365F``, actual/365 fixed; ``ACT_ACT_ISDA``, actual/actual ISDA.
+"""
+# -----------------------------------------------
+
+from typing import Tuple
+
+from . import _core as udc
+
+# -----------------------------------------------
+
+THIRTY_360 = '30/360'
+THIRTY_E_360 = '30E/360'
+ACT_360 = 'ACT/360'
+ACT_365F = 'ACT/365F'
+ACT_ACT_ISDA = 'ACT/ACT ISDA'
+
+CONVENTIONS = (THIRTY_360, THIRTY_E_360, ACT_360, ACT_365F, ACT_ACT_ISDA)
+
+# -----------------------------------------------
+
+
+def _act_act_isda(from_epoch: int, from_year: int, to_epoch: int, to_year: int) -> float:
+    """ The actual/actual ISDA year fraction, the days in each year over the days of that year """
+
+    sign = 1
+    if to_epoch < from_epoch:
+        from_epoch, to_epoch = to_epoch, from_epoch
+        from_year, to_year, sign = to_year, from_year, -1
+
+    from_basis = 365 + udc.is_leap_year(from_year)
+    if from_year == to_year:
+        return sign * (to_epoch - from_epoch) / from_basis
+
+    return sign * (
+        ((udc.epoch_from_parts(from_year + 1, 1, 1) - from_epoch) / from_basis)
+        + (to_year - from_year - 1)
+        + ((to_epoch - udc.epoch_from_parts(to_year, 1, 1)) / (365 + udc.is_leap_year(to_year)))
+    )
+
+
+# -----------------------------------------------
+
+
+def _check_convention(convention: str):
+    """ Raises an error for unknown conventions """
+
+    if convention not in CONVENTIONS:
+        raise ValueError(f'Invalid day count convention: {convention}')
+
+
+# -----------------------------------------------
+
+
+def _thirty_360(
+        from_parts: Tuple[int, int, int],
+        to_parts: Tuple[int, int, int],
+        convention: str) -> int:
+    """ The 30/360 or 30E/360 day count, each month having 30 days """
+
+    year1, month1, day1 = from_parts
+    year2, month2, day2 = to_parts
+
+    day1 = min(day1, 30)
+    if day2 == 31 and (convention == THIRTY_E_360 or day1 == 30):
+        day2 = 30
+
+    return ((year2 - year1) * 360) + ((month2 - month1) * 30) + day2 - day1
+
+
+# -----------------------------------------------
+
+
+def _year_fraction(
+        from_epoch: int,
+        from_parts: Tuple[int, int, int],
+        to_epoch: int,
+        to_parts: Tuple[int, int, int],
+        convention: str) -> float:
+    """ The year fraction, from the epochs and parts of both dates """
+
+    if convention in (THIRTY_360, THIRTY_E_360):
+        return _thirty_360(from_parts, to_parts, convention) / 360
+    if convention == ACT_360:
+        return (to_epoch - from_epoch) / 360
+    if convention == ACT_365F:
+        return (to_epoch - from_epoch) / 365
+    _check_convention(convention)
+    return _act_act_isda(from_epoch, from_parts[0], to_epoch, to_parts[0])
+
+
+# -----------------------------------------------
+
+
+def day_count(from_iymd: int, to_iymd: int, convention: str = ACT_365F) -> int:
+    """
+    Counts the days between two dates, by the day count convention.
+    The actual days, or for the 30/360 conventions, with months of 30 days.
+
+    :param from_iymd: the from date in Ymd format
+    :param to_iymd: the to date in Ymd format
+    :param convention: the day count convention, see ``CONVENTIONS``
+    :return: the days, negative when the to date is before the from date
+    """
+
+    _check_convention(convention)
+    from_parts = udc.explode_iymd(from_iymd)
+    to_parts = udc.explode_iymd(to_iymd)
+
+    if convention in (THIRTY_360, THIRTY_E_360):
+        return _thirty_360(from_parts, to_parts, convention)
+    return udc.epoch_from_parts(*to_parts) - udc.epoch_from_parts(*from_parts)
+
+
+# -----------------------------------------------
+
+
+def epoch_year_fraction(from_epoch: int, to_epoch: int, convention: str = ACT_365F) -> float:
+    """
+    Calculates the year fraction between two epochs, by the day count convention
+
+    :param from_epoch: the from date epoch
+    :param to_epoch: the to date epoch
+    :param convention: the day count convention, see ``CONVENTIONS``
+    :return: the year fraction, negative when the to date is before the from date
+    """
+
+    if convention in (ACT_360, ACT_365F):
+        return _year_fraction(from_epoch, (), to_epoch, (), convention)
+
+    return _year_fraction(
+        from_epoch, udc.epoch_to_parts(from_epoch),
+        to_epoch, udc.epoch_to_parts(to_epoch),
+        convention
+    )
+
+
+# -----------------------------------------------
+
+
+def year_fraction(from_iymd: int, to_iymd: int, convention: str = ACT_365F) -> float:
+    """
+    Calculates the year fraction between two dates, by the day count convention
+
+    :param from_iymd: the from date in Ymd format
+    :param to_iymd: the to date in Ymd format
+    :param convention: the day count convention, see ``CONVENTIONS``
+    :return: the year fraction, negative when the to date is before the from date
+    """
+
+    from_parts = udc.explode_iymd(from_iymd)
+    to_parts = udc.explode_iymd(to_iymd)
+
+    if convention in (THIRTY_360, THIRTY_E_360):
+        return _thirty_360(from_parts, to_parts, convention) / 360
+
+    return _year_fraction(
+        udc.epoch_from_parts(*from_parts), from_parts,
+        udc.epoch_from_parts(*to_parts), to_parts,
+        convention
+    )
+
+
+# -----------------------------------------------
+# End.
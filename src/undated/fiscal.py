@@ -0,0 +1,322 @@
+"""
+The ``fiscal`` module maps dates to fiscal years, periods, quarters and weeks.
+Fiscal years can start in any month, with calendar month periods,
+or be 52/53 week years with 4-4-5 style periods, as used by retailers.
+
+The period start dates are calculated once, when the ``FiscalCalendar`` is created,
+so mapping a date is a binary search of the table. Use only when dates are valid
+integers in the ``Ymd`` format, or ``YMD`` class objects.
+"""
+# -----------------------------------------------
+
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Optional, Tuple, Union
+
+from . import _core as udc
+from . import _tools as udt
+
+# -----------------------------------------------
+
+PERIODS = 12
+QUARTER_WEEKS = 13
+
+# -----------------------------------------------
+
+
+def _period_start_epochs(year_start: int, pattern: Optional[Tuple[int, ...]]) -> Iterable[int]:
+    """ The start epochs of the periods in the fiscal year """
+
+    if pattern is None:
+        year, month, _ = udc.epoch_to_parts(year_start)
+        return (
+            udc.epoch_from_parts(*udc.add_months(year, month, 1, months))
+            for months in range(PERIODS)
+        )
+
+    weeks = [0]
+    for period in range(PERIODS - 1):
+        weeks.append(weeks[-1] + pattern[period % 3])
+    return (year_start + (week * 7) for week in weeks)
+
+
+# -----------------------------------------------
+
+
+def _year_start_epoch(
+        year: int,
+        start_month: int,
+        pattern: Optional[Tuple[int, ...]],
+        end_day: int,
+        nearest: bool) -> int:
+    """ The start epoch of the fiscal year """
+
+    start_year = year if start_month == 1 else year - 1
+
+    if pattern is None:
+        return udc.epoch_from_parts(start_year, start_month, 1)
+
+    # The day after the previous year end, the end_day in the month before the start month
+    month_end = udc.epoch_from_parts(start_year, start_month, 1) - 1
+    year_end = month_end - ((udc.day_of_week(month_end) - end_day) % 7)
+    if nearest and month_end - year_end > 3:
+        year_end += 7
+    return year_end + 1
+
+
+# -----------------------------------------------
+
+
+class FiscalCalendar:
+    """
+    Fiscal calendar, of the fiscal years between first_year and last_year.
+    Fiscal years are numbered by the calendar year they end in.
+
+    With no pattern, the periods are the calendar months from start_month.
+    With a pattern, the years are 52 or 53 weeks, ending on the end_day of the week
+    falling last in the month before start_month, or nearest the end of that month.
+    The pattern is the weeks in each period of a quarter, such as (4, 4, 5),
+    with any 53rd week added to the last period.
+
+    :param start_month: the month the fiscal year starts in, 1 to 12
+    :param pattern: the weeks in each period of a quarter, (4, 4, 5), (4, 5, 4) or (5, 4, 4)
+    :param end_day: the day of the week the years end on, with a pattern. Sunday = 0... Saturday = 6
+    :param nearest: with a pattern, the years end on the end_day nearest the end of the month,
+      rather than the last in the month
+    :param first_year: the first fiscal year of the calendar
+    :param last_year: the last fiscal year of the calendar
+    """
+
+    # Disabling too many arguments, as each describes the calendar
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+
+    def __init__(
+            self,
+            start_month: int = 1,
+            pattern: Optional[Tuple[int, int, int]] = None,
+            end_day: int = 6,
+            nearest: bool = False,
+            first_year: int = 1900,
+            last_year: int = 2100):
+        """ Initialises the FiscalCalendar class """
+
+        if not 0 < start_month < 13:
+            raise ValueError(f'Invalid start month: {start_month}')
+        if pattern is not None and (len(pattern) != 3 or sum(pattern) != QUARTER_WEEKS):
+            raise ValueError(f'Invalid pattern, expecting three periods of 13 weeks: {pattern}')
+        if not 0 <= end_day < 7:
+            raise ValueError(f'Invalid end day: {end_day}')
+        if first_year > last_year:
+            raise ValueError(f'First year {first_year} is after last year {last_year}')
+
+        self.start_month = start_month
+        """ The month the fiscal year starts in """
+
+        self.pattern = tuple(pattern) if pattern is not None else None
+        """ The weeks in each period of a quarter, or None for calendar months """
+
+        self.first_year = first_year
+        """ The first fiscal year of the calendar """
+
+        self.last_year = last_year
+        """ The last fiscal year of the calendar """
+
+        # The start epoch of each fiscal year, and of each period, ending with the day after
+        self._year_starts = array('i', (
+            _year_start_epoch(year, start_month, self.pattern, end_day, nearest)
+            for year in range(first_year, last_year + 2)
+        ))
+        self._period_starts = array('i')
+        for year_start in self._year_starts[:-1]:
+            self._period_starts.extend(_period_start_epochs(year_start, self.pattern))
+        self._period_starts.append(self._year_starts[-1])
+
+    # ---
+    # Private modules
+
+    def _locate(self, iymd: Union[int, udt.YMD]) -> Tuple[int, int]:
+        """ The epoch of the date and its index in the period starts """
+
+        epoch = udc.epoch_from_parts(*udc.explode_iymd(int(iymd)))
+        index = bisect_right(self._period_starts, epoch) - 1
+        if not 0 <= index < len(self._period_starts) - 1:
+            raise ValueError(f'Date outside of the fiscal calendar years: {iymd}')
+        return epoch, index
+
+    # ---
+
+    def _period_index(self, fiscal_year: int, period: int) -> int:
+        """ The index of the period in the period starts """
+
+        if not (self.first_year <= fiscal_year <= self.last_year and 0 < period <= PERIODS):
+            raise ValueError(f'Invalid fiscal year and period: {fiscal_year}, {period}')
+        return ((fiscal_year - self.first_year) * PERIODS) + period - 1
+
+    # ---
+    # Public modules
+
+    def fiscal_year(self, iymd: Union[int, udt.YMD]) -> int:
+        """
+        The fiscal year of a date
+
+        :param iymd: the date in Ymd format or YMD class object
+        :return: the fiscal year
+        """
+
+        return self.first_year + (self._locate(iymd)[1] // PERIODS)
+
+    # ---
+
+    def fiscal_year_many(self, iymds: Iterable[Union[int, udt.YMD]]) -> array:
+        """
+        The fiscal years of dates
+
+        :param iymds: the dates in Ymd format or YMD class objects
+        :return: array of fiscal years
+        """
+
+        return array('i', (self.fiscal_year(iymd) for iymd in iymds))
+
+    # ---
+
+    def period(self, iymd: Union[int, udt.YMD]) -> int:
+        """
+        The fiscal period of a date
+
+        :param iymd: the date in Ymd format or YMD class object
+        :return: the period, 1 to 12
+        """
+
+        return (self._locate(iymd)[1] % PERIODS) + 1
+
+    # ---
+
+    def period_end(self, fiscal_year: int, period: int) -> int:
+        """
+        The last date of a fiscal period
+
+        :param fiscal_year: the fiscal year
+        :param period: the period, 1 to 12
+        :return: the date in Ymd format
+        """
+
+        return udc.glue_parts(*udc.epoch_to_parts(
+            self._period_starts[self._period_index(fiscal_year, period) + 1] - 1
+        ))
+
+    # ---
+
+    def period_many(self, iymds: Iterable[Union[int, udt.YMD]]) -> array:
+        """
+        The fiscal periods of dates
+
+        :param iymds: the dates in Ymd format or YMD class objects
+        :return: array of periods, 1 to 12
+        """
+
+        return array('i', (self.period(iymd) for iymd in iymds))
+
+    # ---
+
+    def period_start(self, fiscal_year: int, period: int) -> int:
+        """
+        The first date of a fiscal period
+
+        :param fiscal_year: the fiscal year
+        :param period: the period, 1 to 12
+        :return: the date in Ymd format
+        """
+
+        return udc.glue_parts(*udc.epoch_to_parts(
+            self._period_starts[self._period_index(fiscal_year, period)]
+        ))
+
+    # ---
+
+    def quarter(self, iymd: Union[int, udt.YMD]) -> int:
+        """
+        The fiscal quarter of a date
+
+        :param iymd: the date in Ymd format or YMD class object
+        :return: the quarter, 1 to 4
+        """
+
+        return ((self._locate(iymd)[1] % PERIODS) // 3) + 1
+
+    # ---
+
+    def quarter_many(self, iymds: Iterable[Union[int, udt.YMD]]) -> array:
+        """
+        The fiscal quarters of dates
+
+        :param iymds: the dates in Ymd format or YMD class objects
+        :return: array of quarters, 1 to 4
+        """
+
+        return array('i', (self.quarter(iymd) for iymd in iymds))
+
+    # ---
+
+    def week(self, iymd: Union[int, udt.YMD]) -> int:
+        """
+        The fiscal week of a date, counted in 7 days from the start of the fiscal year
+
+        :param iymd: the date in Ymd format or YMD class object
+        :return: the week, 1 to 53
+        """
+
+        epoch, index = self._locate(iymd)
+        return ((epoch - self._year_starts[index // PERIODS]) // 7) + 1
+
+    # ---
+
+    def week_many(self, iymds: Iterable[Union[int, udt.YMD]]) -> array:
+        """
+        The fiscal weeks of dates
+
+        :param iymds: the dates in Ymd format or YMD class objects
+        :return: array of weeks, 1 to 53
+        """
+
+        return array('i', (self.week(iymd) for iymd in iymds))
+
+    # ---
+
+    def weeks_in_year(self, fiscal_year: int) -> int:
+        """
+        The number of weeks in a fiscal year, 52 or 53 with a pattern
+
+        :param fiscal_year: the fiscal year
+        :return: the number of weeks, complete or not
+        """
+
+        index = self._period_index(fiscal_year, 1) // PERIODS
+        return (self._year_starts[index + 1] - self._year_starts[index] + 6) // 7
+
+    # ---
+
+    def year_end(self, fiscal_year: int) -> int:
+        """
+        The last date of a fiscal year
+
+        :param fiscal_year: the fiscal year
+        :return: the date in Ymd format
+        """
+
+        return self.period_end(fiscal_year, PERIODS)
+
+    # ---
+
+    def year_start(self, fiscal_year: int) -> int:
+        """
+        The first date of a fiscal year
+
+        :param fiscal_year: the fiscal year
+        :return: the date in Ymd format
+        """
+
+        return self.period_start(fiscal_year, 1)
+
+
+# -----------------------------------------------
+# End.
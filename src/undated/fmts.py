@@ -3,12 +3,16 @@ The ``fmts`` (formattings) module comes into play when the date data format is u
 It has two key class objects. The ``Deriver`` class derives the date format from a list
 of dates, returning an ``UndatedFormat`` class object, which contains the information
 required by the ``as_parts`` function to extract the date elements.
+For columns of dates, ``as_iymd_many`` and ``as_iymd_array`` convert the dates
+to the ``Ymd`` format.
 """
 # -----------------------------------------------
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Union
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from . import _core as udc
 from . import _data as udd
@@ -48,6 +52,170 @@ TEXT_MONTH = 302
 TIME_LOOP = 303
 TIME_ONCE = 304
 Y2_TO_Y4 = 305
+FIRST_DAY = 306
+
+# ---
+
+_SEPARATOR_TABLE = str.maketrans(' -/.', '\t\t\t\t')
+_STANDARD_TABLE = str.maketrans('ÄÉÛ', 'AEU')
+
+# -----------------------------------------------
+
+
+@lru_cache(maxsize=256)
+def _converted_format(fmt: str, yy_pivot: Optional[int]) -> UndatedFormat:
+    """ The string format converted once, keeping its compiled parsers """
+
+    return convert_format(fmt, yy_pivot)
+
+
+# -----------------------------------------------
+
+
+def _compiled_month_lookup(replacements: List[Tuple[str, str]]) -> Callable:
+    """
+    Function replacing the month name with its number, for text months with separators.
+    The month is a whole part, so the parts that are not digits are looked up, taking the first
+    """
+
+    ranked = {}
+    for rank, (month, number) in enumerate(replacements):
+        ranked.setdefault(month.strip('\t'), (rank, number))
+
+    # The lower and title case months, found without standardising
+    for month, found in list(ranked.items()):
+        for variant in (month.lower(), month.title()):
+            if _standardise_text(variant) == month:
+                ranked.setdefault(variant, found)
+
+    def text_month_lookup(sdate: str) -> str:
+        """ Separates the parts, replacing the first month name found and joining the parts """
+        parts = sdate.translate(_SEPARATOR_TABLE).strip('\t').split('\t')
+        found = index = None
+        for i in range(1, len(parts) - 1):
+            if not parts[i].isdigit():
+                month = ranked.get(parts[i]) or ranked.get(_standardise_text(parts[i]))
+                if month is not None and (found is None or month < found):
+                    found, index = month, i
+        if found is not None:
+            parts[index] = found[1]
+        return ''.join(parts)
+
+    return text_month_lookup
+
+
+# -----------------------------------------------
+
+
+def _compiled_split(split: Tuple[int, ...], keys: Tuple[str, ...]) -> Callable:
+    """ Function splitting an int into the year, month and day, as _split_int, by position """
+
+    factors = [10 ** i for i in split]
+    year, month = keys.index(YEAR), keys.index(MONTH)
+
+    if len(split) == 2:  # Year and month only, as the first of the month
+        first_factor, second_factor = factors
+
+        def split_two(value: int) -> Tuple[int, int, int]:
+            """ Splits the int into the two parts """
+            first, second = divmod(value, second_factor)
+            parts = (first % first_factor, second)
+            return parts[year], parts[month], 1
+
+        return split_two
+
+    first_factor, second_factor, third_factor = factors
+    day = keys.index(DAY)
+
+    def split_three(value: int) -> Tuple[int, int, int]:
+        """ Splits the int into the three parts """
+        value, third = divmod(value, third_factor)
+        first, second = divmod(value, second_factor)
+        parts = (first % first_factor, second, third)
+        return parts[year], parts[month], parts[day]
+
+    return split_three
+
+
+# -----------------------------------------------
+
+
+def _compiled_steps(steps: dict) -> List[Callable]:
+    """ The functions of the steps, applied in order to date strings, see UndatedFormat.compile """
+
+    functions = []
+
+    if TIME_ONCE in steps:
+        char = steps[TIME_ONCE]
+        functions.append(lambda sdate: _int_only_up_to_char(sdate, char))
+
+    if TIME_LOOP in steps:
+        functions.append(_time_loop)
+
+    # The month lookup of separated text months also separates the parts
+    if SEPARATORS in steps and not (
+            TEXT_MONTH in steps and not isinstance(steps[TEXT_MONTH], tuple)):
+        functions.append(_separators)
+
+    if TEXT_MONTH in steps:
+        functions.append(_compiled_text_month(steps))
+
+    return functions
+
+
+# -----------------------------------------------
+
+
+def _compiled_text_month(steps: dict) -> Callable:
+    """ Function replacing the month name with its number, for text months """
+
+    step = steps[TEXT_MONTH]
+
+    if isinstance(step, tuple):  # (language, position, used_parts)
+        _, position, used_parts = step
+        numbers = {}
+        for i, month in enumerate(udd.MONTH_NAMES[step[0]]):
+            numbers.setdefault(month, str(i + 1).zfill(2))
+
+        last_part = max(position, *used_parts)
+
+        def text_month_part(sdate: str) -> Optional[str]:
+            """ Replaces the month name in its position, None when there are too few parts """
+            parts = _standardise_text(sdate)
+            parts = parts.split('\t') if '\t' in parts else _split_str(parts)
+            if len(parts) <= last_part:
+                return None
+            parts[position] = numbers.get(parts[position], parts[position])
+            return '\t'.join([parts[i] for i in used_parts])
+
+        return text_month_part
+
+    if isinstance(step, list):
+        langs = step
+    elif isinstance(step, str):
+        langs = [step]
+    else:
+        langs = list(udd.MONTH_NAMES)
+
+    template = '\t{}\t' if SEPARATORS in steps else '{}'
+    replacements = [
+        (template.format(month), str(i + 1).zfill(2))
+        for lang in langs for i, month in enumerate(udd.MONTH_NAMES[lang])
+    ]
+
+    if SEPARATORS in steps:
+        return _compiled_month_lookup(replacements)
+
+    def text_month_search(sdate: str) -> str:
+        """ Replaces the first month name found """
+        sdate = _standardise_text(sdate)
+        for month, number in replacements:
+            if month in sdate:
+                return sdate.replace(month, number)
+        return sdate  # Month not found
+
+    return text_month_search
+
 
 # -----------------------------------------------
 
@@ -126,10 +294,7 @@ def _split_str(string: str) -> list:
 def _separators(sdate):
     """ Standardises the separator to a tab character """
 
-    for sep in [' ', '-', '/', '.']:
-        sdate = sdate.replace(sep, '\t')
-
-    return sdate.strip('\t')
+    return sdate.translate(_SEPARATOR_TABLE).strip('\t')
 
 
 # -----------------------------------------------
@@ -138,47 +303,20 @@ def _separators(sdate):
 def _standardise_text(sdate: str) -> str:
     """ Standardises the date string to get a better match """
 
-    return sdate.upper().replace('Ä', 'A').replace('É', 'E').replace('Û', 'U')
+    return sdate.upper().translate(_STANDARD_TABLE)
 
 
 # -----------------------------------------------
 
 
-def _text_month(sdate: str, steps: dict) -> str:
-    """ Processes the date if text is found within the date string """
-
-    sdate = _standardise_text(sdate)
-    step = steps[TEXT_MONTH]
-
-    # ---
-
-    if isinstance(step, tuple):  # (language, position, used_parts)
-        parts = sdate.split('\t') if '\t' in sdate else _split_str(sdate)
-        for i, month in enumerate(udd.MONTH_NAMES[step[0]]):
-            if month == parts[step[1]]:
-                parts[step[1]] = str(i + 1).zfill(2)
-                break
-        return '\t'.join([parts[i] for i in step[2]])
-
-    # ---
-
-    separators = SEPARATORS in steps
-
-    if isinstance(step, list):
-        langs = step
-    elif isinstance(step, str):
-        langs = [step]
-    else:
-        langs = list(udd.MONTH_NAMES)
-
-    for lang in langs:
-        for i, month in enumerate(udd.MONTH_NAMES[lang]):
-            if separators:
-                month = f'\t{month}\t'
-            if month in sdate:
-                return sdate.replace(month, str(i + 1).zfill(2))
+def _time_loop(sdate: str) -> str:
+    """ Removes the space separated time elements, until the date digits remain """
 
-    return sdate  # Month not found
+    sdate_digits = ''.join(filter(str.isdigit, sdate))
+    while ' ' in sdate and len(sdate_digits) > 8:
+        sdate = sdate.rsplit(' ', 1)[0]
+        sdate_digits = ''.join(filter(str.isdigit, sdate))
+    return sdate
 
 
 # -----------------------------------------------
@@ -219,6 +357,10 @@ class Deriver:
             YY_PIVOT: PIVOT_YEAR
         }
 
+        self._candidates: Optional[list] = None
+        self._expected_len: Optional[int] = None
+        self._result: Optional[UndatedFormat] = None
+
     # ---
     # Private methods
 
@@ -239,6 +381,38 @@ class Deriver:
 
     # ---
 
+    def _formats(self, sdate: str, steps: dict) -> list[tuple]:
+        """ The possible formats of the date, adding the steps required """
+
+        if self._expected_len is None:
+            adjust_len = (
+                (2 if Y2 in self.params[HINTS] else 0) + (2 if YM in self.params[HINTS] else 0)
+            )
+            self._expected_len = 8 - adjust_len
+
+        if Y2 in self.params[HINTS]:
+            steps[Y2_TO_Y4] = self.params[YY_PIVOT]
+        if YM in self.params[HINTS]:
+            steps[FIRST_DAY] = None
+        if not sdate.isdigit():
+            sdate = self._expunge_time(sdate, steps)
+        if sdate.isdigit():
+            return (
+                self._only_digits(sdate, self._expected_len)
+                if self._expected_len - 2 < len(sdate) <= self._expected_len
+                else []
+            )
+
+        sdate = _separators(sdate)
+        no_seps = sdate.replace('\t', '')
+        if sdate != no_seps:
+            steps[SEPARATORS] = None
+        if no_seps.isdigit() and self._expected_len - 2 < len(no_seps) <= self._expected_len:
+            return self._separated_digits(sdate, self._expected_len)
+        return self._text_month(sdate, steps)
+
+    # ---
+
     def _get_splits(self, dlen) -> list:
         """ Gets the splits depending on the hints """
 
@@ -402,60 +576,83 @@ class Deriver:
     # ---
     # Public methods
 
-    def search(self, dates: Union[list, str, tuple]) -> Union[UndatedFormat, None]:
+    def feed(self, sdate: Union[int, str]) -> bool:
         """
-        Search through a list of dates to derive the date format
+        Feeds one date to derive the date format, keeping the candidate formats between calls,
+        so dates can be fed as they are read, without buffering the column.
+        Once the candidates collapse to one format, further dates are ignored, see ``result``
 
-        .. caution::
+        :param sdate: the date, as str or int
+        :return: True while more dates are needed, False once the format is derived
+        """
 
-           All of the dates in the list passed to the search method
-           are expected to be in the same format.
+        if self._result is not None:
+            return False
 
-        :param dates: list or tuple of dates to search. Or str for one date
-        :return: the derived ``UndatedFormat`` object
+        steps = {}
+        formats = self._formats(str(sdate), steps)
+
+        # The surviving candidates, ignoring dates matching none of them
+        if len(formats) > 1 and self._candidates is not None:
+            formats = [i for i in formats if i in self._candidates]
+            if not formats:
+                return True
+
+        if len(formats) == 1:
+            self._result = UndatedFormat(formats[0][0], formats[0][1], steps, True)
+            return False
+
+        if formats:
+            self._candidates = formats
+        return True
+
+    # ---
+
+    def reset(self):
+        """
+        Clears the candidate formats and derived format, to feed dates of another format
         """
 
-        if isinstance(dates, str):
-            dates = [dates]
+        self._candidates = None
+        self._expected_len = None
+        self._result = None
 
-        # ---
+    # ---
 
-        adjust_len = (2 if Y2 in self.params[HINTS] else 0) + (2 if YM in self.params[HINTS] else 0)
-        expected_len = 8 - adjust_len
+    def result(self) -> Union[UndatedFormat, None]:
+        """
+        The format derived from the dates fed
 
-        # ---
+        :return: the derived ``UndatedFormat`` object, or None while the format is ambiguous
+        """
 
-        for sdate in dates:
-            sdate = str(sdate)
-            steps = {}
-            if Y2 in self.params[HINTS]:
-                steps[Y2_TO_Y4] = self.params[YY_PIVOT]
-            if not sdate.isdigit():
-                sdate = self._expunge_time(sdate, steps)
-            if sdate.isdigit():
-                formats = (
-                    self._only_digits(sdate, expected_len)
-                    if expected_len - 2 < len(sdate) <= expected_len
-                    else []
-                )
-            else:
-                sdate = _separators(sdate)
-                no_seps = sdate.replace('\t', '')
-                if sdate != no_seps:
-                    steps[SEPARATORS] = None
-                if no_seps.isdigit() and expected_len - 2 < len(no_seps) <= expected_len:
-                    formats = self._separated_digits(sdate, expected_len)
-                else:
-                    formats = self._text_month(sdate, steps)
+        return self._result
 
-            # ---
+    # ---
 
-            if formats and len(formats) == 1:
-                return UndatedFormat(formats[0][0], formats[0][1], steps, True)
+    def search(self, dates: Union[Iterable, str]) -> Union[UndatedFormat, None]:
+        """
+        Search through a list of dates to derive the date format.
+        Any iterable can be searched, such as a generator of the rows of a file,
+        consuming only the dates needed, see ``feed``
 
-        # ---
+        .. caution::
 
-        return None
+           All of the dates in the list passed to the search method
+           are expected to be in the same format.
+
+        :param dates: list, tuple or other iterable of dates to search. Or str for one date
+        :return: the derived ``UndatedFormat`` object
+        """
+
+        if isinstance(dates, str):
+            dates = [dates]
+
+        self.reset()
+        for sdate in dates:
+            if not self.feed(sdate):
+                break
+        return self._result
 
     # ---
 
@@ -498,69 +695,264 @@ class UndatedFormat:
     keys: list[str, str, str]
     steps: dict
     valid: bool
+    _parsers: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _cache_size: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    # ---
+
+    def __copy__(self) -> UndatedFormat:
+        """ Called by copy.copy(), the copy compiling its own parsers """
+
+        udfmt = UndatedFormat.__new__(UndatedFormat)
+        udfmt.__dict__.update(self.__getstate__())
+        return udfmt
+
+    # ---
+
+    def __getstate__(self) -> dict:
+        """ Called by pickle and copy, leaving out the compiled parsers """
+
+        state = self.__dict__.copy()
+        state['_parsers'] = {}
+        return state
+
+    # ---
+
+    def __setstate__(self, state: dict):
+        """ Called by pickle and copy, the object compiling its own parsers """
+
+        self.__dict__.update(state)
+        self._parsers = {}
+
+    # ---
+
+    def cache_clear(self):
+        """
+        Clears the cached results and statistics, keeping the cache enabled
+        """
+
+        for parser in self._parsers.values():
+            if hasattr(parser, 'cache_clear'):
+                parser.cache_clear()
+
+    # ---
+
+    def cache_info(self) -> Dict[str, tuple]:
+        """
+        The cache statistics, hits, misses, maxsize and currsize, of each compiled parser.
+        Under the name ``parts`` for ``as_parts``, and ``iymd`` for the Ymd format functions.
+
+        :return: dict of parser name and statistics
+        """
+
+        return {
+            'iymd' if iymd else 'parts': parser.cache_info()
+            for iymd, parser in self._parsers.items() if hasattr(parser, 'cache_info')
+        }
+
+    # ---
+
+    def compile(self, iymd: bool = False) -> Callable[[Union[int, str]], Union[tuple, int, None]]:
+        """
+        Compiles the format into a parser, a function taking the date and returning its parts,
+        as ``as_parts``. Only the steps the format needs are kept, so each date is parsed
+        without checking the format again. Compiled once, on the first call.
+
+        :param iymd: the parser returns the date in Ymd format, as ``as_iymd``
+        :return: function taking the date as a str, bytes or int, returning year, month, day or None
+        """
+
+        if iymd in self._parsers:
+            return self._parsers[iymd]
+
+        # Year and month formats give the first of the month only with the YM hint FIRST_DAY step
+        compiled = self.valid and (len(self.split) == 3 or FIRST_DAY in self.steps)
+        parser = _compiled_parser(self, iymd) if compiled else lambda sdate: None
+        if self._cache_size is not None:
+            parser = lru_cache(self._cache_size)(parser)
+
+        self._parsers[iymd] = parser
+        return parser
+
+    # ---
+
+    def disable_cache(self):
+        """
+        Reverts to the uncached parsers and releases the cached results
+        """
+
+        self._cache_size = None
+        self._parsers.clear()
+
+    # ---
+
+    def enable_cache(self, maxsize: int = 4096):
+        """
+        Enables the cache of the parsed dates, for columns with few distinct values.
+        The results of the compiled parsers are remembered by the raw date, str, bytes or int,
+        evicting the least recently used, so repeated dates are parsed once.
+        Copied and pickled formats keep the maximum size, with a cache of their own.
+
+        :param maxsize: the maximum number of dates remembered by each parser
+        """
+
+        self._cache_size = maxsize
+        self._parsers.clear()
 
 
 # -----------------------------------------------
 
 
-def as_parts(
+def _compiled_parser(udfmt: UndatedFormat, iymd: bool) -> Callable:
+    """ The parser of the valid format, see UndatedFormat.compile """
+
+    steps = _compiled_steps(udfmt.steps)
+    split = _compiled_split(tuple(udfmt.split), tuple(udfmt.keys))
+    yy_pivot = _validated_yy_pivot(udfmt.steps.get(Y2_TO_Y4))
+
+    def parser(sdate: Union[int, str]) -> Union[tuple, int, None]:
+        """ Converts the sdate to year, month, day, or Ymd format, based on the compiled format """
+
+        if not sdate:
+            return None
+
+        if isinstance(sdate, bytes):
+            sdate = sdate.decode()
+
+        if isinstance(sdate, str):
+            for step in steps:
+                sdate = step(sdate)
+                if sdate is None:
+                    return None
+            if not sdate.isdigit():
+                sdate = sdate.replace('\t', '')  # Usually only separators remain
+                if not sdate.isdigit():
+                    sdate = ''.join(filter(str.isdigit, sdate))
+                    if not sdate:  # No digits, such as N/A
+                        return None
+            sdate = int(sdate)
+
+        year, month, day = split(sdate)
+        if year < 100:
+            year = _y2_to_y4(year, yy_pivot)
+
+        # As udc.is_valid, only looking up the days in the month for the last days
+        if 1582 < year < 10000 and 0 < month < 13 and 0 < day and (
+                day < 29 or day <= udc.DAYS_IN_MONTH[udc.is_leap_year(year)][month]):
+            if iymd:
+                return (year * 1_00_00) + (month * 1_00) + day
+            return year, month, day
+        return None
+
+    return parser
+
+
+# -----------------------------------------------
+
+
+def _resolved_format(fmt: Union[str, UndatedFormat], yy_pivot: Optional[int]) -> UndatedFormat:
+    """ The format, converting string formats once """
+
+    return _converted_format(fmt, yy_pivot) if isinstance(fmt, str) else fmt
+
+
+# -----------------------------------------------
+
+
+def as_iymd(
         sdate: Union[int, str],
         fmt: Union[str, UndatedFormat],
-        yy_pivot: int = None) -> Union[tuple, None]:
+        yy_pivot: int = None) -> Union[int, None]:
     """
-    Converts the sdate to year, month, day, based on the format
+    Converts the sdate to an integer in Ymd format, based on the format.
+    As ``as_parts``, without the parts
 
     :param sdate: The date as a str or int
     :param fmt: The date format, as either a basic format as a string, or a derived format
     :param yy_pivot: The pivot year for two digit years. Use with string based formats
+    :return: The date in Ymd format, or None when not a valid date
     """
 
     if not sdate or not fmt:
         return None
 
-    # ---
+    return _resolved_format(fmt, yy_pivot).compile(True)(sdate)
 
-    udfmt = convert_format(fmt, yy_pivot) if isinstance(fmt, str) else fmt
-    if not udfmt.valid:
-        return None
 
-    # ---
+# -----------------------------------------------
 
-    if TIME_ONCE in udfmt.steps:
-        sdate = _int_only_up_to_char(sdate, udfmt.steps[TIME_ONCE])
 
-    if TIME_LOOP in udfmt.steps:
-        sdate_digits = ''.join(filter((lambda c: c.isdigit()), sdate))
-        while ' ' in sdate and len(sdate_digits) > 8:
-            sdate = sdate.rsplit(' ', 1)[0]
-            sdate_digits = ''.join(filter((lambda c: c.isdigit()), sdate))
+def as_iymd_array(
+        sdates: Iterable[Union[int, str]],
+        fmt: Union[str, UndatedFormat],
+        yy_pivot: int = None,
+        invalid: int = 0,
+        out: Optional[array] = None) -> array:
+    """
+    Converts the sdates to integers in Ymd format, based on the format, in one call.
+    For loading columns in chunks, pass the array of the previous chunks as out.
 
-    if SEPARATORS in udfmt.steps:
-        sdate = _separators(sdate)
+    :param sdates: The dates as str or int
+    :param fmt: The date format, as either a basic format as a string, or a derived format
+    :param yy_pivot: The pivot year for two digit years. Use with string based formats
+    :param invalid: The value for dates that are not valid, including values without digits
+    :param out: Optional array to extend, rather than creating a new array
+    :return: array of dates in Ymd format
+    """
 
-    if TEXT_MONTH in udfmt.steps and isinstance(sdate, str):
-        sdate = _text_month(sdate, udfmt.steps)
+    # Disabling too many arguments, as the last two are optional
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
 
-    # ---
+    iymds = list(map(_resolved_format(fmt, yy_pivot).compile(True), sdates))
+    if None in iymds:
+        iymds = [invalid if iymd is None else iymd for iymd in iymds]
 
-    if isinstance(sdate, str):
-        if sdate.isdigit():
-            sdate = int(sdate)
-        else:
-            sdate = int(''.join(filter((lambda c: c.isdigit()), sdate)))
+    if out is None:
+        return array('i', iymds)
+    out.extend(iymds)
+    return out
 
-    parts = _split_int(sdate, udfmt.split, udfmt.keys)
 
-    # ---
+# -----------------------------------------------
 
-    if parts[YEAR] < 100:
-        parts[YEAR] = _y2_to_y4(parts[YEAR], _validated_yy_pivot(udfmt.steps.get(Y2_TO_Y4)))
 
-    # ---
+def as_iymd_many(
+        sdates: Iterable[Union[int, str]],
+        fmt: Union[str, UndatedFormat],
+        yy_pivot: int = None) -> Iterator[Union[int, None]]:
+    """
+    Generates the sdates as integers in Ymd format, based on the format.
+    The format is resolved once, for any iterable, such as the rows of a file
 
-    if udc.is_valid(**parts):
-        return parts['year'], parts['month'], parts['day']
-    return None
+    :param sdates: The dates as str or int
+    :param fmt: The date format, as either a basic format as a string, or a derived format
+    :param yy_pivot: The pivot year for two digit years. Use with string based formats
+    :return: generator of dates in Ymd format, or None when not a valid date
+    """
+
+    yield from map(_resolved_format(fmt, yy_pivot).compile(True), sdates)
+
+
+# -----------------------------------------------
+
+
+def as_parts(
+        sdate: Union[int, str],
+        fmt: Union[str, UndatedFormat],
+        yy_pivot: int = None) -> Union[tuple, None]:
+    """
+    Converts the sdate to year, month, day, based on the format.
+    String formats are compiled once, see ``UndatedFormat.compile``
+
+    :param sdate: The date as a str or int
+    :param fmt: The date format, as either a basic format as a string, or a derived format
+    :param yy_pivot: The pivot year for two digit years. Use with string based formats
+    """
+
+    if not sdate or not fmt:
+        return None
+
+    return _resolved_format(fmt, yy_pivot).compile()(sdate)
 
 
 # -----------------------------------------------
@@ -0,0 +1,335 @@
+"""
+The ``holidays`` module calculates holidays from rules, rather than lists maintained year by year.
+Rules are fixed dates, such as the 25th December, the nth or last weekday of a month,
+such as the last monday of May, or days relative to Easter, such as Good Friday.
+Holidays falling on weekends can be moved by the observance, such as ``NEAREST_WEEKDAY``.
+
+The holidays of a year are calculated once by ``HolidayRules`` and kept,
+with the ``BusinessCalendar`` of a range of years built directly from their epochs.
+"""
+# -----------------------------------------------
+
+from array import array
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from . import _core as udc
+
+# -----------------------------------------------
+
+NEAREST_WEEKDAY = 1  # Saturday to the friday before, sunday to the monday after
+NEXT_MONDAY = 2  # Saturday and sunday to the monday after
+SUNDAY_TO_MONDAY = 3  # Sunday to the monday after
+SUBSTITUTE = 4  # Non working days, and other holidays, to the next working day
+
+OBSERVANCES = (None, NEAREST_WEEKDAY, NEXT_MONDAY, SUNDAY_TO_MONDAY, SUBSTITUTE)
+
+# The days moved on each day of the week, sunday first, by observance
+_OBSERVANCE_DAYS = {
+    NEAREST_WEEKDAY: (1, 0, 0, 0, 0, 0, -1),
+    NEXT_MONDAY: (1, 0, 0, 0, 0, 0, 2),
+    SUNDAY_TO_MONDAY: (1, 0, 0, 0, 0, 0, 0)
+}
+
+# -----------------------------------------------
+
+
+def easter_epoch(year: int) -> int:
+    """
+    The epoch of Easter Sunday in the Gregorian calendar, by the anonymous Gregorian algorithm
+
+    :param year: the year
+    :return: the epoch
+    """
+
+    golden = year % 19
+    century, years = divmod(year, 100)
+    leap_centuries, century_years = divmod(century, 4)
+    correction = (century + 8) // 25
+    epact = ((19 * golden) + century - leap_centuries - ((century - correction + 1) // 3) + 15) % 30
+    weekday = (32 + (2 * century_years) + (2 * (years // 4)) - epact - (years % 4)) % 7
+    offset = (golden + (11 * epact) + (22 * weekday)) // 451
+    month, day = divmod(epact + weekday - (7 * offset) + 114, 31)
+    return udc.epoch_from_parts(year, month, day + 1)
+
+
+# -----------------------------------------------
+
+
+class HolidayRule:
+    """
+    Holiday rule, the epoch of the holiday in each year. Created by ``fixed``,
+    ``nth_weekday`` or ``easter``, rather than directly.
+
+    :param name: the name of the holiday
+    :param epoch_of_year: function returning the epoch of the holiday in a year
+    :param observance: where the holiday moves to from a weekend, see ``OBSERVANCES``
+    :param first_year: the first year of the holiday, or None
+    :param last_year: the last year of the holiday, or None
+    """
+
+    # Disabling too many arguments, as each describes the rule
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+
+    def __init__(
+            self,
+            name: str,
+            epoch_of_year: Callable[[int], int],
+            observance: Optional[int] = None,
+            first_year: Optional[int] = None,
+            last_year: Optional[int] = None):
+        """ Initialises the HolidayRule class """
+
+        if observance not in OBSERVANCES:
+            raise ValueError(f'Invalid observance: {observance}')
+
+        self.name = name
+        """ The name of the holiday """
+
+        self.observance = observance
+        """ Where the holiday moves to from a weekend """
+
+        self.first_year = first_year
+        """ The first year of the holiday, or None """
+
+        self.last_year = last_year
+        """ The last year of the holiday, or None """
+
+        self._epoch_of_year = epoch_of_year
+
+    # ---
+
+    def __repr__(self) -> str:
+        """ Called by built-in repr() method, returning the name of the rule """
+        return f'HolidayRule({self.name!r})'
+
+    # ---
+
+    def epoch(self, year: int) -> Optional[int]:
+        """
+        The epoch of the holiday in a year, before any observance
+
+        :param year: the year
+        :return: the epoch, or None when the holiday is not in the year
+        """
+
+        if (self.first_year is not None and year < self.first_year) or (
+                self.last_year is not None and year > self.last_year):
+            return None
+        return self._epoch_of_year(year)
+
+
+# -----------------------------------------------
+
+
+def easter(
+        name: str,
+        days: int = 0,
+        first_year: Optional[int] = None,
+        last_year: Optional[int] = None) -> HolidayRule:
+    """
+    Creates a holiday rule for a day relative to Easter Sunday, such as -2 for Good Friday
+
+    :param name: the name of the holiday
+    :param days: the days from Easter Sunday
+    :param first_year: the first year of the holiday, or None
+    :param last_year: the last year of the holiday, or None
+    :return: HolidayRule class object
+    """
+
+    return HolidayRule(name, lambda year: easter_epoch(year) + days, None, first_year, last_year)
+
+
+# -----------------------------------------------
+
+
+def fixed(
+        name: str,
+        month: int,
+        day: int,
+        observance: Optional[int] = None,
+        first_year: Optional[int] = None,
+        last_year: Optional[int] = None) -> HolidayRule:
+    """
+    Creates a holiday rule for the same date each year, such as the 25th December
+
+    :param name: the name of the holiday
+    :param month: the month, 1 to 12
+    :param day: the day of the month, the 29th February only falling in leap years
+    :param observance: where the holiday moves to from a weekend, see ``OBSERVANCES``
+    :param first_year: the first year of the holiday, or None
+    :param last_year: the last year of the holiday, or None
+    :return: HolidayRule class object
+    """
+
+    # Disabling too many arguments, as each describes the rule
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+
+    if not udc.is_valid(2000, month, day):
+        raise ValueError(f'Invalid month and day: {month}, {day}')
+
+    def epoch_of_year(year: int) -> Optional[int]:
+        """ The epoch of the date in the year, or None for the 29th February of other years """
+        if not udc.is_valid(year, month, day):
+            return None
+        return udc.epoch_from_parts(year, month, day)
+
+    return HolidayRule(name, epoch_of_year, observance, first_year, last_year)
+
+
+# -----------------------------------------------
+
+
+def nth_weekday(
+        name: str,
+        month: int,
+        weekday: int,
+        nth: int,
+        first_year: Optional[int] = None,
+        last_year: Optional[int] = None) -> HolidayRule:
+    """
+    Creates a holiday rule for the nth weekday of a month, such as the third monday of January,
+    or counting from the end of the month when negative, such as -1 for the last monday of May
+
+    :param name: the name of the holiday
+    :param month: the month, 1 to 12
+    :param weekday: the day of the week, Sunday = 0... Saturday = 6
+    :param nth: the weekday of the month, 1 to 4, or -1 to -4 counting back from the end
+    :param first_year: the first year of the holiday, or None
+    :param last_year: the last year of the holiday, or None
+    :return: HolidayRule class object
+    """
+
+    # Disabling too many arguments, as each describes the rule
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+
+    if not 0 < month < 13:
+        raise ValueError(f'Invalid month: {month}')
+    udc.nth_weekday(2000, month, weekday, nth)  # Validates the weekday and nth
+
+    def epoch_of_year(year: int) -> int:
+        """ The epoch of the nth weekday of the month in the year """
+        return udc.epoch_from_parts(year, month, udc.nth_weekday(year, month, weekday, nth))
+
+    return HolidayRule(name, epoch_of_year, None, first_year, last_year)
+
+
+# -----------------------------------------------
+
+
+class HolidayRules:
+    """
+    Holidays calculated from rules. The holidays of each year are calculated once and kept,
+    as sorted epochs, for the ``BusinessCalendar`` or business day functions.
+
+    :param rules: the ``HolidayRule`` class objects, see ``fixed``, ``nth_weekday`` and ``easter``.
+      Substitute holidays are moved past the holidays of the rules before them.
+    :param weekmask: the working days of the week, for ``SUBSTITUTE`` observance,
+      see WEEKMASK_MON_FRI
+    """
+
+    def __init__(self, rules: Iterable[HolidayRule], weekmask: int = udc.WEEKMASK_MON_FRI):
+        """ Initialises the HolidayRules class """
+
+        udc._weekmask_offsets(weekmask)  # pylint: disable=protected-access
+
+        self.rules = tuple(rules)
+        """ The holiday rules """
+
+        self.weekmask = weekmask
+        """ The working days of the week, for substitute holidays """
+
+        self._years: Dict[int, Tuple[int, ...]] = {}
+
+    # ---
+    # Private modules
+
+    def _observed(self, epoch: int, observance: Optional[int], taken: Iterable[int]) -> int:
+        """ The epoch the holiday is observed on, moved past the holidays taken by substitution """
+
+        if observance is None:
+            return epoch
+        if observance != SUBSTITUTE:
+            return epoch + _OBSERVANCE_DAYS[observance][udc.day_of_week(epoch)]
+
+        while not (self.weekmask >> udc.day_of_week(epoch)) & 1 or epoch in taken:
+            epoch += 1
+        return epoch
+
+    # ---
+    # Public modules
+
+    def calendar(self, first_year: int, last_year: int) -> udc.BusinessCalendar:
+        """
+        Creates a BusinessCalendar of the holidays between the years, with the weekmask
+
+        :param first_year: the first year
+        :param last_year: the last year, inclusive
+        :return: BusinessCalendar class object
+        """
+
+        return udc.BusinessCalendar.from_epochs(self.epochs(first_year, last_year), self.weekmask)
+
+    # ---
+
+    def dates(self, first_year: int, last_year: int) -> array:
+        """
+        The holiday dates between the years
+
+        :param first_year: the first year
+        :param last_year: the last year, inclusive
+        :return: array of dates in Ymd format, sorted
+        """
+
+        return array('i', (
+            udc.glue_parts(*udc.epoch_to_parts(epoch))
+            for epoch in self.epochs(first_year, last_year)
+        ))
+
+    # ---
+
+    def epochs(self, first_year: int, last_year: int) -> array:
+        """
+        The holiday epochs between the years
+
+        :param first_year: the first year
+        :param last_year: the last year, inclusive
+        :return: array of epochs, sorted
+        """
+
+        epochs = array('i')
+        for year in range(first_year, last_year + 1):
+            epochs.extend(self.year(year))
+
+        # Observance can move holidays into the year before or after
+        if any(epochs[i] > epochs[i + 1] for i in range(len(epochs) - 1)):
+            epochs = array('i', sorted(epochs))
+        return epochs
+
+    # ---
+
+    def year(self, year: int) -> Tuple[int, ...]:
+        """
+        The holiday epochs of a year, the observed holidays of the rules in the year.
+        Calculated once and kept.
+
+        :param year: the year
+        :return: tuple of epochs, sorted
+        """
+
+        try:
+            return self._years[year]
+        except KeyError:
+            pass
+
+        taken = set()
+        for rule in self.rules:
+            epoch = rule.epoch(year)
+            if epoch is not None:
+                taken.add(self._observed(epoch, rule.observance, taken))
+
+        epochs = self._years[year] = tuple(sorted(taken))
+        return epochs
+
+
+# -----------------------------------------------
+# End.
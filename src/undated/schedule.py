@@ -0,0 +1,128 @@
+"""
+The ``schedule`` module generates schedules of dates, such as coupon or payment dates,
+from a start date to an end date every number of months.
+
+The dates are stepped from the end date for front stubs, or from the start date for back stubs,
+always from the same date, so the day does not drift through shorter months.
+Then rolled off weekends and holidays with the roll conventions, such as ``MODIFIED_FOLLOWING``.
+"""
+# -----------------------------------------------
+
+from array import array
+from typing import List, Optional, Union
+
+from . import _core as udc
+from . import _tools as udt
+
+# -----------------------------------------------
+
+SHORT_FRONT = 1
+LONG_FRONT = 2
+SHORT_BACK = 3
+LONG_BACK = 4
+
+# -----------------------------------------------
+
+
+def _adjusted(dates: List[int], convention: int, calendar: udc.BusinessCalendar) -> array:
+    """ The dates rolled to business days, with the calendar roll for those not business days """
+
+    if convention not in (udc.FOLLOWING, udc.MODIFIED_FOLLOWING, udc.PRECEDING,
+                          udc.MODIFIED_PRECEDING):
+        raise ValueError(f'Invalid roll convention: {convention}')
+
+    adjusted = array('i')
+    for iymd in dates:
+        epoch = udc.epoch_from_parts(*udc.explode_iymd(iymd))
+        if not calendar.is_business_day(epoch):
+            iymd = udc.glue_parts(*udc.epoch_to_parts(calendar.roll(epoch, convention)))
+        adjusted.append(iymd)
+
+    return adjusted
+
+
+# -----------------------------------------------
+
+
+def _unadjusted(start: int, end: int, months: int, stub: int, end_of_month: bool) -> List[int]:
+    """ The unadjusted dates in Ymd format, from the start date to the end date """
+
+    backward = stub in (SHORT_FRONT, LONG_FRONT)
+    year, month, day = udc.explode_iymd(end if backward else start)
+    end_of_month = end_of_month and day == udc.DAYS_IN_MONTH[udc.is_leap_year(year)][month]
+    step = -months if backward else months
+    months = (year * 12) + month - 1  # The months from year zero, of the date stepped from
+
+    # As _core.add_months, inlined as this is the loop of the schedule
+    dates = []
+    iymd = None
+    while True:
+        new_year, new_month = divmod(months + (step * (len(dates) + 1)), 12)
+        new_month += 1
+        month_days = udc.DAYS_IN_MONTH[udc.is_leap_year(new_year)][new_month]
+        iymd = (new_year * 1_00_00) + (new_month * 1_00) + (
+            month_days if end_of_month else min(day, month_days)
+        )
+        if (iymd <= start) if backward else (iymd >= end):
+            break
+        dates.append(iymd)
+
+    # A long stub joins the stub to the next period, when there is a stub
+    if dates and stub in (LONG_FRONT, LONG_BACK) and iymd not in (start, end):
+        dates.pop()
+
+    if backward:
+        dates.reverse()
+    return [start, *dates, end]
+
+
+# -----------------------------------------------
+
+
+def generate(
+        start: Union[int, udt.YMD],
+        end: Union[int, udt.YMD],
+        months: int,
+        stub: int = SHORT_FRONT,
+        end_of_month: bool = False,
+        convention: Optional[int] = None,
+        calendar: Optional[udc.BusinessCalendar] = None,
+        weekmask: int = udc.WEEKMASK_MON_FRI) -> array:
+    """
+    Generates a schedule of dates, including the start and end dates
+
+    :param start: the start date in Ymd format, or YMD class object
+    :param end: the end date in Ymd format, or YMD class object
+    :param months: the frequency in months, such as 3 for quarterly, 12 for annual
+    :param stub: where any shorter period goes, SHORT_FRONT, LONG_FRONT, SHORT_BACK or LONG_BACK.
+      The long stubs join the stub to the next period.
+    :param end_of_month: when the date stepped from is the last day of a month,
+      all dates are the last day of their month
+    :param convention: the roll convention for dates falling on weekends or holidays,
+      FOLLOWING, MODIFIED_FOLLOWING, PRECEDING or MODIFIED_PRECEDING. None leaves them unadjusted
+    :param calendar: optional ``BusinessCalendar``, to also roll its holidays
+    :param weekmask: the working days of the week, when there is no calendar.
+      See ``WEEKMASK_MON_FRI``
+    :return: array of dates in Ymd format
+    """
+
+    # Disabling too many arguments, as each describes the schedule
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+
+    start, end = int(start), int(end)
+    if start >= end:
+        raise ValueError(f'Start date {start} is not before the end date {end}')
+    if months < 1:
+        raise ValueError(f'Invalid frequency in months: {months}')
+    if stub not in (SHORT_FRONT, LONG_FRONT, SHORT_BACK, LONG_BACK):
+        raise ValueError(f'Invalid stub: {stub}')
+
+    dates = _unadjusted(start, end, months, stub, end_of_month)
+    if convention is None:
+        return array('i', dates)
+
+    return _adjusted(dates, convention, calendar or udc.BusinessCalendar(weekmask=weekmask))
+
+
+# -----------------------------------------------
+# End.
@@ -0,0 +1,231 @@
+"""
+The ``tables`` module is an opt-in engine for heavy date arithmetic.
+Once enabled, the epoch conversions used throughout the package become array lookups,
+over the years 1583 to 9999 allowed by ``is_valid``. Dates outside of that range
+continue to use the calculations.
+
+The tables are built when first used. When a ``path`` is provided the tables are saved
+to that file and memory-mapped, so several processes can share one copy.
+"""
+# -----------------------------------------------
+
+import mmap
+import os
+
+from array import array
+from typing import Optional, Tuple
+
+from . import _core as udc
+
+# -----------------------------------------------
+
+FIRST_YEAR = 1583
+LAST_YEAR = 9999
+
+FIRST_EPOCH = udc.epoch_from_parts(FIRST_YEAR, 1, 1)
+LAST_EPOCH = udc.epoch_from_parts(LAST_YEAR, 12, 31)
+
+_EPOCH_IYMDS_LEN = LAST_EPOCH - FIRST_EPOCH + 1
+_MONTH_EPOCHS_LEN = ((LAST_YEAR - FIRST_YEAR + 1) * 13) + 1
+
+# The calculations, kept for dates outside of the tables and to revert to
+_calculated_epoch_from_parts = udc.epoch_from_parts
+_calculated_epoch_to_parts = udc.epoch_to_parts
+
+# Disabling invalid name, as these are module state rather than constants
+# pylint: disable=invalid-name
+
+_epoch_iymds = None  # The iymd for each epoch, from FIRST_EPOCH
+_month_epochs = None  # The epoch of the day before each month, 13 per year, month zero is the year
+_mapped = None
+_path = None
+
+# pylint: enable=invalid-name
+# -----------------------------------------------
+
+
+def _build() -> Tuple[array, array]:
+    """ Builds the tables """
+
+    epoch_iymds = array('i', (
+        (year * 1_00_00) + (month * 1_00) + day
+        for year in range(FIRST_YEAR, LAST_YEAR + 1)
+        for month in range(1, 13)
+        for day in range(1, udc.DAYS_IN_MONTH[udc.is_leap_year(year)][month] + 1)
+    ))
+
+    month_epochs = array('i', (
+        _calculated_epoch_from_parts(year, max(month, 1), 0)
+        for year in range(FIRST_YEAR, LAST_YEAR + 1)
+        for month in range(13)
+    ))
+    month_epochs.append(_calculated_epoch_from_parts(LAST_YEAR + 1, 1, 0))
+
+    return epoch_iymds, month_epochs
+
+
+# -----------------------------------------------
+
+
+def _load():
+    """ Builds or maps the tables, then replaces the lazy functions with the lookups """
+
+    # Disabling global statement, as the tables are module state
+    # pylint: disable=global-statement
+
+    global _epoch_iymds, _month_epochs, _mapped
+
+    expected_size = (_EPOCH_IYMDS_LEN + _MONTH_EPOCHS_LEN) * array('i').itemsize
+
+    if _path is None:
+        _epoch_iymds, _month_epochs = _build()
+    else:
+        if not os.path.isfile(_path) or os.path.getsize(_path) != expected_size:
+            temp_path = f'{_path}.{os.getpid()}.tmp'
+            with open(temp_path, 'wb') as file:
+                for table in _build():
+                    table.tofile(file)
+            os.replace(temp_path, _path)  # Atomic, so other processes never see a partial file
+
+        with open(_path, 'rb') as file:
+            _mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        tables = memoryview(_mapped).cast('i')
+        _epoch_iymds = tables[:_EPOCH_IYMDS_LEN]
+        _month_epochs = tables[_EPOCH_IYMDS_LEN:]
+
+    udc.epoch_to_parts = epoch_to_parts
+    udc.epoch_from_parts = epoch_from_parts
+
+
+# -----------------------------------------------
+
+
+def _lazy_epoch_to_parts(epoch: int) -> Tuple[int, int, int]:
+    """ Loads the tables on first use """
+
+    _load()
+    return epoch_to_parts(epoch)
+
+
+# -----------------------------------------------
+
+
+def _lazy_epoch_from_parts(year: int, month: int, day: int) -> int:
+    """ Loads the tables on first use """
+
+    _load()
+    return epoch_from_parts(year, month, day)
+
+
+# -----------------------------------------------
+
+
+def disable():
+    """
+    Reverts to the calculated epoch conversions and releases the tables
+    """
+
+    # Disabling global statement, as the tables are module state
+    # pylint: disable=global-statement
+
+    global _epoch_iymds, _month_epochs, _mapped, _path
+
+    udc.epoch_to_parts = _calculated_epoch_to_parts
+    udc.epoch_from_parts = _calculated_epoch_from_parts
+
+    for table in (_epoch_iymds, _month_epochs):
+        if isinstance(table, memoryview):
+            table.release()
+    _epoch_iymds = _month_epochs = _path = None
+
+    if _mapped is not None:
+        _mapped.close()
+        _mapped = None
+
+
+# -----------------------------------------------
+
+
+def enable(path: Optional[str] = None):
+    """
+    Enables the table lookups. The tables are built, or mapped, when first used.
+
+    :param path: optional file to save the tables to and memory-map them from.
+      When the file already exists it is mapped rather than rebuilt.
+      The file uses the native byte order, so is not portable between machines.
+    """
+
+    # Disabling global statement, as the tables are module state
+    # pylint: disable=global-statement
+
+    global _path
+
+    disable()
+    _path = os.fspath(path) if path is not None else None
+    udc.epoch_to_parts = _lazy_epoch_to_parts
+    udc.epoch_from_parts = _lazy_epoch_from_parts
+
+
+# -----------------------------------------------
+
+
+def epoch_from_parts(year: int, month: int, day: int) -> int:
+    """
+    Gets the epoch from the date parts, using the table
+
+    :param year: the year
+    :param month: the month
+    :param day: the day
+    :return: the epoch value
+    """
+
+    if FIRST_YEAR <= year <= LAST_YEAR:
+        return _month_epochs[((year - FIRST_YEAR) * 13) + month] + day
+    return _calculated_epoch_from_parts(year, month, day)
+
+
+# -----------------------------------------------
+
+
+def epoch_to_parts(epoch: int) -> Tuple[int, int, int]:
+    """
+    Gets the date parts from the epoch, using the table
+
+    :param epoch: the epoch value
+    :return: the date parts
+    """
+
+    if FIRST_EPOCH <= epoch <= LAST_EPOCH:
+        iymd = _epoch_iymds[epoch - FIRST_EPOCH]
+        return iymd // 1_00_00, (iymd % 1_00_00) // 1_00, iymd % 1_00
+    return _calculated_epoch_to_parts(epoch)
+
+
+# -----------------------------------------------
+
+
+def is_enabled() -> bool:
+    """
+    Whether the table lookups are enabled
+
+    :return: True when enabled
+    """
+
+    return udc.epoch_to_parts is not _calculated_epoch_to_parts
+
+
+# -----------------------------------------------
+
+
+def load():
+    """
+    Builds, or maps, the tables now when enabled, rather than when first used.
+    Does nothing when the tables are disabled or already loaded.
+    """
+
+    if udc.epoch_to_parts is _lazy_epoch_to_parts or udc.epoch_from_parts is _lazy_epoch_from_parts:
+        _load()
+
+
+# -----------------------------------------------
+# End.
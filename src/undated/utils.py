@@ -5,7 +5,8 @@ Use only when dates are valid integers in the ``Ymd`` format.
 """
 # -----------------------------------------------
 
-from typing import Union
+from array import array
+from typing import Iterator, Optional, Tuple, Union
 
 from . import _core as udc
 from . import _tools as udt
@@ -13,6 +14,99 @@ from . import _tools as udt
 # -----------------------------------------------
 
 
+def _business_day_range(
+        start: int,
+        end: int,
+        step: int,
+        calendar: udc.BusinessCalendar) -> Iterator[int]:
+    """ Generates business days, stepping through the calendar ordinals """
+
+    epoch = calendar.roll(
+        udc.epoch_from_parts(*udc.explode_iymd(start)),
+        udc.FOLLOWING if step > 0 else udc.PRECEDING
+    )
+    end_epoch = udc.epoch_from_parts(*udc.explode_iymd(end))
+    ordinal = calendar.ordinal(epoch)
+
+    while (epoch <= end_epoch) if step > 0 else (epoch >= end_epoch):
+        yield udc.glue_parts(*udc.epoch_to_parts(epoch))
+        ordinal += step
+        epoch = calendar.from_ordinal(ordinal)
+
+
+# -----------------------------------------------
+
+
+def _day_range(start: int, end: int, step: int) -> Iterator[int]:
+    """ Generates days, stepping the date parts directly when the step is less than a month """
+
+    year, month, day = udc.explode_iymd(start)
+    iymd = udc.glue_parts(year, month, day)
+
+    if abs(step) > 28:
+        epoch = udc.epoch_from_parts(year, month, day)
+        while (iymd <= end) if step > 0 else (iymd >= end):
+            yield iymd
+            epoch += step
+            iymd = udc.glue_parts(*udc.epoch_to_parts(epoch))
+        return
+
+    days_in_month = udc.DAYS_IN_MONTH[udc.is_leap_year(year)][month]
+
+    if step > 0:
+        while iymd <= end:
+            yield iymd
+            day += step
+            if day > days_in_month:
+                day -= days_in_month
+                month += 1
+                if month > 12:
+                    month = 1
+                    year += 1
+                days_in_month = udc.DAYS_IN_MONTH[udc.is_leap_year(year)][month]
+                iymd = (year * 1_00_00) + (month * 1_00) + day
+            else:
+                iymd += step
+    else:
+        while iymd >= end:
+            yield iymd
+            day += step
+            if day < 1:
+                month -= 1
+                if month < 1:
+                    month = 12
+                    year -= 1
+                day += udc.DAYS_IN_MONTH[udc.is_leap_year(year)][month]
+                iymd = (year * 1_00_00) + (month * 1_00) + day
+            else:
+                iymd += step
+
+
+# -----------------------------------------------
+
+
+def _month_range(start: int, end: int, step: int) -> Iterator[int]:
+    """ Generates months, from the start date so the day is not lost in shorter months """
+
+    year, month, day = udc.explode_iymd(start)
+    months = (year * 12) + month - 1
+
+    while True:
+        year, month = divmod(months, 12)
+        month += 1
+        iymd = (
+            (year * 1_00_00) + (month * 1_00)
+            + min(day, udc.DAYS_IN_MONTH[udc.is_leap_year(year)][month])
+        )
+        if (iymd > end) if step > 0 else (iymd < end):
+            return
+        yield iymd
+        months += step
+
+
+# -----------------------------------------------
+
+
 def add_days(iymd: int, days: int) -> int:
     """
     Adds a number of days to a date in in Ymd format
@@ -45,18 +139,87 @@ def add_months(iymd: int, months: int) -> int:
 # -----------------------------------------------
 
 
-def add_weekdays(iymd: int, weekdays: int) -> int:
+def add_weekdays(
+        iymd: int,
+        weekdays: int,
+        calendar: Optional[udc.BusinessCalendar] = None,
+        weekmask: int = udc.WEEKMASK_MON_FRI) -> int:
     """
-    Adds a number of weekdays, monday to friday, to a date in in Ymd format
+    Adds a number of weekdays, monday to friday, to a date in in Ymd format.
+    From a non working day, adding starts from the previous working day
+    and subtracting from the next
 
     :param iymd: the date in Ymd format
     :param weekdays: the number of days to add
+    :param calendar: optional ``BusinessCalendar``, to also skip its holidays
+    :param weekmask: the working days of the week, when there is no calendar.
+      See ``WEEKMASK_MON_FRI``
     :return: the new date in Ymd format
     """
 
-    return udc.glue_parts(
-        *udc.add_weekdays(udc.epoch_from_parts(*udc.explode_iymd(iymd)), weekdays)
-    )
+    epoch = udc.epoch_from_parts(*udc.explode_iymd(iymd))
+    if calendar is None:
+        return udc.glue_parts(*udc.add_weekdays(epoch, weekdays, weekmask))
+    return udc.glue_parts(*udc.epoch_to_parts(calendar.add(epoch, weekdays)))
+
+
+# -----------------------------------------------
+
+
+def ceil(iymd: int, unit: str = 'M') -> int:
+    """
+    The last day of the period of the date, the inverse of truncate.
+    The end of the ISO week, month, quarter, half year or year.
+
+    :param iymd: The date in Ymd format
+    :param unit: W ISO week ending sunday, M month, Q quarter, H half year or Y year
+    :return: The last day of the period in Ymd format
+    """
+
+    year, month, day = udc.explode_iymd(iymd)
+    if unit == 'W':
+        epoch = udc.epoch_from_parts(year, month, day)
+        return udc.glue_parts(*udc.epoch_to_parts(epoch + 6 - ((epoch - 2) % 7)))
+
+    months = udc.period_months(unit)
+    month += months - 1 - ((month - 1) % months)
+    return (year * 1_00_00) + (month * 1_00) + udc.DAYS_IN_MONTH[udc.is_leap_year(year)][month]
+
+
+# -----------------------------------------------
+
+
+def date_range(
+        start: int,
+        end: int,
+        step: int = 1,
+        unit: str = 'D',
+        calendar: Optional[udc.BusinessCalendar] = None) -> Iterator[int]:
+    """
+    Generates the dates from the start date up to, and including, the end date.
+    Use a negative step, with an end date before the start date, to go backwards.
+    Months are added to the start date, so starting on the 31st gives month ends.
+
+    :param start: the start date in Ymd format
+    :param end: the end date in Ymd format
+    :param step: the number of units between each date
+    :param unit: 'D' days, 'W' weeks, 'M' months or 'BD' business days
+    :param calendar: optional ``BusinessCalendar``, for the business days
+    :return: generator of dates in Ymd format
+    """
+
+    if not step:
+        raise ValueError('Invalid step: 0')
+
+    if unit == 'D':
+        return _day_range(start, end, step)
+    if unit == 'W':
+        return _day_range(start, end, step * 7)
+    if unit == 'M':
+        return _month_range(start, end, step)
+    if unit == 'BD':
+        return _business_day_range(start, end, step, calendar or udc.BusinessCalendar())
+    raise ValueError(f'Invalid unit: {unit}')
 
 
 # -----------------------------------------------
@@ -76,6 +239,20 @@ def day_of_week(iymd: int) -> int:
 # -----------------------------------------------
 
 
+def day_of_year(iymd: int) -> int:
+    """
+    Calculates the day of the year, 1st January = 1
+
+    :param iymd: date in Ymd format
+    :return: the day number 1 to 366
+    """
+
+    return udc.day_of_year(*udc.explode_iymd(iymd))
+
+
+# -----------------------------------------------
+
+
 def days_between(from_iymd: int, to_iymd: int) -> int:
     """
     Calculates the days between two dates
@@ -109,6 +286,37 @@ def first_day(iym: int) -> int:
 # -----------------------------------------------
 
 
+def from_day_of_year(year: int, day: int) -> int:
+    """
+    Converts a year and day of the year to a date, the inverse of day_of_year
+
+    :param year: the year
+    :param day: the day of the year, 1 to 366
+    :return: the date in Ymd format
+    """
+
+    return udc.glue_parts(*udc.epoch_to_parts(udc.epoch_from_parts(year, 1, day)))
+
+
+# -----------------------------------------------
+
+
+def from_iso_calendar(year: int, week: int, weekday: int = 1) -> int:
+    """
+    Converts an ISO 8601 week date to a date, the inverse of iso_calendar
+
+    :param year: the ISO year
+    :param week: the week, 1 to 53
+    :param weekday: the ISO weekday, Monday = 1... Sunday = 7. Defaults to monday
+    :return: the date in Ymd format
+    """
+
+    return udc.glue_parts(*udc.epoch_to_parts(udc.iso_calendar_to_epoch(year, week, weekday)))
+
+
+# -----------------------------------------------
+
+
 def is_leap_year(year: int) -> int:
     """
     Is the year a leap year
@@ -137,15 +345,81 @@ def is_valid(iymd: int) -> bool:
 # -----------------------------------------------
 
 
-def is_weekday(iymd: int) -> bool:
+def is_weekday(
+        iymd: int,
+        calendar: Optional[udc.BusinessCalendar] = None,
+        weekmask: int = udc.WEEKMASK_MON_FRI) -> bool:
     """
     Calculates if the date is a weekday, Monday - Friday
 
     :param iymd: the date in Ymd format
+    :param calendar: optional ``BusinessCalendar``, holidays are then not weekdays
+    :param weekmask: the working days of the week, when there is no calendar.
+      See ``WEEKMASK_MON_FRI``
     :return: True when it is a weekday
     """
 
-    return udc.is_weekday(*udc.explode_iymd(iymd))
+    if calendar is None:
+        return udc.is_weekday(*udc.explode_iymd(iymd), weekmask)
+    return calendar.is_business_day(udc.epoch_from_parts(*udc.explode_iymd(iymd)))
+
+
+# -----------------------------------------------
+
+
+def iso_calendar(iymd: int) -> Tuple[int, int, int]:
+    """
+    Calculates the ISO 8601 week date, as ``datetime.date.isocalendar``.
+    Weeks start on monday, with the first week of the year containing the first thursday.
+
+    :param iymd: the date in Ymd format
+    :return: tuple, the ISO year, the week 1 to 53 and the ISO weekday, Monday = 1... Sunday = 7
+    """
+
+    return udc.iso_calendar(*udc.explode_iymd(iymd))
+
+
+# -----------------------------------------------
+
+
+def iso_week(iymd: int) -> int:
+    """
+    Calculates the ISO 8601 week number
+
+    :param iymd: the date in Ymd format
+    :return: the week 1 to 53
+    """
+
+    return udc.iso_calendar(*udc.explode_iymd(iymd))[1]
+
+
+# -----------------------------------------------
+
+
+def iso_weekday(iymd: int) -> int:
+    """
+    Calculates the ISO 8601 weekday. Monday = 1... Sunday = 7
+
+    :param iymd: the date in Ymd format
+    :return: the day number 1 to 7
+    """
+
+    return ((udc.epoch_from_parts(*udc.explode_iymd(iymd)) - 2) % 7) + 1
+
+
+# -----------------------------------------------
+
+
+def iso_year(iymd: int) -> int:
+    """
+    Calculates the ISO 8601 week-numbering year, which can differ from the year
+    for dates early in January or late in December
+
+    :param iymd: the date in Ymd format
+    :return: the ISO year
+    """
+
+    return udc.iso_calendar(*udc.explode_iymd(iymd))[0]
 
 
 # -----------------------------------------------
@@ -159,9 +433,22 @@ def last_day(iym: int) -> int:
     :return: The year month day in Ymd format
     """
 
-    return udc.glue_parts(*udc.epoch_to_parts(
-        udc.epoch_from_parts(*udc.add_months(iym // 100, iym % 100, 1, 1)) - 1
-    ))
+    return (iym * 100) + udc.DAYS_IN_MONTH[udc.is_leap_year(iym // 100)][iym % 100]
+
+
+# -----------------------------------------------
+
+
+def last_weekday(iym: int, weekday: int) -> int:
+    """
+    The last weekday of the month, such as the last friday
+
+    :param iym: The year month in Ym format
+    :param weekday: The day of the week, Sunday = 0... Saturday = 6
+    :return: The year month day in Ymd format
+    """
+
+    return (iym * 100) + udc.nth_weekday(iym // 100, iym % 100, weekday, -1)
 
 
 # -----------------------------------------------
@@ -183,6 +470,55 @@ def months_between(from_iymd: Union[int, udt.YMD], to_iymd: Union[int, udt.YMD])
 # -----------------------------------------------
 
 
+def nth_weekday(iym: int, weekday: int, nth: int = 1) -> int:
+    """
+    The nth weekday of the month, such as the third friday, or counting back from the end
+
+    :param iym: The year month in Ym format
+    :param weekday: The day of the week, Sunday = 0... Saturday = 6
+    :param nth: The weekday of the month, 1 to 4, or -1 to -4 for the last to fourth last
+    :return: The year month day in Ymd format
+    """
+
+    return (iym * 100) + udc.nth_weekday(iym // 100, iym % 100, weekday, nth)
+
+
+# -----------------------------------------------
+
+
+def nth_weekday_range(from_iym: int, to_iym: int, weekday: int, nth: int = 1) -> array:
+    """
+    The nth weekday of each month, from the from month up to, and including, the to month.
+    The day of the week of the first of each month follows from the month before.
+
+    :param from_iym: The from year month in Ym format
+    :param to_iym: The to year month in Ym format
+    :param weekday: The day of the week, Sunday = 0... Saturday = 6
+    :param nth: The weekday of the month, 1 to 4, or -1 to -4 for the last to fourth last
+    :return: array of dates in Ymd format
+    """
+
+    year, month = from_iym // 100, from_iym % 100
+    first = udc.day_of_week(udc.epoch_from_parts(year, month, 1))
+    udc.nth_weekday(year, month, weekday, nth)  # Validates the weekday and nth
+
+    iymds = array('i')
+    while (year * 100) + month <= to_iym:
+        days = udc.DAYS_IN_MONTH[udc.is_leap_year(year)][month]
+        if nth > 0:
+            day = 1 + ((weekday - first) % 7) + ((nth - 1) * 7)
+        else:
+            day = days - ((first + days - 1 - weekday) % 7) + ((nth + 1) * 7)
+        iymds.append((year * 1_00_00) + (month * 1_00) + day)
+
+        first = (first + days) % 7
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return iymds
+
+
+# -----------------------------------------------
+
+
 def quarter(iymd: int, to_str: bool = True) -> Union[int, str]:
     """
     Calculates the quarter from a year, returning the quarter end month, or quarter number
@@ -199,21 +535,77 @@ def quarter(iymd: int, to_str: bool = True) -> Union[int, str]:
 # -----------------------------------------------
 
 
-def weekdays_between(from_iymd: int, to_iymd: int, inclusive: bool = False) -> int:
+def roll_weekday(
+        iymd: int,
+        convention: int = udc.FOLLOWING,
+        calendar: Optional[udc.BusinessCalendar] = None,
+        weekmask: int = udc.WEEKMASK_MON_FRI) -> int:
+    """
+    Rolls a date falling on a weekend, or holiday, to a weekday
+
+    :param iymd: the date in Ymd format
+    :param convention: FOLLOWING, MODIFIED_FOLLOWING, PRECEDING or MODIFIED_PRECEDING
+    :param calendar: optional ``BusinessCalendar``, to also roll its holidays
+    :param weekmask: the working days of the week, when there is no calendar.
+      See ``WEEKMASK_MON_FRI``
+    :return: the weekday in Ymd format
+    """
+
+    calendar = calendar or udc.BusinessCalendar(weekmask=weekmask)
+    return udc.glue_parts(*udc.epoch_to_parts(calendar.roll(
+        udc.epoch_from_parts(*udc.explode_iymd(iymd)), convention
+    )))
+
+
+# -----------------------------------------------
+
+
+def truncate(iymd: int, unit: str = 'M') -> int:
+    """
+    The first day of the period of the date.
+    The start of the ISO week, month, quarter, half year or year.
+
+    :param iymd: The date in Ymd format
+    :param unit: W ISO week starting monday, M month, Q quarter, H half year or Y year
+    :return: The first day of the period in Ymd format
+    """
+
+    year, month, day = udc.explode_iymd(iymd)
+    if unit == 'W':
+        epoch = udc.epoch_from_parts(year, month, day)
+        return udc.glue_parts(*udc.epoch_to_parts(epoch - ((epoch - 2) % 7)))
+
+    months = udc.period_months(unit)
+    return (year * 1_00_00) + ((month - ((month - 1) % months)) * 1_00) + 1
+
+
+# -----------------------------------------------
+
+
+def weekdays_between(
+        from_iymd: int,
+        to_iymd: int,
+        inclusive: bool = False,
+        calendar: Optional[udc.BusinessCalendar] = None,
+        weekmask: int = udc.WEEKMASK_MON_FRI) -> int:
     """
     Calculates the complete months between two dates
 
     :param from_iymd: the from date in Ymd format
     :param to_iymd: the from date in Ymd format
     :param inclusive: whether to include the to date as a completed day
+    :param calendar: optional ``BusinessCalendar``, to exclude its holidays
+    :param weekmask: the working days of the week, when there is no calendar.
+      See ``WEEKMASK_MON_FRI``. A single day, such as ``1 << 1``, counts that day, mondays.
     :return: the complete months between the dates
     """
 
-    return udc.weekdays_between_epochs(
-        udc.epoch_from_parts(*udc.explode_iymd(from_iymd)),
-        udc.epoch_from_parts(*udc.explode_iymd(to_iymd)),
-        inclusive
-    )
+    from_epoch = udc.epoch_from_parts(*udc.explode_iymd(from_iymd))
+    to_epoch = udc.epoch_from_parts(*udc.explode_iymd(to_iymd))
+
+    if calendar is None:
+        return udc.weekdays_between_epochs(from_epoch, to_epoch, inclusive, weekmask)
+    return calendar.count(from_epoch, to_epoch, inclusive)
 
 
 # -----------------------------------------------
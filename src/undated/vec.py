@@ -0,0 +1,795 @@
+"""
+The ``vec`` module mirrors the ``utils`` functions for NumPy arrays of dates.
+Each function takes arrays of integers, in the ``Ymd`` format, and returns a new array,
+calculating the whole array at once rather than one date at a time.
+Scalar parameters, such as the number of days to add, can also be arrays of the same shape.
+
+Requires ``numpy``. Use only when dates are valid integers in the ``Ymd`` format.
+"""
+# -----------------------------------------------
+
+from functools import lru_cache
+from typing import Tuple, Union
+
+import numpy as np
+
+from . import _core as udc
+from . import daycount as uddc
+
+# -----------------------------------------------
+
+ArrayLike = Union[np.ndarray, list, tuple, int]
+
+_DAYS_IN_MONTH = np.array(udc.DAYS_IN_MONTH, dtype=np.int64)
+_DAYS_SO_FAR = np.array(udc.DAYS_SO_FAR, dtype=np.int64)
+_MARCH_YEAR_PARTS = np.array(udc.MARCH_YEAR_PARTS, dtype=np.int64)
+
+_BUCKET_UNITS = ('W', 'M', 'Q', 'Y')
+
+# The days moved from a weekend, sunday first, when subtracting or adding weekdays.
+# To the monday after, or friday before
+_WEEKEND_STARTS = np.array(((1, 0, 0, 0, 0, 0, 2), (-2, 0, 0, 0, 0, 0, -1)), dtype=np.int64)
+
+# -----------------------------------------------
+
+
+def _act_act_isda(
+        from_epoch: np.ndarray,
+        from_year: np.ndarray,
+        to_epoch: np.ndarray,
+        to_year: np.ndarray) -> np.ndarray:
+    """ Array version of daycount._act_act_isda """
+
+    # Ordered, with the sign restored at the end
+    swap = to_epoch < from_epoch
+    epoch1, epoch2 = np.where(swap, to_epoch, from_epoch), np.where(swap, from_epoch, to_epoch)
+    year1, year2 = np.where(swap, to_year, from_year), np.where(swap, from_year, to_year)
+    basis1, basis2 = 365 + _is_leap_year(year1), 365 + _is_leap_year(year2)
+
+    fraction = np.where(
+        year1 == year2,
+        (epoch2 - epoch1) / basis1,
+        ((_epoch_from_parts(year1 + 1, 1, 1) - epoch1) / basis1)
+        + (year2 - year1 - 1)
+        + ((epoch2 - _epoch_from_parts(year2, 1, 1)) / basis2)
+    )
+    return np.where(swap, -fraction, fraction)
+
+
+# -----------------------------------------------
+
+
+def _bucket(epoch: np.ndarray, year: np.ndarray, month: np.ndarray, unit: str) -> np.ndarray:
+    """ The bucket keys, from the epochs, years and months """
+
+    if unit == 'M':
+        return (year * 100) + month
+    if unit == 'Q':
+        return (year * 10) + ((month - 1) // 3) + 1
+    if unit == 'Y':
+        return year
+    year, week = _iso_week(epoch)
+    return (year * 100) + week
+
+
+# -----------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def _bucket_label(key: int, unit: str) -> str:
+    """ The label of a bucket key. Cached, as the same few labels are repeated """
+
+    if unit == 'M':
+        return f'{key // 100}-{key % 100:02}'
+    if unit == 'Q':
+        return f'{key // 10}Q{key % 10}'
+    if unit == 'Y':
+        return str(key)
+    return f'{key // 100}-W{key % 100:02}'
+
+
+# -----------------------------------------------
+
+
+def _check_unit(unit: str):
+    """ Raises an error for units other than the bucket units """
+
+    if unit not in _BUCKET_UNITS:
+        raise ValueError(f'Unit "{unit}" is not valid. Use W, M, Q or Y')
+
+
+# -----------------------------------------------
+
+
+def _epoch_from_parts(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    """ Array version of _core.epoch_from_parts """
+
+    prior_year = year - 1
+
+    return (
+        (year * 365)
+        + (prior_year // 4) - (prior_year // 100) + (prior_year // 400)
+        + _DAYS_SO_FAR[_is_leap_year(year), month] + day
+    )
+
+
+# -----------------------------------------------
+
+
+def _epoch_to_parts(epoch: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ Array version of _core.epoch_to_parts """
+
+    era, day = np.divmod(epoch - udc.MARCH_EPOCH_OFFSET, 146097)  # 400 year eras
+    year = (day - (day // 1460) + (day // 36524) - (day // 146096)) // 365
+    parts = _MARCH_YEAR_PARTS[day - (year * 365) - (year // 4) + (year // 100)]
+    month, day = parts[..., 0], parts[..., 1]
+
+    return (era * 400) + year + (month < 3), month, day
+
+
+# -----------------------------------------------
+
+
+def _glue_parts(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    """ Array version of _core.glue_parts """
+
+    return (year * 1_00_00) + (month * 1_00) + np.where(day == 0, 1, day)
+
+
+# -----------------------------------------------
+
+
+def _iso_week(epoch: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """ The ISO week-numbering years and weeks, from the thursday of each week """
+
+    thursday = epoch - ((epoch - 2) % 7) + 3
+    year = _epoch_to_parts(thursday)[0]
+    return year, ((thursday - _epoch_from_parts(year, 1, 1)) // 7) + 1
+
+
+# -----------------------------------------------
+
+
+def _thirty_360(
+        from_parts: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        to_parts: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        convention: str) -> np.ndarray:
+    """ Array version of daycount._thirty_360 """
+
+    year1, month1, day1 = from_parts
+    year2, month2, day2 = to_parts
+
+    day1 = np.minimum(day1, 30)
+    day2 = np.where((day2 == 31) & ((convention == uddc.THIRTY_E_360) | (day1 == 30)), 30, day2)
+
+    return ((year2 - year1) * 360) + ((month2 - month1) * 30) + day2 - day1
+
+
+# -----------------------------------------------
+
+
+def _is_leap_year(year: np.ndarray) -> np.ndarray:
+    """ Array version of _core.is_leap_year """
+
+    return ((year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))).astype(np.int64)
+
+
+# -----------------------------------------------
+
+
+def add_days(iymd: ArrayLike, days: ArrayLike) -> np.ndarray:
+    """
+    Adds a number of days to dates in Ymd format
+
+    :param iymd: the dates in Ymd format
+    :param days: the number of days to add
+    :return: the new dates in Ymd format
+    """
+
+    return epoch_to_iymd(epoch_from_iymd(iymd) + days)
+
+
+# -----------------------------------------------
+
+
+def add_months(iymd: ArrayLike, months: ArrayLike, period: bool = False) -> np.ndarray:
+    """
+    Adds given months to dates. Use negative months to subtract months
+
+    :param iymd: the dates in Ymd format
+    :param months: the number of months
+    :param period: takes the previous day. EG: For last day of a period
+    :return: the new dates in Ymd format
+    """
+
+    year, month, day = explode_iymd(iymd)
+    months = np.asarray(months, dtype=np.int64)
+
+    year, month = np.divmod((year * 12) + month - 1 + months, 12)
+    month += 1
+    day = np.minimum(day, _DAYS_IN_MONTH[_is_leap_year(year), month])
+
+    if period:
+        return epoch_to_iymd(_epoch_from_parts(year, month, day) + np.where(months < 0, 1, -1))
+    return _glue_parts(year, month, day)
+
+
+# -----------------------------------------------
+
+
+def add_weekdays(iymd: ArrayLike, weekdays: ArrayLike) -> np.ndarray:
+    """
+    Adds a number of weekdays, monday to friday, to dates in Ymd format.
+    From a weekend, adding starts from the friday before and subtracting from the monday after
+
+    :param iymd: the dates in Ymd format
+    :param weekdays: the number of days to add
+    :return: the new dates in Ymd format
+    """
+
+    epoch = epoch_from_iymd(iymd)
+    weekdays = np.asarray(weekdays, dtype=np.int64)
+    epoch = epoch + _WEEKEND_STARTS[(weekdays > 0).astype(np.int64), (epoch - 1) % 7]
+
+    weeks, days = np.divmod(weekdays, 5)
+    weekend_adjust = np.where(((epoch - 1) % 7) + days < 6, 0, 2)
+
+    return epoch_to_iymd(epoch + (weeks * 7) + days + weekend_adjust)
+
+
+# -----------------------------------------------
+
+
+def bucket(iymd: ArrayLike, unit: str = 'M') -> np.ndarray:
+    """
+    Calculates the period keys of dates, for grouping by week, month, quarter or year
+
+    :param iymd: the dates in Ymd format
+    :param unit: W for ISO weeks 202107, M for months 202107, Q for quarters 20213, Y for years 2021
+    :return: the period keys
+    """
+
+    _check_unit(unit)
+    year, month, day = explode_iymd(iymd)
+    epoch = _epoch_from_parts(year, month, day) if unit == 'W' else None
+    return _bucket(epoch, year, month, unit)
+
+
+# -----------------------------------------------
+
+
+def bucket_labels(keys: ArrayLike, unit: str = 'M') -> np.ndarray:
+    """
+    Labels the period keys, such as 2021-W07, 2021-07, 2021Q3 and 2021.
+    Each distinct key is labelled once, from a cache of labels.
+
+    :param keys: the period keys, from bucket
+    :param unit: the unit of the keys, W, M, Q or Y
+    :return: the labels
+    """
+
+    _check_unit(unit)
+    keys = np.asarray(keys, dtype=np.int64)
+    uniques, inverse = np.unique(keys, return_inverse=True)
+    labels = np.array([_bucket_label(int(key), unit) for key in uniques], dtype=str)
+    return labels[inverse].reshape(keys.shape)
+
+
+# -----------------------------------------------
+
+
+def ceil(iymd: ArrayLike, unit: str = 'M') -> np.ndarray:
+    """
+    Calculates the last day of the period of each date, such as month ends
+
+    :param iymd: the dates in Ymd format
+    :param unit: W ISO week ending sunday, M month, Q quarter, H half year or Y year
+    :return: the last days of the periods in Ymd format
+    """
+
+    year, month, day = explode_iymd(iymd)
+    if unit == 'W':
+        epoch = _epoch_from_parts(year, month, day)
+        return epoch_to_iymd(epoch + 6 - ((epoch - 2) % 7))
+
+    months = udc.period_months(unit)
+    month = month + months - 1 - ((month - 1) % months)
+    return (year * 1_00_00) + (month * 1_00) + _DAYS_IN_MONTH[_is_leap_year(year), month]
+
+
+# -----------------------------------------------
+
+
+def count_by(keys: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Counts the rows of each key, such as the period keys from bucket
+
+    :param keys: the keys
+    :return: tuple of arrays, the distinct keys in order and their counts
+    """
+
+    return np.unique(np.asarray(keys), return_counts=True)
+
+
+# -----------------------------------------------
+
+
+def day_count(
+        from_iymd: ArrayLike,
+        to_iymd: ArrayLike,
+        convention: str = uddc.ACT_365F) -> np.ndarray:
+    """
+    Counts the days between two sets of dates, by the day count convention.
+    See ``daycount.day_count``
+
+    :param from_iymd: the from dates in Ymd format
+    :param to_iymd: the to dates in Ymd format
+    :param convention: the day count convention, see ``daycount.CONVENTIONS``
+    :return: the days, negative when the to date is before the from date
+    """
+
+    if convention not in uddc.CONVENTIONS:
+        raise ValueError(f'Invalid day count convention: {convention}')
+    from_parts = explode_iymd(from_iymd)
+    to_parts = explode_iymd(to_iymd)
+
+    if convention in (uddc.THIRTY_360, uddc.THIRTY_E_360):
+        return _thirty_360(from_parts, to_parts, convention)
+    return _epoch_from_parts(*to_parts) - _epoch_from_parts(*from_parts)
+
+
+# -----------------------------------------------
+
+
+def day_of_week(iymd: ArrayLike) -> np.ndarray:
+    """
+    Calculates the number for day of the week. Sunday = 0, Monday = 1...
+
+    :param iymd: dates in Ymd format
+    :return: the day numbers 0 to 6
+    """
+
+    return (epoch_from_iymd(iymd) - 1) % 7
+
+
+# -----------------------------------------------
+
+
+def day_of_year(iymd: ArrayLike) -> np.ndarray:
+    """
+    Calculates the day of the year, 1st January = 1
+
+    :param iymd: dates in Ymd or Ym format
+    :return: the day numbers 1 to 366
+    """
+
+    year, month, day = explode_iymd(iymd)
+    return _DAYS_SO_FAR[_is_leap_year(year), month] + day
+
+
+# -----------------------------------------------
+
+
+def days_between(from_iymd: ArrayLike, to_iymd: ArrayLike) -> np.ndarray:
+    """
+    Calculates the days between two sets of dates
+
+    :param from_iymd: the from dates in Ymd format
+    :param to_iymd: the to dates in Ymd format
+    :return: the days between the dates
+    """
+
+    return epoch_from_iymd(to_iymd) - epoch_from_iymd(from_iymd)
+
+
+# -----------------------------------------------
+
+
+def days_in_month(iymd: ArrayLike) -> np.ndarray:
+    """
+    Calculates the number of days in the month of the dates
+
+    :param iymd: dates in Ymd or Ym format
+    :return: the number of days, 28 to 31
+    """
+
+    year, month, _ = explode_iymd(iymd)
+    return _DAYS_IN_MONTH[_is_leap_year(year), month]
+
+
+# -----------------------------------------------
+
+
+def epoch_bucket(epoch: ArrayLike, unit: str = 'M') -> np.ndarray:
+    """
+    Calculates the period keys of epoch values, as bucket
+
+    :param epoch: the epoch values
+    :param unit: W for ISO weeks 202107, M for months 202107, Q for quarters 20213, Y for years 2021
+    :return: the period keys
+    """
+
+    _check_unit(unit)
+    epoch = np.asarray(epoch, dtype=np.int64)
+    year, month, _ = _epoch_to_parts(epoch)
+    return _bucket(epoch, year, month, unit)
+
+
+# -----------------------------------------------
+
+
+def epoch_from_iymd(iymd: ArrayLike) -> np.ndarray:
+    """
+    Converts dates to epoch day numbers, for use in calculations
+
+    :param iymd: the dates in Ymd or Ym format
+    :return: the epoch values
+    """
+
+    return _epoch_from_parts(*explode_iymd(iymd))
+
+
+# -----------------------------------------------
+
+
+def epoch_to_iymd(epoch: ArrayLike) -> np.ndarray:
+    """
+    Converts epoch day numbers to dates
+
+    :param epoch: the epoch values
+    :return: the dates in Ymd format
+    """
+
+    return _glue_parts(*_epoch_to_parts(np.asarray(epoch, dtype=np.int64)))
+
+
+# -----------------------------------------------
+
+
+def explode_iymd(iymd: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Explodes dates into their year, month and day parts
+
+    :param iymd: the dates in Ymd or Ym format
+    :return: tuple of arrays, the years, months and days
+    """
+
+    iymd = np.asarray(iymd, dtype=np.int64)
+    iymd = np.where(iymd < 9999_99, (iymd * 100) + 1, iymd)
+
+    return iymd // 1_00_00, (iymd % 1_00_00) // 1_00, iymd % 1_00
+
+
+# -----------------------------------------------
+
+
+def from_day_of_year(year: ArrayLike, day: ArrayLike) -> np.ndarray:
+    """
+    Converts years and days of the year to dates, the inverse of day_of_year
+
+    :param year: the years
+    :param day: the days of the year, 1 to 366
+    :return: the dates in Ymd format
+    """
+
+    year = np.asarray(year, dtype=np.int64)
+    return epoch_to_iymd(_epoch_from_parts(year, 1, np.asarray(day, dtype=np.int64)))
+
+
+# -----------------------------------------------
+
+
+def from_iso_calendar(year: ArrayLike, week: ArrayLike, weekday: ArrayLike = 1) -> np.ndarray:
+    """
+    Converts ISO 8601 week dates to dates, the inverse of iso_calendar
+
+    :param year: the ISO years
+    :param week: the weeks, 1 to 53
+    :param weekday: the ISO weekdays, Monday = 1... Sunday = 7. Defaults to monday
+    :return: the dates in Ymd format
+    """
+
+    fourth_january = _epoch_from_parts(np.asarray(year, dtype=np.int64), 1, 4)
+    return epoch_to_iymd(
+        fourth_january - ((fourth_january - 2) % 7)
+        + ((np.asarray(week, dtype=np.int64) - 1) * 7) + weekday - 1
+    )
+
+
+# -----------------------------------------------
+
+
+def is_leap_year(year: ArrayLike) -> np.ndarray:
+    """
+    Are the years leap years
+
+    :param year: the years
+    :return: boolean mask, True for leap years
+    """
+
+    year = np.asarray(year, dtype=np.int64)
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+# -----------------------------------------------
+
+
+def is_valid(iymd: ArrayLike) -> np.ndarray:
+    """
+    Checks the dates are valid. Years expected to be between 1583 and 9999
+
+    :param iymd: the dates in Ymd format
+    :return: boolean mask, True for valid dates
+    """
+
+    year, month, day = explode_iymd(iymd)
+    monthindex = np.clip(month, 0, 12)  # Month zero has zero days, so is invalid
+
+    return (
+        (1582 < year) & (year < 10000)
+        & (0 < month) & (month < 13)
+        & (0 < day) & (day <= _DAYS_IN_MONTH[_is_leap_year(year), monthindex])
+    )
+
+
+# -----------------------------------------------
+
+
+def is_weekday(iymd: ArrayLike) -> np.ndarray:
+    """
+    Calculates if the dates are weekdays, Monday - Friday
+
+    :param iymd: the dates in Ymd format
+    :return: boolean mask, True for weekdays
+    """
+
+    weekday = day_of_week(iymd)
+    return (0 < weekday) & (weekday < 6)
+
+
+# -----------------------------------------------
+
+
+def iso_calendar(iymd: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculates the ISO 8601 week dates, as ``datetime.date.isocalendar``
+
+    :param iymd: the dates in Ymd format
+    :return: tuple of arrays, the ISO years, the weeks 1 to 53 and the ISO weekdays 1 to 7
+    """
+
+    epoch = epoch_from_iymd(iymd)
+    year, week = _iso_week(epoch)
+    return year, week, ((epoch - 2) % 7) + 1
+
+
+# -----------------------------------------------
+
+
+def last_weekday(iym: ArrayLike, weekday: ArrayLike) -> np.ndarray:
+    """
+    Calculates the last weekday of the months, such as the last friday
+
+    :param iym: the months in Ym format
+    :param weekday: the day of the week, Sunday = 0... Saturday = 6
+    :return: the dates in Ymd format
+    """
+
+    return nth_weekday(iym, weekday, -1)
+
+
+# -----------------------------------------------
+
+
+def months_between(from_iymd: ArrayLike, to_iymd: ArrayLike) -> np.ndarray:
+    """
+    Calculates the complete months between two sets of dates
+
+    :param from_iymd: the from dates in Ymd or Ym format
+    :param to_iymd: the to dates in Ymd or Ym format
+    :return: the complete months between the dates
+    """
+
+    from_parts = explode_iymd(from_iymd)
+    to_parts = explode_iymd(to_iymd)
+    ascending = _glue_parts(*from_parts) < _glue_parts(*to_parts)
+
+    year1, month1, day1 = (np.where(ascending, f, t) for f, t in zip(from_parts, to_parts))
+    year2, month2, day2 = (np.where(ascending, t, f) for f, t in zip(from_parts, to_parts))
+
+    dayfactor = np.where(
+        day2 == _DAYS_IN_MONTH[_is_leap_year(year2), month2], 0, (day2 < day1).astype(np.int64)
+    )
+
+    return (
+        (((year2 - year1) * 12) + month2 - month1 - dayfactor)
+        * np.where(ascending, 1, -1)
+    )
+
+
+# -----------------------------------------------
+
+
+def nth_weekday(iym: ArrayLike, weekday: ArrayLike, nth: ArrayLike = 1) -> np.ndarray:
+    """
+    Calculates the nth weekday of the months, such as the third friday,
+    or counting back from the end of the month when nth is negative
+
+    :param iym: the months in Ym format
+    :param weekday: the day of the week, Sunday = 0... Saturday = 6
+    :param nth: the weekday of the month, 1 to 4, or -1 to -4 for the last to fourth last
+    :return: the dates in Ymd format
+    """
+
+    weekday = np.asarray(weekday, dtype=np.int64)
+    nth = np.asarray(nth, dtype=np.int64)
+    if np.any((weekday < 0) | (weekday > 6)):
+        raise ValueError('Invalid weekday, expecting 0 to 6')
+    if np.any((nth == 0) | (np.abs(nth) > 4)):
+        raise ValueError('Invalid nth weekday, expecting 1 to 4 or -1 to -4')
+
+    iym = np.asarray(iym, dtype=np.int64)
+    year, month = iym // 100, iym % 100
+    first = (_epoch_from_parts(year, month, 1) - 1) % 7
+    days = _DAYS_IN_MONTH[_is_leap_year(year), month]
+
+    day = np.where(
+        nth > 0,
+        1 + ((weekday - first) % 7) + ((nth - 1) * 7),
+        days - ((first + days - 1 - weekday) % 7) + ((nth + 1) * 7)
+    )
+    return (iym * 100) + day
+
+
+# -----------------------------------------------
+
+
+def nth_weekday_range(from_iym: int, to_iym: int, weekday: int, nth: int = 1) -> np.ndarray:
+    """
+    Calculates the nth weekday of each month, from the from month up to, and including,
+    the to month, such as the third friday of each month
+
+    :param from_iym: the from year month in Ym format
+    :param to_iym: the to year month in Ym format
+    :param weekday: the day of the week, Sunday = 0... Saturday = 6
+    :param nth: the weekday of the month, 1 to 4, or -1 to -4 for the last to fourth last
+    :return: the dates in Ymd format
+    """
+
+    months = np.arange(
+        ((from_iym // 100) * 12) + (from_iym % 100) - 1,
+        ((to_iym // 100) * 12) + (to_iym % 100),
+        dtype=np.int64
+    )
+    return nth_weekday(((months // 12) * 100) + (months % 12) + 1, weekday, nth)
+
+
+# -----------------------------------------------
+
+
+def quarter(iymd: ArrayLike, to_str: bool = True) -> np.ndarray:
+    """
+    Calculates the quarters of dates, returning the quarter end month, or quarter number
+
+    :param iymd: the dates in Ymd or Ym format
+    :param to_str: true returns 2021Q3, otherwise 202103 format
+    :return: str 2021Q1, 2021Q2, 2021Q3, 2021Q4; or int 202103, 202106, 202109, 202112
+    """
+
+    year, month, _ = explode_iymd(iymd)
+    quarter_no = ((month - 1) // 3) + 1
+
+    if to_str:
+        return bucket_labels((year * 10) + quarter_no, 'Q')
+    return (year * 100) + (quarter_no * 3)
+
+
+# -----------------------------------------------
+
+
+def sum_by(keys: ArrayLike, values: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sums the values of each key, such as the period keys from bucket
+
+    :param keys: the keys
+    :param values: the values to sum, of the same shape as the keys
+    :return: tuple of arrays, the distinct keys in order and their sums
+    """
+
+    keys = np.ravel(keys)
+    values = np.ravel(values)
+    if keys.size == 0:
+        return keys, values[:0]
+
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    return keys[starts], np.add.reduceat(values[order], starts)
+
+
+# -----------------------------------------------
+
+
+def truncate(iymd: ArrayLike, unit: str = 'M') -> np.ndarray:
+    """
+    Calculates the first day of the period of each date, such as month starts
+
+    :param iymd: the dates in Ymd format
+    :param unit: W ISO week starting monday, M month, Q quarter, H half year or Y year
+    :return: the first days of the periods in Ymd format
+    """
+
+    year, month, day = explode_iymd(iymd)
+    if unit == 'W':
+        epoch = _epoch_from_parts(year, month, day)
+        return epoch_to_iymd(epoch - ((epoch - 2) % 7))
+
+    months = udc.period_months(unit)
+    return (year * 1_00_00) + ((month - ((month - 1) % months)) * 1_00) + 1
+
+
+# -----------------------------------------------
+
+
+def weekdays_between(
+        from_iymd: ArrayLike,
+        to_iymd: ArrayLike,
+        inclusive: bool = False) -> np.ndarray:
+    """
+    Calculates the number of weekdays between two sets of dates
+
+    :param from_iymd: the from dates in Ymd format
+    :param to_iymd: the to dates in Ymd format
+    :param inclusive: whether to include the to date as a completed day
+    :return: the number of weekdays between the dates
+    """
+
+    from_epoch = epoch_from_iymd(from_iymd)
+    to_epoch = epoch_from_iymd(to_iymd)
+
+    epoch1 = np.minimum(from_epoch, to_epoch)
+    epoch2 = np.maximum(from_epoch, to_epoch)
+
+    ymd1w = (epoch1 - 1) % 7
+    ymd2w = (epoch2 - 1) % 7
+
+    return (
+        (((epoch2 - epoch1) // 7 * 5)
+         + (np.minimum(ymd2w, 5) - np.minimum(ymd1w, 5))
+         + np.where(ymd2w < ymd1w, 5, 0)  # extra_days
+         + (1 if inclusive else 0))       # last_day
+        * np.where(to_epoch < from_epoch, -1, 1)  # positive or negative
+    )
+
+
+# -----------------------------------------------
+
+
+def year_fraction(
+        from_iymd: ArrayLike,
+        to_iymd: ArrayLike,
+        convention: str = uddc.ACT_365F) -> np.ndarray:
+    """
+    Calculates the year fractions between two sets of dates, by the day count convention.
+    See ``daycount.year_fraction``
+
+    :param from_iymd: the from dates in Ymd format
+    :param to_iymd: the to dates in Ymd format
+    :param convention: the day count convention, see ``daycount.CONVENTIONS``
+    :return: the year fractions, negative when the to date is before the from date
+    """
+
+    if convention != uddc.ACT_ACT_ISDA:
+        days = day_count(from_iymd, to_iymd, convention)
+        return days / (365 if convention == uddc.ACT_365F else 360)
+
+    from_parts = explode_iymd(from_iymd)
+    to_parts = explode_iymd(to_iymd)
+
+    return _act_act_isda(
+        _epoch_from_parts(*from_parts), from_parts[0], _epoch_from_parts(*to_parts), to_parts[0]
+    )
+
+
+# -----------------------------------------------
+# End.